@@ -0,0 +1,216 @@
+"""JSON HTTP API for Fortress Athlete Tools (ASGI).
+
+Serves the packing solver, percent tables and unit conversions to display
+boards and tablets without a Streamlit session per screen:
+
+    uvicorn api:app --host 0.0.0.0 --port 8000
+
+Endpoints (GET, query parameters):
+    /health
+    /convert?weight=100&from=lb&to=kg
+    /percent?base=225&unit=lb&rounding=Nearest+1.0[&bar=45][&plates=45:2,25:2|&catalog=iron_lb]
+    /pack?target=225&unit=lb[&bar=45][&prefer_over=1][&plates=...|&catalog=...]
+"""
+
+import argparse
+import json
+import math
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs
+
+from utils.cache import LRUCache
+from utils.catalog import CATALOGS
+from utils.percent import PERCENTAGES, ROUNDING_OPTIONS
+from utils.service import barbell_setup, percent_table
+from utils.units import Weight, convert_weight, get_default_bar_weight, get_default_plates
+
+# Serialized responses keyed by endpoint and canonical parameters
+RESPONSE_CACHE = LRUCache(maxsize=8192)
+
+UNITS = ("lb", "kg")
+
+# Bounds on query input, so one request cannot tie up the solver
+MAX_WEIGHT = 2000
+MAX_PAIRS = 10
+MAX_PLATE_TYPES = 16
+
+
+class BadRequest(ValueError):
+    """Invalid query parameters; reported as HTTP 400."""
+
+
+def _param(params: Dict[str, List[str]], name: str, default=None) -> str:
+    values = params.get(name)
+    if not values:
+        if default is None:
+            raise BadRequest(f"Missing parameter: {name}")
+        return default
+    return values[-1]
+
+
+def _number(params: Dict[str, List[str]], name: str, default=None) -> float:
+    value = _param(params, name, None if default is None else str(default))
+    try:
+        number = float(value)
+    except ValueError:
+        raise BadRequest(f"Parameter {name} must be a number")
+    if not math.isfinite(number):
+        raise BadRequest(f"Parameter {name} must be finite")
+    if abs(number) > MAX_WEIGHT:
+        raise BadRequest(f"Parameter {name} must be at most {MAX_WEIGHT}")
+    return number
+
+
+def _unit(params: Dict[str, List[str]], name: str = "unit") -> str:
+    unit = _param(params, name, "lb")
+    if unit not in UNITS:
+        raise BadRequest(f"Parameter {name} must be one of {', '.join(UNITS)}")
+    return unit
+
+
+def _inventory(params: Dict[str, List[str]], unit: str, per_side: float) -> Tuple[Tuple[Weight, int], ...]:
+    """Canonical inventory from ``plates=45:2,25:2``, ``catalog=<id>`` or the unit default.
+
+    Counts are capped at what ``per_side`` can use (one past it, for going over),
+    like the service's unlimited standard plates.
+    """
+    if "plates" in params:
+        inventory: Dict[Weight, int] = {}
+        items = _param(params, "plates").split(",")
+        if len(items) > MAX_PLATE_TYPES:
+            raise BadRequest(f"Parameter plates allows at most {MAX_PLATE_TYPES} plate types")
+        for item in items:
+            try:
+                weight, count = item.split(":")
+                weight, count = float(weight), int(count)
+            except ValueError:
+                raise BadRequest("Parameter plates must look like 45:2,25:2")
+            if not 0 < weight <= MAX_WEIGHT or not 0 <= count <= MAX_PAIRS:
+                raise BadRequest(f"Parameter plates needs weights up to {MAX_WEIGHT} and up to {MAX_PAIRS} pairs")
+            if Weight.of(weight) != weight:
+                raise BadRequest(f"Parameter plates needs weights in steps of {1 / Weight.STEPS_PER_UNIT} {unit}")
+            inventory[Weight.of(weight)] = count
+    elif "catalog" in params:
+        catalog = CATALOGS.get(_param(params, "catalog"))
+        if catalog is None:
+            raise BadRequest(f"Unknown catalog; choose from {', '.join(CATALOGS)}")
+        if catalog.unit != unit:
+            raise BadRequest(f"Catalog {catalog.id} is in {catalog.unit}, not {unit}")
+        inventory = catalog.to_weights(catalog.default_inventory())
+    else:
+        inventory = get_default_plates(unit)
+    per_side = max(per_side, 0)
+    return tuple(sorted(
+        (weight, min(count, int(per_side // float(weight)) + 1)) for weight, count in inventory.items() if count > 0 and weight
+    ))
+
+
+def _plates_json(plates: List[Tuple[float, int]]) -> List[dict]:
+    return [{"weight": float(weight), "count": count} for weight, count in plates]
+
+
+def convert_endpoint(params: Dict[str, List[str]]) -> dict:
+    weight = _number(params, "weight")
+    from_unit = _unit(params, "from")
+    to_unit = _unit(params, "to")
+    return {"weight": convert_weight(weight, from_unit, to_unit), "unit": to_unit}
+
+
+def percent_endpoint(params: Dict[str, List[str]]) -> dict:
+    base = _number(params, "base")
+    unit = _unit(params)
+    rounding = _param(params, "rounding", "None")
+    if rounding not in ROUNDING_OPTIONS:
+        raise BadRequest(f"Parameter rounding must be one of {', '.join(ROUNDING_OPTIONS)}")
+
+    if "bar" in params or "plates" in params or "catalog" in params:
+        bar = _number(params, "bar", get_default_bar_weight(unit))
+        per_side = (base * max(PERCENTAGES) / 100 - bar) / 2
+        table = percent_table(base, rounding, unit, bar, dict(_inventory(params, unit, per_side)))
+    else:
+        table = percent_table(base, rounding, unit)
+    result = [{"percent": row.percent, "weight": row.weight, "rounded": row.rounded} for row in table.rows]
+    if table.loadings is not None:
+        for entry, loading in zip(result, table.loadings):
+            entry.update(plates=_plates_json(loading.plates), achieved=loading.achieved, delta=loading.delta)
+    return {"unit": unit, "rounding": rounding, "rows": result}
+
+
+def pack_endpoint(params: Dict[str, List[str]]) -> dict:
+    target = _number(params, "target")
+    unit = _unit(params)
+    bar = _number(params, "bar", get_default_bar_weight(unit))
+    prefer_over = _param(params, "prefer_over", "0").lower() in ("1", "true", "yes")
+    inventory = dict(_inventory(params, unit, (target - bar) / 2))
+    setup = barbell_setup(target, bar, inventory, prefer_over=prefer_over, unit=unit)
+    return {
+        "unit": unit,
+        "target": target,
+        "bar": bar,
+        "plates_per_side": _plates_json(setup.plates),
+        "achieved": setup.achieved_total,
+        "delta": setup.delta_total
+    }
+
+
+ROUTES = {
+    "/health": lambda params: {"status": "ok"},
+    "/convert": convert_endpoint,
+    "/percent": percent_endpoint,
+    "/pack": pack_endpoint,
+}
+
+
+def handle(path: str, query_string: bytes) -> Tuple[int, bytes]:
+    """Route one GET request to ``(status, JSON body)``; successful bodies are cached."""
+    endpoint = ROUTES.get(path.rstrip("/") or "/")
+    if endpoint is None:
+        return 404, b'{"error": "Not found"}'
+    params = parse_qs(query_string.decode("latin-1"))
+    key = (path, tuple(sorted((name, tuple(values)) for name, values in params.items())))
+    try:
+        return 200, RESPONSE_CACHE.get_or_compute(key, lambda: json.dumps(endpoint(params)).encode("utf-8"))
+    except (ArithmeticError, ValueError) as e:
+        # BadRequest, or numbers the solver cannot represent
+        return 400, json.dumps({"error": str(e)}).encode("utf-8")
+
+
+async def app(scope, receive, send):
+    """ASGI entry point."""
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    if scope["type"] != "http":
+        return
+
+    if scope["method"] not in ("GET", "HEAD"):
+        status, body = 405, b'{"error": "Method not allowed"}'
+    else:
+        status, body = handle(scope["path"], scope.get("query_string", b""))
+
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"access-control-allow-origin", b"*"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Fortress Athlete Tools JSON API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+
+    args = parser.parse_args()
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -1,15 +1,12 @@
 """Fortress Athlete Tools - Main Application"""
 
 import streamlit as st
-import pandas as pd
 from streamlit_theme import inject_theme
-from utils.branding import display_logo_and_title, apply_mobile_styles
-from utils.units import get_default_bar_weight, get_default_plates, convert_weight, format_weight, round_weight
-from utils.plates import (
-    PLATE_WEIGHTS, PLATE_COLORS, calculate_total_weight, 
-    calculate_per_side_weight, format_per_side_breakdown, 
-    generate_barbell_visualization
-)
+from utils.branding import display_logo_and_title
+from utils.percent_component import percent_table
+from utils import payload
+from utils.profiling import show_debug_panel, start_run
+from utils.plates import PLATE_WEIGHTS, calculate_total_weight, render_loadout
 
 # Configure page
 st.set_page_config(
@@ -19,9 +16,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Apply styling
-inject_theme()
-apply_mobile_styles()
+# Opt-in phase timings (FORTRESS_PROFILE=1 or ?profile=1)
+profiler = start_run("app")
+payload.start_page("app")
+
+# Apply styling (theme and mobile CSS share one cached stylesheet)
+with profiler.phase("inject_theme"):
+    inject_theme()
 
 # Initialize session state for navigation
 if 'page' not in st.session_state:
@@ -29,7 +30,8 @@ if 'page' not in st.session_state:
 
 def show_home_page():
     """Display the home page with navigation buttons."""
-    display_logo_and_title()
+    with profiler.phase("display_logo_and_title"):
+        display_logo_and_title()
     st.markdown("---")
     
     # Navigation buttons
@@ -63,36 +65,6 @@ def apply_rounding(value, direction, increment):
     else:  # Nearest
         return round(value / increment) * increment
 
-def calculate_barbell_setup(target_weight, bar_weight, unit="lb"):
-    """Calculate plate setup for a barbell."""
-    plates_available = [45, 35, 25, 10, 5, 2.5]  # Available plate weights
-    
-    if target_weight <= bar_weight:
-        return [], 0, "Target weight is less than or equal to bar weight"
-    
-    plate_weight_needed = target_weight - bar_weight
-    per_side_weight = plate_weight_needed / 2
-    
-    plates_used = []
-    remaining_weight = per_side_weight
-    
-    for plate in plates_available:
-        if remaining_weight >= plate:
-            count = int(remaining_weight / plate)
-            if count > 0:
-                plates_used.append((plate, count))
-                remaining_weight -= plate * count
-    
-    achieved_per_side = sum(plate * count for plate, count in plates_used)
-    achieved_total = bar_weight + (achieved_per_side * 2)
-    
-    if remaining_weight > 0.1:  # Small tolerance for floating point
-        status = f"Closest achievable: {achieved_total:.1f} {unit}"
-    else:
-        status = "Exact match"
-    
-    return plates_used, achieved_total, status
-
 def format_barbell_pairs(plates_used):
     """Format plate pairs for vertical display."""
     if not plates_used:
@@ -108,183 +80,81 @@ def format_barbell_pairs(plates_used):
 
 def show_percent_calculator():
     """Display the percent calculator page."""
-    st.markdown("""
-    <div style="max-width: 768px; margin: 0 auto; padding: 2rem 1rem;">
-        <!-- Back link -->
-        <div style="margin-bottom: 1rem;">
-            <a href="#" onclick="window.parent.postMessage({type: 'streamlit:setComponentValue', value: 'home'}, '*')" class="back-link">
-                <svg viewBox="0 0 20 20" fill="currentColor" aria-hidden="true">
-                    <path d="M12.293 16.293a1 1 0 010 1.414l-6-6a1 1 0 010-1.414l6-6a1 1 0 111.414 1.414L8.414 10l5.293 5.293a1 1 0 01-1.414 1.414z"/>
-                </svg>
-                Back to Tools
-            </a>
-        </div>
-
-        <!-- Title -->
-        <h1 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 0.25rem;">Percent Calculator</h1>
-        <p style="font-size: 0.875rem; color: var(--muted); margin-bottom: 1.5rem;">Compute plate percentages quickly.</p>
-
-        <!-- Form -->
-        <div class="percent-form" style="margin-bottom: 2rem;">
-            <div>
-                <label style="display: block; font-size: 0.875rem; font-weight: 500; margin-bottom: 0.25rem;">Base weight</label>
-                <div class="input-group" id="baseWeightGroup">
-                    <button type="button" id="dec" aria-label="decrease">−</button>
-                    <input id="baseWeight" type="number" step="0.5" value="100" style="text-align: center;">
-                    <button type="button" id="inc" aria-label="increase">+</button>
-                </div>
-            </div>
-
-            <div>
-                <label style="display: block; font-size: 0.875rem; font-weight: 500; margin-bottom: 0.25rem;">Unit</label>
-                <select id="unit" style="width: 100%; padding: 8px 12px; border: 1px solid var(--border); border-radius: 12px; background: white;">
-                    <option value="lb">lb</option>
-                    <option value="kg">kg</option>
-                </select>
-            </div>
-
-            <div>
-                <label style="display: block; font-size: 0.875rem; font-weight: 500; margin-bottom: 0.25rem;">Rounding</label>
-                <select id="rounding" style="width: 100%; padding: 8px 12px; border: 1px solid var(--border); border-radius: 12px; background: white;">
-                    <option value="none">None</option>
-                    <option value="2.5">2.5</option>
-                    <option value="5">5</option>
-                </select>
-            </div>
-        </div>
-
-        <!-- Results -->
-        <section>
-            <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 0.5rem;">
-                <h2 style="font-size: 1.125rem; font-weight: 600;">Results</h2>
-                <button id="copyBtn" type="button" class="btn-ghost">Copy table</button>
-            </div>
-
-            <div style="overflow-x: auto; border-radius: 12px; border: 1px solid var(--border);">
-                <table id="resultsTable" class="results-table">
-                    <thead>
-                        <tr>
-                            <th>Percent</th>
-                            <th style="text-align: right;">Weight</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <!-- Rows injected by JS -->
-                    </tbody>
-                </table>
-            </div>
-        </section>
-    </div>
-
-    <script>
-    (function () {
-        const w = document.getElementById('baseWeight');
-        const unit = document.getElementById('unit');
-        const rounding = document.getElementById('rounding');
-        const inc = document.getElementById('inc');
-        const dec = document.getElementById('dec');
-        const body = document.querySelector('#resultsTable tbody');
-        const copyBtn = document.getElementById('copyBtn');
-
-        function roundTo(val, step) {
-            if (!step || step === 'none') return val;
-            const s = parseFloat(step);
-            return Math.round(val / s) * s;
-        }
-
-        function fmt(val) {
-            return `${val} ${unit.value}`;
-        }
-
-        function render() {
-            const base = parseFloat(w.value || '0');
-            const steps = Array.from({length: 21}, (_, i) => i * 5); // 0..100 by 5s
-            body.innerHTML = steps.map(p => {
-                const raw = (base * p) / 100;
-                const r = roundTo(raw, rounding.value);
-                const v = Number.isFinite(r) ? r.toFixed(1) : '0.0';
-                return `<tr>
-                          <td>${p}%</td>
-                          <td style="text-align: right;">${v} ${unit.value}</td>
-                        </tr>`;
-            }).join('');
-        }
-
-        inc?.addEventListener('click', () => { w.stepUp(); render(); });
-        dec?.addEventListener('click', () => { w.stepDown(); render(); });
-        [w, unit, rounding].forEach(el => el?.addEventListener('input', render));
-        render();
-
-        copyBtn?.addEventListener('click', () => {
-            const rows = [['Percent','Weight']].concat(
-                [...body.querySelectorAll('tr')].map(tr => {
-                    const tds = tr.querySelectorAll('td');
-                    return [tds[0].textContent.trim(), tds[1].textContent.trim()];
-                })
-            );
-            const tsv = rows.map(r => r.join('\\t')).join('\\n');
-            navigator.clipboard.writeText(tsv);
-            copyBtn.textContent = 'Copied!';
-            setTimeout(() => copyBtn.textContent = 'Copy table', 1200);
-        });
-    })();
-    </script>
-    """, unsafe_allow_html=True)
+    st.markdown("## Percent Calculator")
+    st.caption("Compute plate percentages quickly.")
+    
+    # Table renders in the browser; only the committed base weight comes back
+    with profiler.phase("rendering"):
+        result = percent_table(
+            st.session_state.get('percent_base_weight', 100.0),
+            st.session_state.get('percent_unit', "lb"),
+            key="percent_table"
+        )
+    st.session_state.percent_base_weight = result["base_weight"]
+    st.session_state.percent_unit = result["unit"]
     
     # Back button functionality
     if st.button("← Back to Tools", key="back_btn", help="Return to main tools"):
         st.session_state.page = 'home'
         st.rerun()
 
-def show_barbell_calculator():
-    """Display the tap-to-build barbell calculator page."""
-    display_logo_and_title()
-    
-    # Back button
-    if st.button("← Back to Tools", use_container_width=True):
-        st.session_state.page = 'home'
-        st.rerun()
-    
-    st.markdown("## Barbell Calculator")
-    
-    # Initialize session state for tap-to-build
-    if 'bar_weight' not in st.session_state:
-        st.session_state.bar_weight = 45
-    if 'pair_counts' not in st.session_state:
-        st.session_state.pair_counts = {weight: 0 for weight in PLATE_WEIGHTS}
+def _select_bar(bar_weight):
+    """Button callback: choose the bar."""
+    st.session_state.bar_weight = bar_weight
+
+def _add_pair(weight):
+    """Button callback: add one pair of plates."""
+    st.session_state.pair_counts[weight] += 1
+
+def _clear_bar():
+    """Button callback: reset all plate counts but keep bar selection."""
+    for weight in PLATE_WEIGHTS:
+        st.session_state.pair_counts[weight] = 0
+
+@st.fragment
+def barbell_builder():
+    """Tap-to-build controls and display.
+
+    Runs as a fragment: taps, "Clear Bar" and bar selection rerun only this
+    function, not the whole script (theme, logo, navigation). State changes
+    happen in button callbacks, before the fragment reruns. Its timings are
+    recorded separately as "app:barbell_builder".
+    """
+    fragment_profiler = start_run("app:barbell_builder")
+    payload.start_page("app:barbell_builder")
     
     # Bar selection buttons
     st.markdown("### Bar Selection")
     bar_col1, bar_col2 = st.columns([1, 1])
     
     with bar_col1:
-        if st.button("45 lb Bar", 
-                    use_container_width=True,
-                    type="primary" if st.session_state.bar_weight == 45 else "secondary"):
-            st.session_state.bar_weight = 45
-            st.rerun()
+        st.button("45 lb Bar", 
+                  use_container_width=True,
+                  type="primary" if st.session_state.bar_weight == 45 else "secondary",
+                  on_click=_select_bar, args=(45,))
     
     with bar_col2:
-        if st.button("35 lb Bar", 
-                    use_container_width=True,
-                    type="primary" if st.session_state.bar_weight == 35 else "secondary"):
-            st.session_state.bar_weight = 35
-            st.rerun()
+        st.button("35 lb Bar", 
+                  use_container_width=True,
+                  type="primary" if st.session_state.bar_weight == 35 else "secondary",
+                  on_click=_select_bar, args=(35,))
     
     # Calculate totals
-    total_weight = calculate_total_weight(st.session_state.bar_weight, st.session_state.pair_counts)
-    
-    # Barbell visualization with weight display above it
-    barbell_html = generate_barbell_visualization(st.session_state.bar_weight, st.session_state.pair_counts)
-    
-    # Combine weight display and barbell visualization
-    combined_html = f'''
-    <div style="text-align: center; margin: 1rem 0;">
-        <div class="weight-display" style="margin-bottom: 0.5rem;">{total_weight:.0f} lbs</div>
-        {barbell_html}
-    </div>
-    '''
-    st.markdown(combined_html, unsafe_allow_html=True)
+    with fragment_profiler.phase("computation"):
+        total_weight = calculate_total_weight(st.session_state.bar_weight, st.session_state.pair_counts)
+    
+    with fragment_profiler.phase("rendering"):
+        # Barbell visualization with weight display above it
+        barbell_html, _ = render_loadout(st.session_state.bar_weight, st.session_state.pair_counts)
+        
+        # Combine weight display and barbell visualization
+        combined_html = f'''
+        <div style="text-align: center; margin: 1rem 0;">
+            <div class="weight-display" style="margin-bottom: 0.5rem;">{total_weight:.0f} lbs</div>
+            {barbell_html}
+        </div>
+        '''
+        payload.markdown("plates", combined_html, unsafe_allow_html=True)
     
     # Plate buttons grid
     st.markdown("### Add Weights")
@@ -295,30 +165,41 @@ def show_barbell_calculator():
     for i, weight in enumerate(PLATE_WEIGHTS):
         col_idx = i % 4
         with plate_cols[col_idx]:
-            color = PLATE_COLORS[weight]
             current_count = st.session_state.pair_counts[weight]
             
-            # Plate button with color
-            weight_str = f"{int(weight)}" if weight == int(weight) else f"{weight}"
-            
-            if st.button(f"{weight_str} lb", 
-                        use_container_width=True,
-                        key=f"plate_{weight}"):
-                st.session_state.pair_counts[weight] += 1
-                st.rerun()
+            st.button(f"{weight} lb", 
+                      use_container_width=True,
+                      key=f"plate_{weight}",
+                      on_click=_add_pair, args=(weight,))
             
             # Show current count only
-            if current_count > 0:
-                st.write(f"Pairs: {current_count}")
-            else:
-                st.write("Pairs: 0")
+            st.write(f"Pairs: {current_count}")
     
     # Clear bar button
-    if st.button("Clear Bar", use_container_width=True, type="secondary"):
-        # Reset all plate counts but keep bar selection
-        for weight in PLATE_WEIGHTS:
-            st.session_state.pair_counts[weight] = 0
+    st.button("Clear Bar", use_container_width=True, type="secondary", on_click=_clear_bar)
+    
+    payload.finish_page()
+    fragment_profiler.finish()
+
+def show_barbell_calculator():
+    """Display the tap-to-build barbell calculator page."""
+    with profiler.phase("display_logo_and_title"):
+        display_logo_and_title()
+    
+    # Back button
+    if st.button("← Back to Tools", use_container_width=True):
+        st.session_state.page = 'home'
         st.rerun()
+    
+    st.markdown("## Barbell Calculator")
+    
+    # Initialize session state for tap-to-build
+    if 'bar_weight' not in st.session_state:
+        st.session_state.bar_weight = 45
+    if 'pair_counts' not in st.session_state:
+        st.session_state.pair_counts = {weight: 0 for weight in PLATE_WEIGHTS}
+    
+    barbell_builder()
 
 # Navigation logic
 if st.session_state.page == 'percent':
@@ -327,3 +208,6 @@ elif st.session_state.page == 'barbell':
     show_barbell_calculator()
 else:
     show_home_page()
+
+payload.finish_page()
+show_debug_panel(profiler)
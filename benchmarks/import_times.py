@@ -0,0 +1,96 @@
+"""Import-time report for Fortress Athlete Tools entry points.
+
+Imports each module in a fresh interpreter under ``python -X importtime`` and
+reports its cumulative import cost plus the heaviest packages it pulled in,
+so cold-start regressions (for example pandas creeping back in) show up:
+
+    python -m benchmarks.import_times
+    python -m benchmarks.import_times --output imports.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules loaded when the app and tools start, plus heavy packages for reference
+MODULES = [
+    "streamlit",
+    "utils.plates",
+    "utils.percent",
+    "utils.branding",
+    "utils.chart",
+    "api",
+    "generate_loadings",
+    "pandas",
+]
+
+
+class ImportReport(NamedTuple):
+    """Cold import cost of one module."""
+    module: str
+    ok: bool
+    total_ms: float
+    heaviest: Dict[str, float]
+    error: str
+
+
+def parse_importtime(stderr: str) -> List[tuple]:
+    """``(name, depth, self_us, cumulative_us)`` for each ``-X importtime`` line."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure_import(module: str, top: int = 5) -> ImportReport:
+    """Import ``module`` in a fresh interpreter and summarize the cost."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    entries = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed"
+        return ImportReport(module, False, 0.0, {}, error)
+
+    # Interpreter startup ends with ``site``; everything after it is the import itself
+    start = max((i + 1 for i, (name, depth, _, _) in enumerate(entries) if name == "site" and depth == 0), default=0)
+    entries = entries[start:]
+    total = sum(cumulative for _, depth, _, cumulative in entries if depth == 0)
+    # Top-level packages imported directly or transitively, by cumulative cost
+    packages: Dict[str, int] = {}
+    for name, _, _, cumulative in entries:
+        package = name.split(".")[0]
+        if "." not in name and package != module.split(".")[0]:
+            packages[package] = max(packages.get(package, 0), cumulative)
+    heaviest = sorted(packages.items(), key=lambda item: -item[1])[:top]
+    return ImportReport(module, True, total / 1000, {name: us / 1000 for name, us in heaviest}, "")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report cold import times")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to import (default: app entry points)")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest dependencies to list per module")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+
+    args = parser.parse_args()
+    reports = [measure_import(module, args.top) for module in args.modules]
+    for report in reports:
+        if not report.ok:
+            print(f"{report.module:<20} {'n/a':>10}  ({report.error})")
+            continue
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in report.heaviest.items())
+        print(f"{report.module:<20} {report.total_ms:>8.1f} ms  {heaviest}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps([r._asdict() for r in reports], indent=2), encoding="utf-8")
+        print(f"Report saved to {args.output}")
@@ -0,0 +1,321 @@
+"""Performance benchmarks for Fortress Athlete Tools.
+
+Covers the packing solver across inventory sizes, percent table generation,
+barbell rendering and (when Streamlit is installed) end-to-end script runs
+through Streamlit's AppTest harness. Reports latency percentiles and
+allocations, and saves JSON so runs can be compared between commits:
+
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --compare bench.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from utils import plates
+from utils import flight, ladder, mixed
+from utils.catalog import CATALOGS, DEFAULT_SLEEVE_LENGTH_MM
+from utils.percent import loadings_for_totals, percent_rows
+from utils.units import get_default_plates
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Inventories of increasing size for the solver benchmarks
+INVENTORIES = {
+    "default_lb": get_default_plates("lb"),
+    "change_kg": CATALOGS["bumper_change_kg"].to_weights(CATALOGS["bumper_change_kg"].default_inventory()),
+    "full_gym_lb": {45: 10, 35: 4, 25: 6, 15: 4, 10: 6, 5: 6, 2.5: 4, 1: 4, 0.5: 2, 0.25: 2},
+}
+
+LOADOUT = {45: 3, 25: 1, 10: 1, 5: 1, 2.5: 1}
+
+# Hard p50 ceilings in microseconds, checked on every run. A cold sleeve-fit
+# build with 10+ plate types stays under 5 ms up to 4 pairs each. Build time
+# grows with pairs (reachable totals times pairs per stage), so 10 pairs each
+# gets its own 15 ms ceiling. A cold ladder at the widest allowed miss and a
+# 40-attempt meet flight, both with 8 pairs a plate, must stay interactive too.
+BUDGETS = {
+    "solver.build_fit.iron_change_lb": 5000,
+    "solver.build_fit.bumper_change_kg": 5000,
+    "solver.build_fit.thirteen_types_kg": 5000,
+    "solver.build_fit_10.iron_change_lb": 15000,
+    "solver.build_fit_10.bumper_change_kg": 15000,
+    "percent.ladder_wide.iron_change_lb": 50000,
+    "percent.ladder_wide.bumper_change_kg": 50000,
+    "solver.flight_meet.iron_lb": 100000,
+    "solver.flight_meet.bumper_kg": 100000,
+}
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(fn: Callable[[], object], repeat: int = 200, warmup: int = 5, setup: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """Time ``fn`` and count its allocations.
+
+    Latencies are in microseconds. ``allocated_blocks`` and ``peak_kib`` come
+    from one extra traced call: blocks still allocated afterwards and peak
+    traced memory during the call.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup:
+                setup()
+            start = time.perf_counter_ns()
+            fn()
+            samples.append((time.perf_counter_ns() - start) / 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "runs": repeat,
+        "p50_us": _percentile(samples, 50),
+        "p90_us": _percentile(samples, 90),
+        "p99_us": _percentile(samples, 99),
+        "mean_us": statistics.fmean(samples),
+        "allocated_blocks": blocks,
+        "peak_kib": peak / 1024,
+    }
+
+
+def _clear_solver_caches():
+    plates._cached_index.cache_clear()
+    plates._index_for_items.cache_clear()
+    plates._fitted_index_for_items.cache_clear()
+
+
+def _clear_ladder_caches():
+    _clear_solver_caches()
+    ladder.solve_stacks.cache_clear()
+
+
+def solver_benchmarks(results: Dict[str, dict]):
+    """Index build (cold) and lookups (warm) per inventory."""
+    targets = [i * 2.5 + 0.3 for i in range(120)]
+    for name, inventory in INVENTORIES.items():
+        results[f"solver.build.{name}"] = measure(
+            lambda: plates.get_plate_index(inventory), repeat=30, warmup=1, setup=_clear_solver_caches
+        )
+        results[f"solver.pack.{name}"] = measure(lambda: [plates.pack_plates(t, inventory) for t in targets])
+        results[f"solver.batch.{name}"] = measure(lambda: plates.pack_plates_batch(targets, inventory))
+
+    # Sleeve-constrained builds, with each catalog's physical plate thickness,
+    # at 4 pairs a plate and at a well-stocked gym's 10
+    for catalog in CATALOGS.values():
+        for pairs, name in [(4, "build_fit"), (10, "build_fit_10")]:
+            inventory = catalog.to_weights({plate.id: pairs for plate in catalog.plates})
+            results[f"solver.{name}.{catalog.id}"] = measure(
+                lambda: plates.get_plate_index(inventory, DEFAULT_SLEEVE_LENGTH_MM, catalog.thickness()),
+                repeat=30, warmup=1, setup=_clear_solver_caches
+            )
+    # Every bumper and change plate plus 0.75 kg discs: 13 types
+    catalog = CATALOGS["bumper_change_kg"]
+    thickness = {**catalog.thickness(), 0.75: 9}
+    inventory = {weight: 4 for weight in thickness}
+    results["solver.build_fit.thirteen_types_kg"] = measure(
+        lambda: plates.get_plate_index(inventory, DEFAULT_SLEEVE_LENGTH_MM, thickness),
+        repeat=30, warmup=1, setup=_clear_solver_caches
+    )
+
+    # Mixed lb + kg inventory: cold build (per-unit tables included), then lookups
+    lb, kg = CATALOGS["iron_change_lb"], CATALOGS["bumper_change_kg"]
+    mixed_inventory = {**lb.to_mixed(lb.default_inventory()), **kg.to_mixed(kg.default_inventory())}
+
+    def clear_mixed_caches():
+        _clear_solver_caches()
+        mixed._cached_mixed_index.cache_clear()
+        mixed._mixed_index_for_items.cache_clear()
+
+    results["solver.build_mixed"] = measure(
+        lambda: mixed.get_mixed_index(mixed_inventory), repeat=30, warmup=1, setup=clear_mixed_caches
+    )
+    results["solver.pack_mixed"] = measure(lambda: [mixed.pack_mixed(t, mixed_inventory) for t in targets])
+
+    # A 40-attempt meet flight (cold), ascending 60-180 kg
+    attempts = [flight.Attempt(str(i), 60 + (i * 37) % 121) for i in range(40)]
+    catalog = CATALOGS["bumper_change_kg"]
+    inventory = catalog.to_weights(catalog.default_inventory())
+    results["solver.flight.bumper_change_kg"] = measure(
+        lambda: flight.loading_sheet(attempts, 20, inventory, 5),
+        repeat=30, warmup=1, setup=ladder.solve_stacks.cache_clear
+    )
+
+    # Meet-sized trees of 8 pairs a plate, with attempts off the plate grid
+    # (a 0.3 or 1.1 step) that force the closest-under fallback
+    for catalog_id, bar_weight, lightest in [("iron_lb", 45, 135), ("bumper_kg", 20, 60)]:
+        catalog = CATALOGS[catalog_id]
+        inventory = catalog.to_weights({plate.id: 8 for plate in catalog.plates})
+        attempts = [
+            flight.Attempt(str(i), lightest + (i * 37) % (lightest * 3) + (0.3, 0, 1.1, 0.5)[i % 4]) for i in range(40)
+        ]
+        results[f"solver.flight_meet.{catalog_id}"] = measure(
+            lambda: flight.loading_sheet(attempts, bar_weight, inventory, 5 if catalog.unit == "lb" else 2.5),
+            repeat=10, warmup=1, setup=_clear_ladder_caches
+        )
+
+
+def percent_benchmarks(results: Dict[str, dict]):
+    """The Percent Calculator's 21-row table, with and without loadings."""
+    inventory = get_default_plates("lb")
+    results["percent.rows"] = measure(lambda: percent_rows(315.0, "Nearest 1.0", "lb"), repeat=1000)
+    results["percent.rows_with_loadings"] = measure(
+        lambda: loadings_for_totals([row.rounded for row in percent_rows(315.0, "Nearest 1.0", "lb")], 45, inventory),
+        repeat=1000
+    )
+
+    # Warm-up ladder solves (cold), as recomputed live when the top set changes
+    for catalog in CATALOGS.values():
+        top_set, bar_weight = (315.0, 45.0) if catalog.unit == "lb" else (140.0, 20.0)
+        inventory = catalog.to_weights(catalog.default_inventory())
+        results[f"percent.ladder.{catalog.id}"] = measure(
+            lambda: ladder.warmup_ladder(top_set, bar_weight, inventory, unit=catalog.unit),
+            repeat=30, warmup=1, setup=ladder.solve_stacks.cache_clear
+        )
+        # The widest miss the page allows, with a meet-sized tree of 8 pairs a plate
+        deep = catalog.to_weights({plate.id: 8 for plate in catalog.plates})
+        results[f"percent.ladder_wide.{catalog.id}"] = measure(
+            lambda: ladder.warmup_ladder(top_set, bar_weight, deep, tolerance=ladder.MAX_TOLERANCE[catalog.unit], unit=catalog.unit),
+            repeat=10, warmup=1, setup=_clear_ladder_caches
+        )
+
+
+def render_benchmarks(results: Dict[str, dict]):
+    """Barbell rendering: inline HTML, SVG and the memoized path."""
+    results["render.html"] = measure(lambda: plates.generate_barbell_visualization(45, LOADOUT), repeat=1000)
+    results["render.svg"] = measure(lambda: plates.generate_barbell_svg(45, LOADOUT), repeat=1000)
+    results["render.cached"] = measure(lambda: plates.render_loadout(45, LOADOUT), repeat=1000)
+
+
+def app_benchmarks(results: Dict[str, dict]):
+    """Full script runs through Streamlit's AppTest harness (skipped without Streamlit)."""
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        print("Streamlit not installed; skipping AppTest benchmarks", file=sys.stderr)
+        return
+
+    scripts = {
+        "app.home": "app.py",
+        "page.percent": "pages/1_Percent_Calculator.py",
+        "page.barbell": "pages/2_Barbell_Calculator.py",
+    }
+    for name, script in scripts.items():
+        results[f"rerun.{name}"] = measure(
+            lambda: AppTest.from_file(str(ROOT / script), default_timeout=30).run(), repeat=10, warmup=1
+        )
+
+    # One plate tap in the tap-to-build view (a fragment rerun)
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=30)
+    at.session_state["page"] = "barbell"
+    at.run()
+    results["rerun.app.barbell_tap"] = measure(lambda: at.button(key="plate_45").click().run(), repeat=20, warmup=2)
+
+
+SUITES = {
+    "solver": solver_benchmarks,
+    "percent": percent_benchmarks,
+    "render": render_benchmarks,
+    "app": app_benchmarks,
+}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Names whose p50 regressed by more than ``threshold`` (a ratio) against the baseline."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous["p50_us"]:
+            continue
+        ratio = current["p50_us"] / previous["p50_us"]
+        marker = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:<36} {previous['p50_us']:>12.1f} -> {current['p50_us']:>12.1f} us  x{ratio:.2f}{marker}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def over_budget(results: Dict[str, dict]) -> List[str]:
+    """Names whose p50 exceeds their entry in :data:`BUDGETS`."""
+    over = [name for name, budget in BUDGETS.items() if name in results and results[name]["p50_us"] > budget]
+    for name in over:
+        print(f"{name:<36} p50 {results[name]['p50_us']:.1f} us  OVER BUDGET ({BUDGETS[name]} us)")
+    return over
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Fortress Athlete Tools benchmarks")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES), help="Suites to run (default: all)")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="p50 ratio that counts as a regression")
+
+    args = parser.parse_args()
+    results: Dict[str, dict] = {}
+    for suite in args.suite or list(SUITES):
+        SUITES[suite](results)
+
+    print(f"{'benchmark':<36} {'p50 us':>10} {'p99 us':>10} {'blocks':>8} {'peak KiB':>9}")
+    for name, stats in results.items():
+        print(f"{name:<36} {stats['p50_us']:>10.1f} {stats['p99_us']:>10.1f} {stats['allocated_blocks']:>8} {stats['peak_kib']:>9.1f}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to {args.output}")
+
+    failed = bool(over_budget(results))
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        failed = bool(compare(results, baseline, args.threshold)) or failed
+    if failed:
+        sys.exit(1)
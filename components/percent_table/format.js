@@ -0,0 +1,28 @@
+// Rounding and display rules shared with utils.units (checked by tests/test_percent.py under node)
+(function (exports) {
+  // Halves go to the even multiple, like Python's round() in utils.units.round_weight
+  function roundHalfEven(x) {
+    const floor = Math.floor(x);
+    if (x - floor !== 0.5) return Math.round(x);
+    return floor % 2 === 0 ? floor : floor + 1;
+  }
+
+  function roundTo(val, step) {
+    return step > 0 ? roundHalfEven(val / step) * step : val;
+  }
+
+  // Up to two decimals without trailing zeros, like utils.units.format_weight.
+  // toFixed rounds exact ties (odd eighths such as 0.125) away from zero, Python to even.
+  function formatNumber(val) {
+    let text = val.toFixed(2);
+    if (Number.isInteger(val * 8) && !Number.isInteger(val * 4)) {
+      const cents = Math.floor(val * 100);
+      text = ((cents % 2 === 0 ? cents : cents + 1) / 100).toFixed(2);
+    }
+    text = text.replace(/\.?0+$/, '');
+    return text === '-0' ? '0' : text;
+  }
+
+  exports.roundTo = roundTo;
+  exports.formatNumber = formatNumber;
+})(typeof module !== 'undefined' ? module.exports : (window.percentFormat = {}));
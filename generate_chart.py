@@ -0,0 +1,49 @@
+"""Printable loading chart generator for Fortress Athlete Tools.
+
+Lists every total from the bar weight up to 700 lb (or 320 kg) in fixed
+steps with per-side plates, for laminating at each platform.
+"""
+
+import argparse
+import sys
+
+from utils.catalog import CATALOGS, get_default_catalog
+from utils.chart import chart_csv, chart_html, chart_pdf, loading_chart, platform_inventory, DEFAULT_MAX_TOTAL
+from utils.units import get_default_bar_weight
+
+
+def generate_chart(unit: str, bar_weight: float, catalog_id: str = None, step: float = None,
+                   max_total: float = None, fmt: str = "html") -> bytes:
+    """Build a chart for one catalog and bar, rendered as HTML, CSV or PDF bytes."""
+    catalog = CATALOGS[catalog_id] if catalog_id else get_default_catalog(unit)
+    max_total = max_total or DEFAULT_MAX_TOTAL[catalog.unit]
+    inventory = platform_inventory(catalog.to_weights(catalog.default_inventory()), bar_weight, max_total)
+    rows = loading_chart(bar_weight, inventory, catalog.unit, step, max_total)
+    title = f"{catalog.name} - {bar_weight:g} {catalog.unit} bar"
+    if fmt == "csv":
+        return chart_csv(rows, catalog.unit).encode("utf-8")
+    if fmt == "pdf":
+        return chart_pdf(rows, catalog.unit, title)
+    return chart_html(rows, catalog.unit, title).encode("utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a printable loading chart")
+    parser.add_argument("--unit", choices=["lb", "kg"], default="lb", help="Unit when no catalog is given")
+    parser.add_argument("--catalog", choices=sorted(CATALOGS), help="Plate catalog (default: the unit's default set)")
+    parser.add_argument("--bar", type=float, help="Bar weight (default: 45 lb / 20 kg)")
+    parser.add_argument("--step", type=float, help="Spacing between totals (default: 5 lb / 2.5 kg)")
+    parser.add_argument("--max", type=float, dest="max_total", help="Heaviest total (default: 700 lb / 320 kg)")
+    parser.add_argument("--format", choices=["html", "csv", "pdf"], default="html", help="Output format")
+    parser.add_argument("--output", default="-", help="Output path (default: stdout)")
+
+    args = parser.parse_args()
+    unit = CATALOGS[args.catalog].unit if args.catalog else args.unit
+    bar_weight = args.bar if args.bar is not None else get_default_bar_weight(unit)
+    content = generate_chart(unit, bar_weight, args.catalog, args.step, args.max_total, args.format)
+    if args.output == "-":
+        sys.stdout.buffer.write(content)
+    else:
+        with open(args.output, "wb") as f:
+            f.write(content)
+        print(f"Chart saved to {args.output}")
@@ -0,0 +1,203 @@
+"""Bulk loading chart generator for Fortress Athlete Tools.
+
+Streams a program CSV (one athlete row with a 1RM, a unit and a list of
+percentages) through the percent and packing logic and writes one line per
+set as CSV or JSONL. Rows are processed one at a time, so the input size is
+not limited by memory.
+
+Input columns: athlete, one_rm (or 1rm), unit, percentages ("50;60;70").
+A row that cannot be computed is written with its message in the ``error``
+column and the stream carries on.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from functools import lru_cache, partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.catalog import CATALOGS
+from utils.percent import ROUNDING_OPTIONS, loadings_from_index, percent_rows
+from utils.plates import FrozenInventory, freeze_inventory, get_plate_index
+from utils.units import get_default_bar_weight, get_default_plates
+
+OUTPUT_FIELDS = ["athlete", "set", "percent", "weight", "rounded", "achieved", "delta", "unit", "error", "plates"]
+
+UNITS = ("lb", "kg")
+
+# Plates per unit, as (unit, frozen inventory) pairs so they pickle into worker processes
+Inventories = Tuple[Tuple[str, FrozenInventory], ...]
+
+
+def parse_percentages(value: str) -> List[float]:
+    """Parse a percentage list such as "50;60;70" or "50 60 70%"."""
+    items = value.replace(",", ";").replace(" ", ";").replace("%", "").split(";")
+    return [float(item) for item in items if item]
+
+
+def parse_plates(value: str) -> Dict[float, int]:
+    """Parse an inventory such as "45:2,25:2" (plate weight: pairs)."""
+    inventory = {}
+    for item in value.split(","):
+        weight, count = item.split(":")
+        inventory[float(weight)] = int(count)
+    return inventory
+
+
+def _inventory(unit: str, inventories: Optional[Inventories]) -> FrozenInventory:
+    return dict(inventories or ()).get(unit) or freeze_inventory(get_default_plates(unit))
+
+
+@lru_cache(maxsize=65536)
+def _loading(
+    unit: str,
+    total: float,
+    prefer_over: bool,
+    bar_weight: float,
+    inventory: FrozenInventory
+) -> Tuple[Tuple[Tuple[float, int], ...], float, float]:
+    """Plates, achieved and delta for one set total; programs repeat totals constantly."""
+    loading = loadings_from_index(get_plate_index(dict(inventory)), [total], bar_weight, prefer_over)[0]
+    return tuple((float(weight), count) for weight, count in loading.plates), loading.achieved, round(loading.delta, 3)
+
+
+def process_row(
+    row: Dict[str, str],
+    rounding: str = "None",
+    prefer_over: bool = False,
+    bar_weight: Optional[float] = None,
+    inventories: Optional[Inventories] = None
+) -> List[dict]:
+    """Compute every set of one program row; raises ValueError for a bad row.
+
+    ``bar_weight`` defaults to the row unit's standard bar and ``inventories``
+    to its default plates.
+    """
+    unit = (row.get("unit") or "lb").strip()
+    if unit not in UNITS:
+        raise ValueError(f"unit must be one of {', '.join(UNITS)}")
+    one_rm_text = row.get("one_rm") or row.get("1rm") or "0"
+    try:
+        one_rm = float(one_rm_text)
+    except ValueError:
+        raise ValueError(f"one_rm is not a number: {one_rm_text}")
+    if not 0 <= one_rm < float("inf"):
+        raise ValueError(f"one_rm must be a non-negative number: {one_rm_text}")
+    bar = get_default_bar_weight(unit) if bar_weight is None else bar_weight
+    inventory = _inventory(unit, inventories)
+    athlete = row.get("athlete", "")
+    sets = []
+    for number, r in enumerate(percent_rows(one_rm, rounding, unit, parse_percentages(row.get("percentages", ""))), start=1):
+        plates, achieved, delta = _loading(unit, r.rounded, prefer_over, bar, inventory)
+        sets.append({
+            "athlete": athlete,
+            "set": number,
+            "percent": r.percent,
+            "weight": round(r.weight, 3),
+            "rounded": r.rounded,
+            "achieved": achieved,
+            "delta": delta,
+            "unit": unit,
+            "error": "",
+            "plates": plates,
+        })
+    return sets
+
+
+def _process_or_report(row: Dict[str, str], **options) -> List[dict]:
+    """:func:`process_row`, turning a bad row into one entry carrying its error."""
+    try:
+        return process_row(row, **options)
+    except ValueError as e:
+        entry = dict.fromkeys(OUTPUT_FIELDS, "")
+        entry.update(athlete=row.get("athlete", ""), unit=row.get("unit", ""), error=str(e), plates=())
+        return [entry]
+
+
+def generate(
+    reader: Iterable[Dict[str, str]],
+    rounding: str = "None",
+    prefer_over: bool = False,
+    workers: int = 1,
+    chunksize: int = 512,
+    bar_weight: Optional[float] = None,
+    inventories: Optional[Inventories] = None
+) -> Iterator[dict]:
+    """Yield output sets in input order, optionally fanned out across a process pool.
+
+    Rows that fail yield a single entry with ``error`` set instead of stopping the stream.
+    """
+    worker = partial(
+        _process_or_report, rounding=rounding, prefer_over=prefer_over, bar_weight=bar_weight, inventories=inventories
+    )
+    if workers <= 1:
+        for row in reader:
+            yield from worker(row)
+        return
+    from multiprocessing import Pool
+    with Pool(workers) as pool:
+        for sets in pool.imap(worker, reader, chunksize=chunksize):
+            yield from sets
+
+
+@lru_cache(maxsize=65536)
+def _plates_text(plates: Tuple[Tuple[float, int], ...]) -> str:
+    return " ".join(f"{weight:g}x{pairs}" for weight, pairs in plates)
+
+
+def write_sets(sets: Iterable[dict], output, fmt: str = "csv") -> int:
+    """Write sets as CSV or JSONL, returning the number written."""
+    count = 0
+    if fmt == "jsonl":
+        for entry in sets:
+            output.write(json.dumps(entry) + "\n")
+            count += 1
+        return count
+
+    writer = csv.writer(output)
+    writer.writerow(OUTPUT_FIELDS)
+    for entry in sets:
+        writer.writerow([entry[field] for field in OUTPUT_FIELDS[:-1]] + [_plates_text(entry["plates"])])
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate per-set barbell loadings from a program CSV")
+    parser.add_argument("input", nargs="?", default="-", help="Program CSV path (default: stdin)")
+    parser.add_argument("--output", default="-", help="Output path (default: stdout)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="Output format")
+    parser.add_argument("--rounding", choices=ROUNDING_OPTIONS, default="None", help="Rounding rule for set weights")
+    parser.add_argument("--prefer-over", action="store_true", help="Round loadings up instead of down")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument("--chunksize", type=int, default=512, help="Rows per worker task")
+    parser.add_argument("--bar", type=float, help="Bar weight for every row (default: 45 lb / 20 kg)")
+    plates_group = parser.add_mutually_exclusive_group()
+    plates_group.add_argument("--catalog", choices=sorted(CATALOGS), action="append",
+                              help="Plate catalog for its unit's rows (repeat for lb and kg)")
+    plates_group.add_argument("--plates", help="Pairs on hand for every row, e.g. 45:2,25:2")
+
+    args = parser.parse_args()
+    if args.plates:
+        try:
+            plates = freeze_inventory(parse_plates(args.plates))
+        except ValueError:
+            parser.error("--plates must look like 45:2,25:2")
+        inventories = tuple((unit, plates) for unit in UNITS)
+    else:
+        catalogs = [CATALOGS[catalog_id] for catalog_id in args.catalog or ()]
+        inventories = tuple(
+            (catalog.unit, freeze_inventory(catalog.to_weights(catalog.default_inventory()))) for catalog in catalogs
+        )
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        sets = generate(csv.DictReader(source), args.rounding, args.prefer_over, args.workers, args.chunksize,
+                        args.bar, inventories)
+        written = write_sets(sets, target, args.format)
+    finally:
+        for stream in (source, target):
+            if stream not in (sys.stdin, sys.stdout):
+                stream.close()
+    print(f"Wrote {written} sets", file=sys.stderr)
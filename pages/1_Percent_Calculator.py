@@ -1,9 +1,14 @@
 """Percent Calculator Page"""
 
 import streamlit as st
-import pandas as pd
 from utils.branding import display_logo_and_title, apply_mobile_styles
-from utils.units import round_weight, format_weight
+from utils.units import format_weight, get_default_bar_weight, get_default_plates
+from utils.plates import format_plate_stack
+from utils.percent import ROUNDING_OPTIONS, table_csv
+from utils.ladder import DEFAULT_RAMP, DEFAULT_TOLERANCE, MAX_TOLERANCE, describe_moves, warmup_ladder
+from utils import payload
+from utils.profiling import show_debug_panel, start_run
+from utils.service import percent_table
 
 # Configure page
 st.set_page_config(
@@ -13,11 +18,17 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Opt-in phase timings (FORTRESS_PROFILE=1 or ?profile=1)
+profiler = start_run("percent_calculator")
+payload.start_page("percent_calculator")
+
 # Apply styling
-apply_mobile_styles()
+with profiler.phase("apply_mobile_styles"):
+    apply_mobile_styles()
 
 # Display header
-display_logo_and_title()
+with profiler.phase("display_logo_and_title"):
+    display_logo_and_title()
 
 # Back button
 if st.button("← Back to Tools", use_container_width=True):
@@ -44,44 +55,115 @@ with col2:
 # Rounding options
 rounding = st.selectbox(
     "Rounding",
-    ["None", "Nearest 0.5", "Nearest 1.0"],
+    ROUNDING_OPTIONS,
     index=0
 )
 
+# Reuse the inventory edited on the barbell page when it matches this unit
+if st.session_state.get('unit') == unit and 'plates' in st.session_state:
+    inventory = st.session_state.plates
+else:
+    inventory = get_default_plates(unit)
+
+# Barbell loadings for every row
+show_plates = st.checkbox("Show plates")
+bar_weight = get_default_bar_weight(unit)
+if show_plates:
+    bar_weight = st.number_input(
+        "Bar weight",
+        min_value=0.0,
+        value=bar_weight,
+        step=1.0,
+        format="%.1f"
+    )
+
 # Generate percentage table
 if base_weight > 0:
-    percentages = list(range(0, 105, 5))  # 0% to 100% in 5% increments
-    
-    data = []
-    for pct in percentages:
-        weight = base_weight * (pct / 100)
-        rounded_weight = round_weight(weight, rounding, unit)
-        data.append({
-            "Percent": f"{pct}%",
-            "Weight": format_weight(rounded_weight, unit)
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Display table
-    st.markdown("### Results")
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "Percent": st.column_config.TextColumn(width="small"),
-            "Weight": st.column_config.TextColumn(width="medium")
+    with profiler.phase("computation"):
+        # Shared across sessions: identical inputs are computed once per process
+        if show_plates:
+            result = percent_table(base_weight, rounding, unit, bar_weight, inventory)
+        else:
+            result = percent_table(base_weight, rounding, unit)
+        
+        # Column-oriented table; st.dataframe takes a dict of lists, so no pandas
+        table = {
+            "Percent": [f"{row.percent}%" for row in result.rows],
+            "Weight": [format_weight(row.rounded, unit) for row in result.rows]
         }
-    )
+        
+        if result.loadings is not None:
+            loadings = result.loadings
+            table["Plates (per side)"] = [format_plate_stack(l.plates, unit) if l.plates else "Bar only" for l in loadings]
+            table["Achieved"] = [format_weight(l.achieved, unit) for l in loadings]
+            table["Delta"] = [
+                "Exact" if abs(l.delta) < 0.01 else f"{'+' if l.delta > 0 else '-'}{format_weight(abs(l.delta), unit)}"
+                for l in loadings
+            ]
     
-    # Copy to clipboard functionality
-    csv_data = df.to_csv(index=False)
+    with profiler.phase("rendering"):
+        # Display table
+        st.markdown("### Results")
+        st.dataframe(
+            table,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Percent": st.column_config.TextColumn(width="small"),
+                "Weight": st.column_config.TextColumn(width="medium"),
+                "Plates (per side)": st.column_config.TextColumn(width="large"),
+                "Achieved": st.column_config.TextColumn(width="small"),
+                "Delta": st.column_config.TextColumn(width="small")
+            }
+        )
+        
+        # Copy to clipboard functionality
+        csv_data = table_csv(table)
+        
+        if st.button("Copy Table", use_container_width=True):
+            # Use Streamlit's built-in clipboard functionality
+            st.code(csv_data, language=None)
+            st.success("Table data shown above - copy manually")
     
-    if st.button("Copy Table", use_container_width=True):
-        # Use Streamlit's built-in clipboard functionality
-        st.code(csv_data, language=None)
-        st.success("Table data shown above - copy manually")
+    # Warm-up sets that reach the top set with the fewest plate changes
+    with st.expander("Warm-up ladder"):
+        top_set = st.number_input("Top set", min_value=0.0, value=base_weight, step=1.0, format="%.1f")
+        ramp_text = st.text_input("Ramp (%)", value=", ".join(str(pct) for pct in DEFAULT_RAMP))
+        tolerance = st.number_input(
+            "Allowed miss per set",
+            min_value=0.0,
+            max_value=MAX_TOLERANCE[unit],
+            value=DEFAULT_TOLERANCE[unit],
+            step=0.5,
+            format="%.1f"
+        )
+        try:
+            ramp = [float(item) for item in ramp_text.replace(";", ",").split(",") if item.strip()]
+        except ValueError:
+            ramp = []
+            st.error("Enter percentages as numbers separated by commas")
+        
+        if ramp and top_set > bar_weight:
+            with profiler.phase("computation"):
+                ladder = warmup_ladder(top_set, bar_weight, inventory, ramp, tolerance, rounding, unit)
+            with profiler.phase("rendering"):
+                st.dataframe(
+                    {
+                        "Percent": [f"{step.percent:g}%" for step in ladder.steps],
+                        "Load": [format_weight(step.achieved, unit) for step in ladder.steps],
+                        "Plates (per side)": [format_plate_stack(step.plates, unit) if step.plates else "Bar only" for step in ladder.steps],
+                        "Change (per side)": [describe_moves(step.strip, step.add, unit) for step in ladder.steps]
+                    },
+                    use_container_width=True,
+                    hide_index=True
+                )
+                st.caption(
+                    f"{ladder.total_moves} plate moves per side. The search caps the candidate loads per set, "
+                    "so on rare occasions a ladder with fewer moves exists."
+                )
 
 else:
     st.info("Enter a base weight to see percentage calculations")
+
+payload.finish_page()
+show_debug_panel(profiler)
@@ -2,8 +2,16 @@
 
 import streamlit as st
 from utils.branding import display_logo_and_title, apply_mobile_styles
-from utils.units import get_default_bar_weight, get_default_plates, convert_weight, format_weight
-from utils.plates import PLATE_WEIGHTS, PLATE_COLORS, calculate_total_weight, calculate_per_side_weight, format_per_side_breakdown, generate_barbell_visualization
+from utils.units import get_default_bar_weight, format_dual_weight, format_weight
+from utils.catalog import DEFAULT_CATALOGS, DEFAULT_SLEEVE_LENGTH_MM, catalogs_for_unit, get_catalog, get_default_catalog
+from utils.mixed import format_mixed_stack
+from utils.plates import format_plate_stack, render_loadout, stack_thickness
+from utils import payload
+from utils.profiling import show_debug_panel, start_run
+from utils.planner import plan_bars
+from utils.flight import loading_sheet, parse_attempts, sheet_csv
+from utils.ladder import describe_moves
+from utils.service import barbell_setup, mixed_barbell_setup
 
 # Configure page
 st.set_page_config(
@@ -13,11 +21,17 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Opt-in phase timings (FORTRESS_PROFILE=1 or ?profile=1)
+profiler = start_run("barbell_calculator")
+payload.start_page("barbell_calculator")
+
 # Apply styling
-apply_mobile_styles()
+with profiler.phase("apply_mobile_styles"):
+    apply_mobile_styles()
 
 # Display header
-display_logo_and_title()
+with profiler.phase("display_logo_and_title"):
+    display_logo_and_title()
 
 # Back button
 if st.button("← Back to Tools", use_container_width=True):
@@ -29,25 +43,17 @@ st.markdown("## Barbell Calculator")
 # Initialize session state
 if 'unit' not in st.session_state:
     st.session_state.unit = "lb"
-if 'plates' not in st.session_state:
-    st.session_state.plates = get_default_plates("lb")
+if 'catalog_by_unit' not in st.session_state:
+    st.session_state.catalog_by_unit = dict(DEFAULT_CATALOGS)
+if 'catalog_counts' not in st.session_state:
+    # Pair counts per catalog, keyed by stable plate ID, kept across unit switches
+    st.session_state.catalog_counts = {}
 
 # Input section
 col1, col2 = st.columns(2)
 
 with col1:
-    new_unit = st.selectbox("Units", ["lb", "kg"], index=0 if st.session_state.unit == "lb" else 1)
-    
-    # Handle unit conversion
-    if new_unit != st.session_state.unit:
-        # Convert existing plate weights
-        old_plates = st.session_state.plates
-        new_plates = {}
-        for weight, count in old_plates.items():
-            new_weight = convert_weight(weight, st.session_state.unit, new_unit)
-            new_plates[new_weight] = count
-        st.session_state.plates = new_plates
-        st.session_state.unit = new_unit
+    st.session_state.unit = st.selectbox("Units", ["lb", "kg"], index=0 if st.session_state.unit == "lb" else 1)
 
 with col2:
     bar_weight = st.number_input(
@@ -79,33 +85,77 @@ if use_collars:
         format="%.1f"
     )
 
+# Sleeve fit (bumpers run out of sleeve before they run out of weight)
+check_fit = st.checkbox("Check sleeve fit")
+sleeve_length = None
+if check_fit:
+    sleeve_length = st.number_input(
+        "Usable sleeve length (mm)",
+        min_value=0.0,
+        value=float(DEFAULT_SLEEVE_LENGTH_MM),
+        step=5.0,
+        format="%.0f"
+    )
+
 # Plate configuration
 st.markdown("### Available Plates")
 
+unit_catalogs = catalogs_for_unit(st.session_state.unit)
+catalog_ids = [c.id for c in unit_catalogs]
+selected_id = st.selectbox(
+    "Plate set",
+    catalog_ids,
+    index=catalog_ids.index(st.session_state.catalog_by_unit[st.session_state.unit]),
+    format_func=lambda catalog_id: get_catalog(catalog_id).name
+)
+st.session_state.catalog_by_unit[st.session_state.unit] = selected_id
+catalog = get_catalog(selected_id)
+counts = st.session_state.catalog_counts.setdefault(catalog.id, catalog.default_inventory())
+
 # Reset to defaults button
 if st.button("Reset to Defaults"):
-    st.session_state.plates = get_default_plates(st.session_state.unit)
+    st.session_state.catalog_counts[catalog.id] = catalog.default_inventory()
     st.rerun()
 
-# Plate inputs
+# Plate inputs (widget keys use plate IDs so they survive unit and set switches)
 plate_cols = st.columns(3)
-plate_weights = sorted(st.session_state.plates.keys(), reverse=True)
+enabled_counts = {}
 
-for i, weight in enumerate(plate_weights):
+for i, plate in enumerate(catalog.plates):
     col_idx = i % 3
     with plate_cols[col_idx]:
-        enabled = st.checkbox(f"{format_weight(weight, st.session_state.unit)}", value=True, key=f"enable_{weight}")
+        enabled = st.checkbox(f"{plate.weight:g} {plate.unit}", value=True, key=f"enable_{plate.id}")
         if enabled:
             count = st.number_input(
-                f"Count",
+                "Count",
                 min_value=0,
-                value=st.session_state.plates[weight],
+                value=counts[plate.id],
                 step=1,
-                key=f"count_{weight}"
+                key=f"count_{plate.id}"
             )
-            st.session_state.plates[weight] = count
-        else:
-            st.session_state.plates[weight] = 0
+            counts[plate.id] = count
+            enabled_counts[plate.id] = count
+
+# Weight-keyed inventory shared with the Percent Calculator
+st.session_state.plates = catalog.to_weights(enabled_counts)
+
+# Plates of the other unit on the same bar (kg bumpers on an lb bar and vice versa)
+other_unit = "kg" if st.session_state.unit == "lb" else "lb"
+mixed_inventory = None
+if st.checkbox(f"Also use {other_unit} plates"):
+    other_catalog = get_default_catalog(other_unit)
+    other_counts = st.session_state.catalog_counts.setdefault(other_catalog.id, other_catalog.default_inventory())
+    other_cols = st.columns(3)
+    for i, plate in enumerate(other_catalog.plates):
+        with other_cols[i % 3]:
+            other_counts[plate.id] = st.number_input(
+                f"{plate.weight:g} {plate.unit} count",
+                min_value=0,
+                value=other_counts[plate.id],
+                step=1,
+                key=f"count_{plate.id}"
+            )
+    mixed_inventory = {**catalog.to_mixed(enabled_counts), **other_catalog.to_mixed(other_counts)}
 
 # Calculation
 st.markdown("### Results")
@@ -125,53 +175,132 @@ else:
         
         # Pack plates
         prefer_over = st.checkbox("Prefer going over target", value=False)
-        plates, achieved_per_side, delta = pack_plates(target_per_side, available_plates, prefer_over)
-        
-        achieved_total = bar_weight + collar_weight + (achieved_per_side * 2)
-        
-        # Summary chips
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Target", format_weight(target_total, st.session_state.unit))
-        with col2:
-            st.metric("Achieved", format_weight(achieved_total, st.session_state.unit))
-        with col3:
-            delta_total = achieved_total - target_total
-            st.metric("Delta", format_weight(abs(delta_total), st.session_state.unit), 
-                     delta=f"{'Over' if delta_total > 0 else 'Under'}" if delta_total != 0 else "Exact")
+        if mixed_inventory is not None:
+            unit = st.session_state.unit
+            with profiler.phase("computation"):
+                mixed = mixed_barbell_setup(target_total, bar_weight, mixed_inventory, unit, collar_weight, prefer_over)
+            with profiler.phase("rendering"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Target", format_dual_weight(target_total, unit))
+                with col2:
+                    st.metric("Achieved", format_dual_weight(mixed.achieved_total, unit),
+                              delta="Exact" if mixed.exact else f"{mixed.delta_total:+.2f} {unit}")
+                if not mixed.plates and target_per_side > 0:
+                    st.warning("Cannot achieve target weight with available plates")
+                st.markdown("#### Per Side Breakdown")
+                st.write(f"**{format_mixed_stack(list(mixed.plates))}**")
+                st.write(f"Per side weight: {format_dual_weight(mixed.per_side, unit)}")
+                if sleeve_length is not None:
+                    st.caption("Sleeve fit is checked for single-unit plate sets only")
+        else:
+            with profiler.phase("computation"):
+                # Shared across sessions: identical inputs are computed once per process
+                setup = barbell_setup(target_total, bar_weight, available_plates, collar_weight, prefer_over,
+                                      st.session_state.unit, sleeve_length, catalog.thickness())
+                plates, achieved_per_side, achieved_total = list(setup.plates), setup.per_side, setup.achieved_total
         
-        # Per-side breakdown
-        if plates:
-            st.markdown("#### Per Side Breakdown")
-            plate_text = format_plate_stack(plates, st.session_state.unit)
-            st.write(f"**{plate_text}**")
-            st.write(f"Per side weight: {format_weight(achieved_per_side, st.session_state.unit)}")
-            
-            # Visualization
-            st.markdown("#### Plate Visualization")
-            
-            # Create visual representation
-            colors = calculate_plate_colors(plates, st.session_state.unit)
-            
-            # Left side (reversed order for visual effect)
-            left_html = ""
-            for (color, count), (weight, _) in zip(reversed(colors), reversed(plates)):
-                for _ in range(count):
-                    left_html += f'<div style="display:inline-block; width:20px; height:60px; background-color:{color}; border:1px solid #333; margin:1px;"></div>'
+            with profiler.phase("rendering"):
+                # Summary chips
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Target", format_weight(target_total, st.session_state.unit))
+                with col2:
+                    st.metric("Achieved", format_weight(achieved_total, st.session_state.unit))
+                with col3:
+                    delta_total = achieved_total - target_total
+                    st.metric("Delta", format_weight(abs(delta_total), st.session_state.unit), 
+                             delta=f"{'Over' if delta_total > 0 else 'Under'}" if delta_total != 0 else "Exact")
             
-            # Bar
-            bar_html = '<div style="display:inline-block; width:100px; height:10px; background-color:#666; margin:25px 5px;"></div>'
-            
-            # Right side
-            right_html = ""
-            for color, count in colors:
-                for _ in range(count):
-                    right_html += f'<div style="display:inline-block; width:20px; height:60px; background-color:{color}; border:1px solid #333; margin:1px;"></div>'
-            
-            visualization = f'<div style="text-align:center; margin:20px 0;">{left_html}{bar_html}{right_html}</div>'
-            st.markdown(visualization, unsafe_allow_html=True)
-            
-        else:
-            st.warning("Cannot achieve target weight with available plates")
-            if target_per_side > 0:
-                st.write(f"Need {format_weight(target_per_side, st.session_state.unit)} per side")
+                # Per-side breakdown
+                if plates:
+                    st.markdown("#### Per Side Breakdown")
+                    plate_text = format_plate_stack(plates, st.session_state.unit)
+                    st.write(f"**{plate_text}**")
+                    st.write(f"Per side weight: {format_weight(achieved_per_side, st.session_state.unit)}")
+                    if sleeve_length is not None:
+                        st.write(f"Sleeve used: {stack_thickness(plates, catalog.thickness()):.0f} of {sleeve_length:.0f} mm")
+                
+                    # Visualization
+                    st.markdown("#### Plate Visualization")
+                
+                    visualization, _ = render_loadout(bar_weight, dict(plates), st.session_state.unit)
+                    payload.markdown("plates", visualization, unsafe_allow_html=True)
+                
+                else:
+                    st.warning("Cannot achieve target weight with available plates")
+                    if target_per_side > 0:
+                        st.write(f"Need {format_weight(target_per_side, st.session_state.unit)} per side")
+
+# Several bars loaded from the same plate tree
+with st.expander("Plan a class (several bars, one plate tree)"):
+    targets_text = st.text_input("Bar targets (total weight, comma separated)", placeholder="225, 185, 185, 135")
+    try:
+        class_targets = [float(item) for item in targets_text.replace(";", ",").split(",") if item.strip()]
+    except ValueError:
+        class_targets = []
+        st.error("Enter targets as numbers separated by commas")
+    
+    if class_targets:
+        unit = st.session_state.unit
+        st.caption("Bars are loaded at or under their targets, never over")
+        with profiler.phase("computation"):
+            plan = plan_bars(class_targets, bar_weight, st.session_state.plates)
+        with profiler.phase("rendering"):
+            st.dataframe(
+                {
+                    "Bar": [str(number) for number in range(1, len(plan.bars) + 1)],
+                    "Target": [format_weight(bar.target, unit) for bar in plan.bars],
+                    "Achieved": [format_weight(bar.achieved, unit) for bar in plan.bars],
+                    "Under target by": [format_weight(bar.deviation, unit) if bar.deviation else "" for bar in plan.bars],
+                    "Plates (per side)": [format_plate_stack(bar.plates, unit) if bar.plates else "Bar only" for bar in plan.bars]
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+            if plan.short:
+                st.warning(
+                    f"Short: bar {', '.join(str(position + 1) for position in plan.short)} "
+                    f"({format_weight(plan.total_deviation, unit)} total)"
+                )
+            else:
+                st.success("Every bar is on target")
+            if plan.leftover:
+                st.caption(f"Left on the tree (pairs): {format_plate_stack(list(plan.leftover.items()), unit)}")
+
+# One bar shared by a flight of lifters, loaded in ascending order
+with st.expander("Meet flight (loader's sheet)"):
+    attempts_text = st.text_area("Attempts (one per line: lifter, total weight)", placeholder="Sam, 140\nAlex, 132.5")
+    try:
+        attempts = parse_attempts(attempts_text)
+    except ValueError as error:
+        attempts = []
+        st.error(str(error))
+    
+    if attempts:
+        unit = st.session_state.unit
+        with profiler.phase("computation"):
+            rows = loading_sheet(attempts, bar_weight, st.session_state.plates, collar_weight)
+        with profiler.phase("rendering"):
+            st.dataframe(
+                {
+                    "Order": [str(row.order) for row in rows],
+                    "Lifter": [row.lifter for row in rows],
+                    "Attempt": [format_weight(row.weight, unit) for row in rows],
+                    "Loaded": [format_weight(row.achieved, unit) for row in rows],
+                    "Change (per side)": [describe_moves(row.strip, row.add, unit) for row in rows],
+                    "Plates (per side)": [format_plate_stack(row.plates, unit) if row.plates else "Bar only" for row in rows]
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+            missed = [row for row in rows if abs(row.achieved - row.weight) > 0.01]
+            if missed:
+                st.warning(f"Cannot load exactly with these plates: {', '.join(format_weight(row.weight, unit) for row in missed)}")
+            if any(row.bare for row in rows):
+                st.warning(f"Full strip needed before attempt {', '.join(str(row.order) for row in rows if row.bare)}")
+            st.caption(f"{sum(row.moves for row in rows)} plate moves per side")
+            st.download_button("Download sheet (CSV)", "".join(sheet_csv(rows, unit)), file_name="loading_sheet.csv", mime="text/csv")
+
+payload.finish_page()
+show_debug_panel(profiler)
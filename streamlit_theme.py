@@ -1,16 +1,14 @@
 """Streamlit theme injection utility for Fortress Athlete branding."""
 
-from pathlib import Path
-import streamlit as st
+from utils import payload
+from utils.assets import stylesheet_html
 
 
 def inject_theme():
     """Inject custom CSS theme into Streamlit app."""
     try:
-        css_path = Path("styles/theme.css")
-        if css_path.exists():
-            css = css_path.read_text(encoding="utf-8")
-            st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-    except Exception as e:
+        # Merged theme + mobile stylesheet, built once per process
+        payload.markdown("inject_theme", stylesheet_html(), unsafe_allow_html=True)
+    except Exception:
         # Silently fail if theme can't be loaded
         pass
@@ -0,0 +1,100 @@
+"""Unit tests for the JSON HTTP API."""
+
+import asyncio
+import json
+import unittest
+
+import api
+
+
+def _get(path, query=""):
+    """Run one GET request through the ASGI app and return (status, JSON)."""
+    sent = []
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        sent.append(message)
+    
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query.encode()}
+    asyncio.run(api.app(scope, receive, send))
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+class TestApi(unittest.TestCase):
+    
+    def test_health(self):
+        """Test the health endpoint."""
+        self.assertEqual(_get("/health"), (200, {"status": "ok"}))
+    
+    def test_pack_default_inventory(self):
+        """Test packing against the default lb plates."""
+        status, body = _get("/pack", "target=225&unit=lb")
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(body["plates_per_side"], [{"weight": 45.0, "count": 2}])
+        self.assertEqual(body["achieved"], 225.0)
+        self.assertEqual(body["delta"], 0.0)
+    
+    def test_pack_custom_inventory(self):
+        """Test packing against an explicit inventory."""
+        status, body = _get("/pack", "target=100&bar=20&unit=kg&plates=25:1,10:2&prefer_over=1")
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(body["achieved"], 110.0)
+    
+    def test_percent_with_loadings(self):
+        """Test percent rows with per-row loadings."""
+        status, body = _get("/percent", "base=200&unit=lb&rounding=Nearest+1.0&bar=45")
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body["rows"]), 21)
+        self.assertEqual(body["rows"][-1]["rounded"], 200)
+        self.assertIn("plates", body["rows"][-1])
+    
+    def test_convert(self):
+        """Test unit conversion."""
+        status, body = _get("/convert", "weight=100&from=kg&to=lb")
+        
+        self.assertEqual(status, 200)
+        self.assertAlmostEqual(body["weight"], 220.462, places=2)
+    
+    def test_errors(self):
+        """Test bad parameters and unknown paths."""
+        self.assertEqual(_get("/pack", "unit=lb")[0], 400)
+        self.assertEqual(_get("/pack", "target=abc")[0], 400)
+        self.assertEqual(_get("/convert", "weight=1&from=lb&to=st")[0], 400)
+        self.assertEqual(_get("/nope")[0], 404)
+    
+    def test_rejects_out_of_range_numbers(self):
+        """Test that numbers the solver cannot handle are 400s, not 500s."""
+        self.assertEqual(_get("/pack", "target=inf")[0], 400)
+        self.assertEqual(_get("/pack", "target=1e308")[0], 400)
+        self.assertEqual(_get("/pack", "target=225&plates=inf:2")[0], 400)
+        self.assertEqual(_get("/pack", "target=225&plates=45:-1")[0], 400)
+        self.assertEqual(_get("/percent", "base=1e308&bar=45")[0], 400)
+    
+    def test_rejects_plates_the_user_does_not_own(self):
+        """Test that off-grid plate weights and catalogs in the other unit are 400s."""
+        self.assertEqual(_get("/pack", "target=225&plates=0.3:2")[0], 400)
+        self.assertEqual(_get("/pack", "target=225&plates=45:2,2.6:1")[0], 400)
+        self.assertEqual(_get("/pack", "target=100&unit=kg&plates=1.25:2,0.25:2")[0], 200)
+        self.assertEqual(_get("/pack", "target=225&unit=lb&catalog=bumper_kg")[0], 400)
+        self.assertEqual(_get("/percent", "base=100&unit=lb&catalog=bumper_kg")[0], 400)
+        self.assertEqual(_get("/pack", "target=100&unit=kg&catalog=bumper_kg")[0], 200)
+    
+    def test_large_inventories_are_bounded(self):
+        """Test that pair counts are capped and clamped to what the target can use."""
+        self.assertEqual(_get("/pack", "target=100&plates=0.25:20000,1:20000")[0], 400)
+        self.assertEqual(
+            api._inventory({"plates": ["45:10,2.5:10"]}, "lb", 90),
+            ((2.5, 10), (45, 3))
+        )
+        status, body = _get("/pack", "target=135&plates=45:10,2.5:10")
+        self.assertEqual(status, 200)
+        self.assertEqual(body["plates_per_side"], [{"weight": 45.0, "count": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Unit tests for the static asset pipeline."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils import assets
+
+
+class TestAssetPipeline(unittest.TestCase):
+    
+    def setUp(self):
+        """Publish into a temporary static directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self._static_dir = assets.STATIC_DIR
+        assets.STATIC_DIR = Path(self._tmp.name) / "static"
+        self._logo_path = assets.LOGO_PATH
+        assets.LOGO_PATH = Path(self._tmp.name) / "logo.png"
+        assets._assets.clear()
+    
+    def tearDown(self):
+        """Restore the real static directory."""
+        assets.STATIC_DIR = self._static_dir
+        assets.LOGO_PATH = self._logo_path
+        assets._assets.clear()
+        self._tmp.cleanup()
+    
+    def test_minify_css(self):
+        """Test comment and whitespace removal."""
+        css = "/* note */\n.a > .b {\n  color: red;\n  margin: 0 1px;\n}\n@media (max-width: 768px) { .c { top: 0; } }"
+        self.assertEqual(
+            assets.minify_css(css),
+            ".a>.b{color:red;margin:0 1px}@media (max-width:768px){.c{top:0}}"
+        )
+    
+    def test_stylesheet_is_built_once(self):
+        """Test that the merged stylesheet is content-hashed and reused."""
+        first = assets.get_stylesheet()
+        second = assets.get_stylesheet()
+        
+        self.assertIs(first, second)
+        self.assertTrue(first.filename.startswith("fortress."))
+        self.assertEqual(first.url, f"{assets.STATIC_URL}/{first.filename}")
+        self.assertEqual((assets.STATIC_DIR / first.filename).read_bytes(), first.content)
+        self.assertIn(b".stDataFrame", first.content)
+        self.assertIn(b"--primary:", first.content)
+    
+    def test_publish_replaces_stale_versions(self):
+        """Test that a new version removes the previous file."""
+        old = assets.publish("demo", ".css", b"a{}")
+        new = assets.publish("demo", ".css", b"b{}")
+        
+        self.assertNotEqual(old.filename, new.filename)
+        self.assertEqual([p.name for p in assets.STATIC_DIR.iterdir()], [new.filename])
+    
+    def test_stylesheet_html_link(self):
+        """Test that the stylesheet is referenced rather than inlined."""
+        html = assets.stylesheet_html()
+        self.assertTrue(html.startswith('<link rel="stylesheet" href="app/static/fortress.'))
+
+    
+    def test_missing_or_empty_logo(self):
+        """Test that there is no logo asset without a usable file."""
+        self.assertIsNone(assets.get_logo())
+        assets._assets.clear()
+        assets.LOGO_PATH.write_bytes(b"")
+        self.assertIsNone(assets.get_logo())
+    
+    def test_logo_published_once(self):
+        """Test that the logo variant is published under a hashed static URL."""
+        assets.LOGO_PATH.write_bytes(b"not really a png")
+        logo = assets.get_logo()
+        
+        self.assertIs(assets.get_logo(), logo)
+        self.assertTrue(logo.url.startswith(f"{assets.STATIC_URL}/fortress-logo-{assets.LOGO_WIDTH}."))
+        self.assertEqual(logo.content, b"not really a png")
+
+
+if __name__ == "__main__":
+    unittest.main()
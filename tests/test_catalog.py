@@ -0,0 +1,46 @@
+"""Unit tests for plate catalogs."""
+
+import unittest
+from utils.catalog import CATALOGS, catalogs_for_unit, get_default_catalog
+from utils.units import get_default_plates
+
+
+class TestPlateCatalogs(unittest.TestCase):
+    
+    def test_default_catalogs_match_default_plates(self):
+        """Test that default catalogs produce the default inventories."""
+        for unit in ("lb", "kg"):
+            catalog = get_default_catalog(unit)
+            self.assertEqual(catalog.to_weights(catalog.default_inventory()), get_default_plates(unit))
+    
+    def test_plate_ids_are_stable_across_catalogs(self):
+        """Test that the same physical plate keeps its ID in every catalog."""
+        by_id = {}
+        for catalog in CATALOGS.values():
+            for plate in catalog.plates:
+                by_id.setdefault(plate.id, plate)
+                self.assertEqual(by_id[plate.id], plate)
+    
+    def test_catalogs_are_native_to_their_unit(self):
+        """Test that kg catalogs only hold kg plates on the quarter grid."""
+        for catalog in catalogs_for_unit("kg"):
+            self.assertTrue(all(plate.unit == "kg" for plate in catalog.plates))
+        self.assertEqual(catalogs_for_unit("lb")[0], get_default_catalog("lb"))
+    
+    def test_plates_sorted_heaviest_first(self):
+        """Test catalog plate ordering."""
+        for catalog in CATALOGS.values():
+            weights = [plate.weight for plate in catalog.plates]
+            self.assertEqual(weights, sorted(weights, reverse=True))
+    
+    def test_every_plate_has_a_physical_thickness(self):
+        """Test that thickness maps cover every plate, bumpers thicker than iron."""
+        for catalog in CATALOGS.values():
+            thickness = catalog.thickness()
+            self.assertEqual(set(thickness), {plate.weight for plate in catalog.plates})
+            self.assertTrue(all(mm > 0 for mm in thickness.values()))
+        self.assertGreater(CATALOGS["bumper_kg"].thickness()[20], CATALOGS["iron_lb"].thickness()[45])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Unit tests for printable loading charts."""
+
+import unittest
+from utils.chart import chart_csv, chart_html, chart_pdf, loading_chart, platform_inventory
+from utils.units import get_default_plates
+
+
+class TestLoadingChart(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a platform inventory reaching 700 lb."""
+        self.inventory = platform_inventory(get_default_plates("lb"), 45, 700)
+        self.rows = loading_chart(45, self.inventory, "lb")
+    
+    def test_full_range(self):
+        """Test that the chart covers bar weight to the maximum in fixed steps."""
+        self.assertEqual(self.rows[0].total, 45)
+        self.assertEqual(self.rows[-1].total, 700)
+        self.assertEqual(len(self.rows), (700 - 45) // 5 + 1)
+    
+    def test_every_total_is_exact(self):
+        """Test that a platform inventory loads every 5 lb step exactly."""
+        self.assertTrue(all(row.delta == 0 for row in self.rows))
+        self.assertEqual(self.rows[0].plates, [])
+    
+    def test_platform_inventory(self):
+        """Test that only the heaviest plate is topped up."""
+        self.assertEqual(self.inventory[45], 8)
+        self.assertEqual(self.inventory[2.5], 2)
+    
+    def test_renderers(self):
+        """Test CSV, HTML and PDF output."""
+        csv_text = chart_csv(self.rows, "lb")
+        self.assertTrue(csv_text.startswith("Total,Plates (per side),Achieved,Delta,Unit"))
+        self.assertEqual(len(csv_text.splitlines()), len(self.rows) + 1)
+        self.assertIn("<td>700 lb</td>", chart_html(self.rows, "lb"))
+        pdf = chart_pdf(self.rows, "lb")
+        self.assertTrue(pdf.startswith(b"%PDF-1.4"))
+        self.assertTrue(pdf.rstrip().endswith(b"%%EOF"))
+
+
+if __name__ == "__main__":
+    unittest.main()
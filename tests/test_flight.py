@@ -0,0 +1,106 @@
+"""Unit tests for flight loading sheets."""
+
+import itertools
+import random
+import time
+import unittest
+
+from utils.catalog import get_catalog
+from utils.flight import Attempt, loading_order, loading_sheet, parse_attempts, sheet_csv
+from utils.ladder import plate_moves, solve_stacks
+
+
+def _exact_stacks(weight, bar_weight, inventory):
+    """Every per-side stack that loads ``weight`` exactly, else every stack of the closest load under it."""
+    plates = sorted(inventory, reverse=True)
+    loads = {}
+    for counts in itertools.product(*(range(inventory[plate] + 1) for plate in plates)):
+        stack = tuple(plate for plate, used in zip(plates, counts) for _ in range(used))
+        loads.setdefault(sum(stack), []).append(stack)
+    per_side = (weight - bar_weight) / 2
+    return loads[max(total for total in loads if total <= max(per_side, 0))]
+
+
+def _brute_force(weights, bar_weight, inventory):
+    """Fewest (full strips, moves) over every sequence of stacks, enumerated without the solver's pruning."""
+    layers = [_exact_stacks(weight, bar_weight, inventory) for weight in weights]
+    best = None
+    for path in itertools.product(*layers):
+        bare, moves, previous = 0, 0, ()
+        for stack in path:
+            strip, add = plate_moves(previous, stack)
+            bare += bool(previous) and len(strip) == len(previous)
+            moves += len(strip) + len(add)
+            previous = stack
+        if best is None or (bare, moves) < best:
+            best = (bare, moves)
+    return best
+
+
+class TestLoadingSheet(unittest.TestCase):
+
+    def test_parse_attempts(self):
+        """Test lifter/weight lines, bare weights and a bad line."""
+        attempts = parse_attempts("Sam, 140\n\nAlex Kim, 132.5\n150\n")
+        self.assertEqual(attempts, [Attempt("Sam", 140), Attempt("Alex Kim", 132.5), Attempt("", 150)])
+        with self.assertRaises(ValueError):
+            parse_attempts("Sam, heavy")
+
+    def test_order_is_ascending_and_stable(self):
+        """Test that the bar is loaded in ascending order, ties in entry order."""
+        attempts = [Attempt("A", 150), Attempt("B", 140), Attempt("C", 150), Attempt("D", 140)]
+        self.assertEqual([a.lifter for a in loading_order(attempts)], ["B", "D", "A", "C"])
+
+    def test_loads_exactly_and_keeps_the_bar_loaded(self):
+        """Test that exact loads are chosen so the bar is never stripped bare."""
+        # 95 would naturally be a lone 25; loading 25 + 10 + 10 for 135 avoids a full strip
+        inventory = {45: 2, 25: 1, 10: 2, 5: 2}
+        rows = loading_sheet([Attempt("B", 135), Attempt("A", 95)], 45, inventory)
+        self.assertEqual([row.lifter for row in rows], ["A", "B"])
+        self.assertEqual([row.achieved for row in rows], [95, 135])
+        self.assertFalse(any(row.bare for row in rows))
+        self.assertEqual(rows[1].strip, ())
+
+    def test_collars_count_toward_the_attempt(self):
+        """Test that collars are part of the loaded weight."""
+        rows = loading_sheet([Attempt("A", 100)], 20, {25: 2, 10: 2, 5: 2, 2.5: 2}, collar_weight=5)
+        self.assertEqual(rows[0].achieved, 100)
+        self.assertEqual(rows[0].plates, [(25, 1), (10, 1), (2.5, 1)])
+
+    def test_matches_brute_force(self):
+        """Test random flights against every stack sequence (small inventories, where the EXTRA_PLATES cap does not bind)."""
+        rng = random.Random(11)
+        plates = [25, 20, 15, 10, 5, 2.5, 1.25]
+        for _ in range(40):
+            inventory = {plate: rng.randint(0, 2) for plate in rng.sample(plates, 5)}
+            weights = [rng.choice(range(30, 125)) * 1.0 for _ in range(4)]
+            rows = loading_sheet([Attempt(str(i), w) for i, w in enumerate(weights)], 20, inventory)
+            found = (sum(row.bare for row in rows), sum(row.moves for row in rows))
+            self.assertEqual(found, _brute_force(sorted(weights), 20, inventory))
+
+    def test_meet_sized_flight_stays_fast(self):
+        """Test a cold 36-attempt flight with 8 pairs a plate and attempts off the plate grid."""
+        rng = random.Random(3)
+        for catalog_id, bar_weight, lightest in [("iron_lb", 45, 225), ("bumper_kg", 20, 100)]:
+            catalog = get_catalog(catalog_id)
+            inventory = catalog.to_weights({plate.id: 8 for plate in catalog.plates})
+            attempts = [Attempt(str(i), rng.choice(range(lightest, lightest * 3)) + rng.choice([0, 0.5, 0.3, 1.1])) for i in range(36)]
+            solve_stacks.cache_clear()
+            start = time.perf_counter()
+            rows = loading_sheet(attempts, bar_weight, inventory)
+            elapsed = time.perf_counter() - start
+
+            self.assertLess(elapsed, 0.5)
+            self.assertEqual(len(rows), 36)
+            self.assertTrue(all(row.achieved <= row.weight for row in rows))
+
+    def test_sheet_csv_streams_lines(self):
+        """Test the CSV header and a row with its plate change."""
+        rows = loading_sheet([Attempt("A", 135), Attempt("B", 155)], 45, {45: 1, 10: 1})
+        lines = list(sheet_csv(rows))
+        self.assertEqual(lines[0], "Order,Lifter,Attempt,Loaded,Plates (per side),Change (per side)\n")
+        self.assertEqual(lines[2], "2,B,155 lb,155 lb,\"45 lb x 1, 10 lb x 1\",Add 10 lb\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
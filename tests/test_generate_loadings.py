@@ -0,0 +1,77 @@
+"""Unit tests for the bulk loading chart CLI."""
+
+import csv
+import io
+import json
+import unittest
+
+from generate_loadings import generate, parse_percentages, parse_plates, process_row, write_sets
+from utils.plates import freeze_inventory
+
+
+PROGRAM = """athlete,one_rm,unit,percentages
+Alex,315,lb,50;70;90
+Sam,100,kg,60 80
+"""
+
+
+class TestGenerateLoadings(unittest.TestCase):
+    
+    def test_parse_percentages(self):
+        """Test the accepted percentage list formats."""
+        self.assertEqual(parse_percentages("50;60;70"), [50.0, 60.0, 70.0])
+        self.assertEqual(parse_percentages("50%, 60%"), [50.0, 60.0])
+        self.assertEqual(parse_percentages(""), [])
+    
+    def test_process_row(self):
+        """Test per-set loadings for one athlete."""
+        sets = process_row({"athlete": "Alex", "one_rm": "200", "unit": "lb", "percentages": "100"})
+        
+        self.assertEqual(len(sets), 1)
+        self.assertEqual(sets[0]["achieved"], 200.0)
+        self.assertEqual(sum(weight * count for weight, count in sets[0]["plates"]), 77.5)
+    
+    def test_stream_csv(self):
+        """Test streaming a program to CSV in input order."""
+        output = io.StringIO()
+        written = write_sets(generate(csv.DictReader(io.StringIO(PROGRAM))), output)
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        
+        self.assertEqual(written, 5)
+        self.assertEqual([row["athlete"] for row in rows], ["Alex"] * 3 + ["Sam"] * 2)
+        self.assertEqual(rows[3]["unit"], "kg")
+        self.assertEqual(rows[0]["plates"], "45x1 10x1")
+    
+    def test_bar_and_plates(self):
+        """Test a custom bar and inventory instead of the unit defaults."""
+        inventories = (("kg", freeze_inventory(parse_plates("25:1,10:2"))),)
+        sets = process_row({"one_rm": "100", "unit": "kg", "percentages": "100"}, bar_weight=15, inventories=inventories)
+        
+        self.assertEqual(sets[0]["achieved"], 85.0)
+        self.assertEqual(sets[0]["plates"], ((25.0, 1), (10.0, 1)))
+    
+    def test_bad_rows_keep_streaming(self):
+        """Test that a bad row is reported in the error column and later rows still run."""
+        program = "athlete,one_rm,unit,percentages\nAlex,heavy,lb,50\nSam,-5,kg,50\nKim,200,lb,100\n"
+        output = io.StringIO()
+        written = write_sets(generate(csv.DictReader(io.StringIO(program))), output)
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        
+        self.assertEqual(written, 3)
+        self.assertEqual([row["athlete"] for row in rows], ["Alex", "Sam", "Kim"])
+        self.assertIn("not a number", rows[0]["error"])
+        self.assertIn("non-negative", rows[1]["error"])
+        self.assertEqual((rows[2]["error"], rows[2]["achieved"]), ("", "200.0"))
+    
+    def test_stream_jsonl(self):
+        """Test JSONL output."""
+        output = io.StringIO()
+        write_sets(generate(csv.DictReader(io.StringIO(PROGRAM))), output, fmt="jsonl")
+        first = json.loads(output.getvalue().splitlines()[0])
+        
+        self.assertEqual(first["athlete"], "Alex")
+        self.assertEqual(first["plates"], [[45.0, 1], [10.0, 1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for minimal-change warm-up ladders."""
+
+import itertools
+import random
+import time
+import unittest
+
+from utils.catalog import get_catalog
+from utils.ladder import MAX_TOLERANCE, plate_moves, solve_stacks, warmup_ladder
+
+
+def _all_stacks(target, bar_weight, inventory, tolerance):
+    """Every per-side stack within tolerance, else every stack of the closest load under target."""
+    weights = sorted(inventory, reverse=True)
+    loads = {}
+    for counts in itertools.product(*(range(inventory[weight] + 1) for weight in weights)):
+        stack = tuple(weight for weight, used in zip(weights, counts) for _ in range(used))
+        loads.setdefault(sum(stack), []).append(stack)
+    per_side = (target - bar_weight) / 2
+    within = [stack for total, stacks in loads.items() if abs(total - per_side) * 2 <= tolerance for stack in stacks]
+    if within:
+        return within
+    return loads[max(total for total in loads if total <= max(per_side, 0))]
+
+
+def _brute_force_moves(targets, bar_weight, inventory, tolerance):
+    """Fewest moves over every sequence of stacks, enumerated without the solver's candidate pruning."""
+    layers = [_all_stacks(target, bar_weight, inventory, tolerance) for target in targets]
+    best = float("inf")
+    for path in itertools.product(*layers):
+        moves, previous = 0, ()
+        for stack in path:
+            strip, add = plate_moves(previous, stack)
+            moves += len(strip) + len(add)
+            previous = stack
+        best = min(best, moves)
+    return best
+
+
+class TestWarmupLadder(unittest.TestCase):
+
+    def test_plate_moves_strip_outer_plates(self):
+        """Test that changes strip from the outside in and keep the shared inner plates."""
+        strip, add = plate_moves((45, 25, 10), (45, 35))
+        self.assertEqual(strip, (10, 25))
+        self.assertEqual(add, (35,))
+
+    def test_loads_stay_within_tolerance(self):
+        """Test that every set of the default ramp lands within tolerance of its target."""
+        inventory = {45: 2, 35: 2, 25: 2, 15: 2, 10: 2, 5: 2, 2.5: 2}
+        ladder = warmup_ladder(315, 45, inventory, tolerance=5)
+        self.assertEqual([step.percent for step in ladder.steps], [40, 50, 60, 70, 80, 90, 100])
+        for step in ladder.steps:
+            self.assertLessEqual(abs(step.achieved - step.target), 5)
+        self.assertEqual(ladder.steps[-1].achieved, 315)
+        self.assertEqual(ladder.total_moves, sum(step.moves for step in ladder.steps))
+
+    def test_prefers_adding_to_restacking(self):
+        """Test that a ladder is built by adding plates when the loads allow it."""
+        # 135 -> 185 -> 225 can be loaded by only ever adding plates
+        ladder = warmup_ladder(225, 45, {45: 1, 25: 1, 10: 2}, percentages=[60, 82.2222, 100], tolerance=0.5)
+        self.assertEqual([step.achieved for step in ladder.steps], [135, 185, 225])
+        self.assertEqual(ladder.steps[-1].plates, [(45, 1), (25, 1), (10, 2)])
+        self.assertEqual(ladder.total_moves, 4)
+        self.assertTrue(all(not step.strip for step in ladder.steps))
+
+    def test_short_inventory_falls_back_under_target(self):
+        """Test that an out-of-reach set takes the closest load under target."""
+        ladder = warmup_ladder(405, 45, {45: 2, 25: 1}, percentages=[100], tolerance=5)
+        self.assertEqual(ladder.steps[0].achieved, 275)
+        self.assertEqual(ladder.steps[0].plates, [(45, 2), (25, 1)])
+
+    def test_matches_brute_force(self):
+        """Test against every stack sequence, including several pairs a plate where the candidate caps apply."""
+        rng = random.Random(7)
+        plates = [45, 35, 25, 10, 5, 2.5]
+        for types, pairs, cases in [(4, 2, 25), (5, 5, 10)]:
+            for _ in range(cases):
+                inventory = {plate: rng.randint(0, pairs) for plate in rng.sample(plates, types)}
+                top = rng.choice(range(135, 320, 5))
+                percentages = sorted(rng.sample(range(40, 101, 5), 3))
+                ladder = warmup_ladder(top, 45, inventory, percentages=percentages, tolerance=10)
+                targets = [top * pct / 100 for pct in percentages]
+                self.assertEqual(ladder.total_moves, _brute_force_moves(targets, 45, inventory, 10))
+
+    def test_wide_tolerance_with_many_pairs_stays_fast(self):
+        """Test cold solves at the widest allowed miss with change plates at 4 and 8 pairs each."""
+        for catalog_id, pairs, top, bar_weight in [("bumper_change_kg", 4, 180, 20), ("iron_change_lb", 8, 405, 45)]:
+            catalog = get_catalog(catalog_id)
+            inventory = catalog.to_weights({plate.id: pairs for plate in catalog.plates})
+            solve_stacks.cache_clear()
+            start = time.perf_counter()
+            ladder = warmup_ladder(top, bar_weight, inventory, tolerance=MAX_TOLERANCE[catalog.unit], unit=catalog.unit)
+            elapsed = time.perf_counter() - start
+
+            self.assertLess(elapsed, 0.5)
+            for step in ladder.steps:
+                self.assertLessEqual(abs(step.achieved - step.target), MAX_TOLERANCE[catalog.unit])
+
+
+if __name__ == "__main__":
+    unittest.main()
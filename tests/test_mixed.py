@@ -0,0 +1,98 @@
+"""Unit tests for mixed-unit plate packing."""
+
+import itertools
+import random
+import unittest
+from unittest import mock
+
+from utils import mixed, service
+from utils.catalog import get_default_catalog
+from utils.mixed import GRID_PER_QUARTER, MixedIndex, format_mixed_stack, pack_mixed, split_inventory, to_grid
+from utils.units import Weight, format_dual_weight
+
+
+def _brute_force(target_per_side, inventory, unit, prefer_over):
+    """Closest per-side grid total over every combination of the inventory."""
+    keys = list(inventory)
+    totals = [
+        sum(Weight.of(weight).quarters * GRID_PER_QUARTER[plate_unit] * used for (weight, plate_unit), used in zip(keys, counts))
+        for counts in itertools.product(*(range(inventory[key] + 1) for key in keys))
+    ]
+    if prefer_over:
+        over = [total for total in totals if total >= to_grid(target_per_side, unit, up=True)]
+        if over:
+            return min(over)
+    return max(total for total in totals if total <= to_grid(target_per_side, unit))
+
+
+class TestMixedPacking(unittest.TestCase):
+
+    def test_grid_is_exact(self):
+        """Test that both units land on whole grid units."""
+        self.assertEqual(to_grid(1, "lb"), to_grid(0.45359237, "kg"))
+        self.assertEqual(to_grid(0.25, "lb"), 45359237)
+        self.assertEqual(to_grid(0.25, "kg"), 100000000)
+        self.assertEqual(to_grid(0.1, "kg"), to_grid(0.1, "kg", up=True))
+
+    def test_kg_plates_on_lb_bar(self):
+        """Test that kg plates fill in where lb plates run short."""
+        inventory = {(45, "lb"): 1, (20, "kg"): 1, (2.5, "lb"): 2}
+        load, delta = pack_mixed(90, inventory, "lb")
+
+        self.assertEqual(load.plates, [(45, "lb", 1), (20, "kg", 1)])
+        self.assertAlmostEqual(load.weight("lb"), 45 + 20 / 0.45359237)
+        self.assertAlmostEqual(load.weight("kg"), 45 * 0.45359237 + 20)
+        self.assertAlmostEqual(delta, load.weight("lb") - 90)
+
+    def test_matches_brute_force(self):
+        """Test random mixed inventories against every combination."""
+        rng = random.Random(5)
+        for _ in range(60):
+            inventory = {(weight, "lb"): rng.randint(0, 2) for weight in rng.sample([45, 35, 25, 10, 5, 2.5], 3)}
+            inventory.update({(weight, "kg"): rng.randint(0, 2) for weight in rng.sample([25, 20, 15, 10, 5, 2.5, 1.25], 3)})
+            unit = rng.choice(["lb", "kg"])
+            target = round(rng.uniform(0, 150), 2)
+            prefer_over = rng.random() < 0.5
+            load, _ = pack_mixed(target, inventory, unit, prefer_over)
+            self.assertEqual(load.grid, _brute_force(target, inventory, unit, prefer_over))
+
+    def test_table_and_scan_agree(self):
+        """Test that the sorted-table lookup and the scan used for large inventories give the same loads."""
+        lb, kg = get_default_catalog("lb"), get_default_catalog("kg")
+        inventory = split_inventory({**lb.to_mixed(lb.default_inventory()), **kg.to_mixed(kg.default_inventory())})
+        table = MixedIndex(inventory)
+        with mock.patch.object(mixed, "MAX_TABLE", 0):
+            scan = MixedIndex(inventory)
+
+        self.assertIsNotNone(table._table)
+        self.assertIsNone(scan._table)
+        for target in [0, 0.3, 17.5, 44.1, 101.25, 180, 400]:
+            for unit in ("lb", "kg"):
+                for prefer_over in (False, True):
+                    self.assertEqual(table.pack(target, unit, prefer_over), scan.pack(target, unit, prefer_over))
+
+    def test_reuses_single_unit_tables(self):
+        """Test that a mixed inventory splits into the single-unit solver inputs."""
+        lb, kg = get_default_catalog("lb"), get_default_catalog("kg")
+        inventory = {**lb.to_mixed(lb.default_inventory()), **kg.to_mixed(kg.default_inventory())}
+        frozen_lb, frozen_kg = split_inventory(inventory)
+
+        self.assertEqual(dict(frozen_lb), lb.to_weights(lb.default_inventory()))
+        self.assertEqual(dict(frozen_kg), kg.to_weights(kg.default_inventory()))
+        with self.assertRaises(ValueError):
+            split_inventory({(10, "st"): 1})
+
+    def test_service_setup_in_both_units(self):
+        """Test a cached mixed setup and its dual-unit display."""
+        service.SETUP_CACHE.clear()
+        setup = service.mixed_barbell_setup(60, 20, {(45, "lb"): 1, (10, "kg"): 2}, "kg")
+
+        self.assertEqual(setup.plates, ((10, "kg", 2),))
+        self.assertEqual(setup.achieved_total, 60)
+        self.assertEqual(format_mixed_stack(list(setup.plates)), "10 kg x 2")
+        self.assertEqual(format_dual_weight(setup.achieved_total, "kg"), "60 kg (132.3 lb)")
+        self.assertIs(service.mixed_barbell_setup(60, 20, {(45, "lb"): 1, (10, "kg"): 2}, "kg"), setup)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
 """Unit tests for plate packing algorithm."""
 
+import itertools
 import unittest
-from utils.plates import pack_plates
+from utils.catalog import CATALOGS
+from utils.plates import (
+    pack_plates, pack_plates_batch, format_plate_stack, freeze_inventory, get_plate_index, stack_thickness
+)
 
 
 class TestPlatePacking(unittest.TestCase):
@@ -17,7 +21,7 @@ class TestPlatePacking(unittest.TestCase):
         }
     
     def test_225_lb_standard_plates(self):
-        """Test 225 lb with standard plates (should be 45+45+5+2.5 per side)."""
+        """Test 225 lb with standard plates (should be 45+45 per side)."""
         # 225 total - 45 bar = 180 plate weight = 90 per side
         target_per_side = 90.0
         plates, achieved, delta = pack_plates(target_per_side, self.standard_lb_plates)
@@ -26,8 +30,8 @@ class TestPlatePacking(unittest.TestCase):
         self.assertEqual(achieved, 90.0)
         self.assertEqual(delta, 0.0)
         
-        # Should use 2x45, 1x5, 1x2.5 per side
-        expected_plates = [(45, 2), (5, 1), (2.5, 1)]
+        # Should use 2x45 per side
+        expected_plates = [(45, 2)]
         self.assertEqual(plates, expected_plates)
     
     def test_315_lb_standard_plates(self):
@@ -93,6 +97,145 @@ class TestPlatePacking(unittest.TestCase):
         total_weight = sum(weight * count for weight, count in plates)
         self.assertEqual(total_weight, achieved)
 
+    
+    def test_fewest_plates_tiebreak(self):
+        """Test that exact loads use the fewest plates available."""
+        plates, achieved, delta = pack_plates(50.0, {25: 2, 10: 5, 5: 10})
+        
+        self.assertEqual(plates, [(25, 2)])
+        self.assertEqual(delta, 0.0)
+    
+    def test_inventory_limits_respected(self):
+        """Test that no plate is used more often than it is available."""
+        plates, achieved, delta = pack_plates(100.0, {45: 1, 25: 1, 10: 4})
+        
+        self.assertEqual(achieved, 100.0)
+        self.assertEqual(plates, [(45, 1), (25, 1), (10, 3)])
+    
+    def test_format_plate_stack(self):
+        """Test single-line per-side formatting."""
+        self.assertEqual(format_plate_stack([(45, 2), (2.5, 1)], "lb"), "45 lb x 2, 2.5 lb x 1")
+        self.assertEqual(format_plate_stack([], "kg"), "No plates needed")
+
+
+
+class TestPlateIndex(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.plates = {45: 2, 25: 1, 10: 1, 5: 0}
+    
+    def test_freeze_inventory(self):
+        """Test that equivalent inventories share one canonical key."""
+        self.assertEqual(freeze_inventory(self.plates), ((45, 2), (25, 1), (10, 1)))
+        self.assertEqual(freeze_inventory(self.plates), freeze_inventory({10: 1, 25: 1, 45: 2}))
+    
+    def test_index_is_shared(self):
+        """Test that the same inventory reuses the same index."""
+        self.assertIs(get_plate_index(self.plates), get_plate_index(dict(self.plates)))
+    
+    def test_exact_lookup(self):
+        """Test exact lookups for reachable and unreachable totals."""
+        index = get_plate_index(self.plates)
+        
+        self.assertEqual(index.exact(70.0), [(45, 1), (25, 1)])
+        self.assertIsNone(index.exact(72.5))
+    
+    def test_nearest_lookups(self):
+        """Test nearest under/over lookups and the out-of-reach case."""
+        index = get_plate_index(self.plates)
+        
+        self.assertEqual(index.nearest_under(52.0), ([(45, 1)], 45.0))
+        self.assertEqual(index.nearest_over(52.0), ([(45, 1), (10, 1)], 55.0))
+        self.assertIsNone(index.nearest_over(200.0))
+
+    
+    def test_batch_matches_single_calls(self):
+        """Test that batched packing agrees with per-target packing."""
+        targets = [0.0, 12.5, 47.0, 70.0, 200.0]
+        for prefer_over in (False, True):
+            batch = pack_plates_batch(targets, self.plates, prefer_over)
+            for row, target in enumerate(targets):
+                plates, achieved, delta = pack_plates(target, self.plates, prefer_over)
+                self.assertEqual(batch.plates[row], plates)
+                self.assertEqual(batch.achieved[row], achieved)
+                self.assertEqual(batch.delta[row], delta)
+
+
+class TestSleeveFit(unittest.TestCase):
+    
+    def setUp(self):
+        """Bumpers with change plates, enough of each to overfill the sleeve."""
+        catalog = CATALOGS["bumper_change_kg"]
+        self.thickness = catalog.thickness()
+        self.inventory = {25: 4, 20: 2, 10: 2, 2.5: 2, 1.25: 1, 0.5: 1}
+    
+    def _brute_force(self, target, sleeve):
+        """Closest fitting load at or under target, then fewest plates, by enumeration."""
+        weights = sorted(self.inventory, reverse=True)
+        best = None
+        for counts in itertools.product(*(range(self.inventory[w] + 1) for w in weights)):
+            total = sum(w * c for w, c in zip(weights, counts))
+            width = sum(self.thickness[w] * c for w, c in zip(weights, counts))
+            if total <= target and width <= sleeve:
+                key = (total, -sum(counts))
+                if best is None or key > best:
+                    best = key
+        return best[0], -best[1]
+    
+    def test_matches_brute_force(self):
+        """Test closest fit, then fewest plates, against exhaustive enumeration."""
+        for sleeve in (150, 250, 415):
+            for target in (0, 24, 50, 61.25, 100, 127.5, 150, 200):
+                plates, achieved, _ = pack_plates(target, self.inventory, sleeve_length=sleeve, thickness=self.thickness)
+                expected_total, expected_plates = self._brute_force(target, sleeve)
+                
+                self.assertEqual(achieved, expected_total, (sleeve, target))
+                self.assertEqual(sum(count for _, count in plates), expected_plates, (sleeve, target))
+                self.assertLessEqual(stack_thickness(plates, self.thickness), sleeve)
+    
+    def test_sleeve_limits_heaviest_load(self):
+        """Test that six 25 kg bumpers fill a 415 mm sleeve."""
+        plates, achieved, _ = pack_plates(200, {25: 10}, sleeve_length=415, thickness=self.thickness)
+        
+        self.assertEqual(plates, [(25, 6)])
+        self.assertEqual(achieved, 150)
+    
+    def test_prefers_thinner_plates_when_sleeve_is_short(self):
+        """Test that a thinner, larger combination wins when the fewest-plates one does not fit."""
+        inventory = {25: 2, 20: 1, 10: 2, 5: 2}
+        thickness = {25: 67, 20: 54, 10: 31, 5: 27}
+        # 45 per side: 25+20 is 121 mm, 25+10+10 is 129 mm; allow only 125 mm
+        plates, achieved, _ = pack_plates(45, inventory, sleeve_length=125, thickness=thickness)
+        
+        self.assertEqual(achieved, 45)
+        self.assertEqual(plates, [(25, 1), (20, 1)])
+        plates, achieved, _ = pack_plates(45, {25: 2, 10: 2, 5: 2}, sleeve_length=125, thickness=thickness)
+        self.assertEqual(achieved, 40)
+    
+    def test_equal_counts_keep_heavier_plates(self):
+        """Test that ties in plate count still go to the heavier plates, as without a sleeve."""
+        inventory = {2.5: 3, 0.75: 3, 0.5: 5, 0.25: 1}
+        thickness = {2.5: 3.4, 0.75: 2.4, 0.5: 7.1, 0.25: 5.4}
+        for target in (1, 1.75, 3.5):
+            self.assertEqual(
+                pack_plates(target, inventory, sleeve_length=37.9, thickness=thickness),
+                pack_plates(target, inventory)
+            )
+    
+    def test_unconstrained_when_everything_fits(self):
+        """Test that a sleeve longer than the whole inventory changes nothing."""
+        for target in (0, 37.5, 61.25, 99):
+            self.assertEqual(
+                pack_plates(target, self.inventory, sleeve_length=10000, thickness=self.thickness),
+                pack_plates(target, self.inventory)
+            )
+    
+    def test_missing_thickness(self):
+        """Test that every plate needs a thickness."""
+        with self.assertRaises(ValueError):
+            pack_plates(50, {25: 2, 7: 1}, sleeve_length=415, thickness={25: 67})
+
 
 if __name__ == "__main__":
     unittest.main()
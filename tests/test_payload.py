@@ -0,0 +1,83 @@
+"""Unit tests for per-run payload accounting and page budgets."""
+
+import os
+import unittest
+from unittest import mock
+
+from utils import payload
+from utils.plates import render_loadout
+
+
+class TestPayloadMeter(unittest.TestCase):
+    
+    def setUp(self):
+        """Start each test with no recorded runs."""
+        payload.reset()
+    
+    def test_nested_runs(self):
+        """Test that fragment bytes count toward the enclosing page run as well."""
+        payload.start_page("app")
+        payload.measure("inject_theme", "x" * 100)
+        payload.start_page("app:barbell_builder")
+        payload.measure("plates", "é" * 10)
+        fragment = payload.finish_page()
+        page = payload.finish_page()
+        
+        self.assertEqual(fragment.by_source, {"plates": 20})
+        self.assertEqual(page.total, 120)
+        self.assertEqual(page.by_source, {"inject_theme": 100, "plates": 20})
+    
+    def test_new_page_run_drops_unfinished_runs(self):
+        """Test that a run cut short by a rerun does not leak into the next one."""
+        payload.start_page("app")
+        payload.measure("branding", "x" * 50)
+        payload.start_page("app")
+        payload.measure("branding", "x" * 10)
+        
+        self.assertEqual(payload.finish_page().total, 10)
+        self.assertIsNone(payload.finish_page())
+    
+    def test_page_stats(self):
+        """Test aggregation across runs of one page."""
+        for size in (100, 300):
+            payload.start_page("percent_calculator")
+            payload.measure("branding", "x" * size)
+            payload.finish_page()
+        
+        stats = payload.page_stats("percent_calculator")[0]
+        self.assertEqual((stats.runs, stats.last, stats.mean, stats.max), (2, 300, 200, 300))
+        self.assertEqual(stats.by_source, {"branding": 200})
+        self.assertEqual(stats.budget, payload.PAGE_BUDGETS["percent_calculator"])
+    
+    def test_over_budget_warns_or_raises(self):
+        """Test that over-budget runs log a warning, or raise in strict mode."""
+        with mock.patch.dict(os.environ, {"FORTRESS_PAYLOAD_STRICT": ""}):
+            payload.start_page("app")
+            payload.measure("inject_theme", "x" * (payload.PAGE_BUDGETS["app"] + 1))
+            with self.assertLogs("fortress.payload", level="WARNING"):
+                self.assertTrue(payload.finish_page().over_budget)
+        
+        with mock.patch.dict(os.environ, {"FORTRESS_PAYLOAD_STRICT": "1"}):
+            payload.start_page("app")
+            payload.measure("inject_theme", "x" * (payload.PAGE_BUDGETS["app"] + 1))
+            with self.assertRaises(payload.PayloadBudgetError):
+                payload.finish_page()
+
+
+class TestViewBudgets(unittest.TestCase):
+    
+    def setUp(self):
+        """Start each test with no recorded runs."""
+        payload.reset()
+    
+    def test_tap_to_build_fragment_within_budget(self):
+        """Test that a heavy tap-to-build loadout fits the fragment budget."""
+        pair_counts = {45: 6, 35: 1, 25: 1, 10: 1, 5: 1, 2.5: 1, 1: 1}
+        payload.start_page("app:barbell_builder")
+        payload.measure("plates", render_loadout(45, pair_counts)[0])
+        
+        self.assertFalse(payload.finish_page().over_budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
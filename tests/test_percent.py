@@ -0,0 +1,78 @@
+"""Unit tests for percent tables and their lightweight columnar output."""
+
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from utils.percent import PERCENTAGES, ROUNDING_OPTIONS, percent_rows, table_csv
+from utils.units import ROUNDING_INCREMENTS, format_weight
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestPercentTable(unittest.TestCase):
+    
+    def test_rows(self):
+        """Test exact and rounded weights for each percentage."""
+        rows = percent_rows(225, "Nearest 1.0", "lb", [50, 85])
+        
+        self.assertEqual([(r.percent, r.weight, r.rounded) for r in rows], [(50, 112.5, 112.0), (85, 191.25, 191.0)])
+    
+    def test_rounding_ties_go_to_even(self):
+        """Test the half-to-even rule the browser table mirrors, for every option."""
+        self.assertEqual(ROUNDING_OPTIONS, list(ROUNDING_INCREMENTS))
+        rows = percent_rows(5, "Nearest 1.0", "lb", [50, 70])
+        self.assertEqual([r.rounded for r in rows], [2, 4])
+        # 0.75 rounds up and 1.25 down, both to 1.0
+        self.assertEqual(percent_rows(3, "Nearest 0.5", "lb", [25])[0].rounded, 1.0)
+        self.assertEqual(percent_rows(5, "Nearest 0.5", "lb", [25])[0].rounded, 1.0)
+    
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_browser_table_matches_python(self):
+        """Test that the component's rounding and formatting agree with the fallback table, ties included."""
+        bases = [105, 2.5, 7.5, 101.25, 102.5, 0.125] + [quarters / 4 for quarters in range(0, 1201, 7)]
+        script = (
+            "const f = require(process.argv[1]); const cases = JSON.parse(require('fs').readFileSync(0, 'utf8'));"
+            "console.log(JSON.stringify(cases.map(([base, pct, step]) => f.formatNumber(f.roundTo(base * (pct / 100), step)))));"
+        )
+        cases = [(base, pct, ROUNDING_INCREMENTS[label]) for base in bases for pct in PERCENTAGES for label in ROUNDING_OPTIONS]
+        result = subprocess.run(
+            ["node", "-e", script, str(ROOT / "components" / "percent_table" / "format.js")],
+            input=json.dumps(cases), capture_output=True, text=True, check=True
+        )
+        expected = [
+            format_weight(row.rounded, "lb")[:-3]
+            for base in bases for pct in PERCENTAGES for label in ROUNDING_OPTIONS
+            for row in percent_rows(base, label, "lb", [pct])
+        ]
+        
+        self.assertEqual(json.loads(result.stdout), expected)
+        # 105 x 5% = 5.25 and 2.5 x 5% = 0.125 are exact ties
+        self.assertIn("5.25", expected)
+        self.assertEqual(format_weight(0.125, "lb"), "0.12 lb")
+    
+    def test_table_csv(self):
+        """Test CSV output of a column-oriented table, quoting included."""
+        table = {"Percent": ["50%", "60%"], "Plates (per side)": ["45 lb x 1, 10 lb x 1", "Bar only"]}
+        
+        self.assertEqual(
+            table_csv(table),
+            'Percent,Plates (per side)\n50%,"45 lb x 1, 10 lb x 1"\n60%,Bar only\n'
+        )
+    
+    def test_core_modules_do_not_import_heavy_packages(self):
+        """Test that the shared logic stays free of pandas and numpy at import time."""
+        code = (
+            "import sys, utils.plates, utils.percent, utils.chart, utils.payload, utils.profiling, api, generate_loadings; "
+            "print(','.join(m for m in ('pandas', 'numpy', 'multiprocessing.pool') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        
+        self.assertEqual(result.stdout.strip(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unit tests for the multi-bar planner."""
+
+import itertools
+import random
+import unittest
+
+from utils.planner import plan_bars
+
+
+def _brute_force_deviation(targets, bar_weight, inventory):
+    """Smallest total shortfall over every way to split the inventory between bars."""
+    weights = sorted(inventory, reverse=True)
+    options = []
+    for target in targets:
+        per_side = max(target - bar_weight, 0) / 2
+        loads = []
+        for counts in itertools.product(*(range(inventory[w] + 1) for w in weights)):
+            total = sum(w * c for w, c in zip(weights, counts))
+            if total <= per_side:
+                loads.append((counts, per_side - total))
+        options.append(loads)
+    
+    best = [float("inf")]
+    
+    def search(bar, remaining, deviation):
+        if deviation >= best[0]:
+            return
+        if bar == len(targets):
+            best[0] = deviation
+            return
+        for counts, short in options[bar]:
+            if all(c <= r for c, r in zip(counts, remaining)):
+                search(bar + 1, tuple(r - c for r, c in zip(remaining, counts)), deviation + short * 2)
+    
+    search(0, tuple(inventory[w] for w in weights), 0.0)
+    return best[0]
+
+
+class TestPlanBars(unittest.TestCase):
+    
+    def test_ample_inventory_gives_ideal_loads(self):
+        """Test that every bar is on target when the tree has enough plates."""
+        plan = plan_bars([225, 185, 135, 315], 45, {45: 8, 25: 4, 20: 0, 10: 4, 5: 4, 2.5: 4})
+        
+        self.assertEqual([bar.achieved for bar in plan.bars], [225, 185, 135, 315])
+        self.assertEqual(plan.short, [])
+        self.assertEqual(plan.bars[1].plates, [(45, 1), (25, 1)])
+        self.assertEqual(plan.leftover, {45: 1, 25: 3, 10: 4, 5: 4, 2.5: 4})
+    
+    def test_shared_plates_are_reallocated(self):
+        """Test that a bar gives up a plate another bar cannot replace."""
+        # Ideal loads both want the only 25; the 285 bar can use 10s instead
+        plan = plan_bars([285, 95], 45, {45: 3, 25: 1, 10: 3, 5: 1})
+        
+        self.assertEqual(plan.total_deviation, 0)
+        self.assertEqual(plan.bars[1].plates, [(25, 1)])
+    
+    def test_reports_short_bars(self):
+        """Test that bars the tree cannot fill are reported, with the plates never over-used."""
+        inventory = {45: 1, 25: 1}
+        plan = plan_bars([135, 135, 95], 45, inventory)
+        
+        # One 135 gets the 45; the 25 closes 40 on the other 135 or 50 on the 95
+        self.assertEqual(plan.total_deviation, 90)
+        self.assertEqual(len(plan.short), 2)
+        used = {}
+        for bar in plan.bars:
+            for weight, count in bar.plates:
+                used[weight] = used.get(weight, 0) + count
+        self.assertTrue(all(used[w] <= inventory[w] for w in used))
+    
+    def test_matches_brute_force(self):
+        """Test total deviation against exhaustive search on small classes."""
+        rng = random.Random(3)
+        for _ in range(40):
+            inventory = {w: rng.randint(0, 2) for w in (45, 25, 10, 5, 2.5)}
+            targets = [rng.randrange(95, 320, 5) for _ in range(rng.randint(2, 3))]
+            
+            plan = plan_bars(targets, 45, inventory)
+            self.assertAlmostEqual(plan.total_deviation, _brute_force_deviation(targets, 45, inventory),
+                                   msg=f"{targets} {inventory}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Unit tests for opt-in rerun timing."""
+
+import io
+import json
+import os
+import unittest
+from unittest import mock
+
+from utils import profiling
+
+
+class TestProfiling(unittest.TestCase):
+    
+    def setUp(self):
+        """Start each test with empty timing windows."""
+        profiling.reset()
+    
+    def test_disabled_by_default(self):
+        """Test that profiling is off without the env var and records nothing."""
+        with mock.patch.dict(os.environ, {"FORTRESS_PROFILE": ""}):
+            profiler = profiling.start_run("app")
+        with profiler.phase("inject_theme"):
+            pass
+        profiler.finish()
+        
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(profiling.phase_stats(), [])
+    
+    def test_env_var_enables_and_logs(self):
+        """Test that an enabled run records phases and logs one JSON line."""
+        with mock.patch.dict(os.environ, {"FORTRESS_PROFILE": "1"}):
+            profiler = profiling.start_run("app")
+        with profiler.phase("computation"):
+            pass
+        with profiler.phase("computation"):
+            pass
+        with self.assertLogs("fortress.profile", level="INFO") as logs:
+            profiler.finish()
+        
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line["script"], "app")
+        self.assertEqual(list(line["phases_ms"]), ["computation"])
+        self.assertEqual({s.phase for s in profiling.phase_stats("app")}, {"computation", "total"})
+    
+    def test_logs_reach_stderr_without_configuration(self):
+        """Test that enabling profiling attaches a stderr handler when logging is unconfigured."""
+        root = profiling.logging.getLogger()
+        with mock.patch.object(root, "handlers", []), \
+                mock.patch.object(profiling.logger, "handlers", []), \
+                mock.patch.object(profiling.logger, "level", profiling.logging.NOTSET), \
+                mock.patch.object(profiling.sys, "stderr", io.StringIO()) as stderr:
+            with mock.patch.dict(os.environ, {"FORTRESS_PROFILE": "1"}):
+                profiler = profiling.start_run("app")
+            profiler.finish()
+        
+        self.assertEqual(json.loads(stderr.getvalue())["script"], "app")
+    
+    def test_rolling_percentiles(self):
+        """Test p50/p95 over a bounded window."""
+        for ms in range(1, 101):
+            profiling.record("app", "rendering", float(ms))
+        for _ in range(profiling.WINDOW + 50):
+            profiling.record("page", "rendering", 5.0)
+        
+        app_stats = profiling.phase_stats("app")[0]
+        self.assertEqual(app_stats.runs, 100)
+        self.assertEqual(app_stats.p50, 51.0)
+        self.assertEqual(app_stats.p95, 95.0)
+        self.assertEqual(profiling.phase_stats("page")[0].runs, profiling.WINDOW)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Unit tests for barbell rendering."""
+
+import unittest
+from utils.cache import LRUCache
+from utils.plates import DEFAULT_PLATE_COLOR, RENDER_CACHE, generate_barbell_svg, generate_barbell_visualization, loadout_key, render_loadout
+
+
+class TestBarbellSvg(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pair_counts = {45: 3, 25: 1, 10: 2, 2.5: 1, 5: 0}
+    
+    def test_one_pattern_and_run_per_plate_type(self):
+        """Test that each plate type is defined once and each run drawn once."""
+        svg = generate_barbell_svg(45, self.pair_counts)
+        
+        self.assertEqual(svg.count("<pattern "), 4)
+        self.assertEqual(svg.count('fill="url(#'), 4)
+        self.assertEqual(svg.count("<use "), 2)
+    
+    def test_smaller_than_inline_html(self):
+        """Test that the SVG is smaller than the inline-styled HTML."""
+        svg = generate_barbell_svg(45, self.pair_counts)
+        html = generate_barbell_visualization(45, self.pair_counts)
+        
+        self.assertLess(len(svg), len(html) // 2)
+    
+    def test_empty_bar(self):
+        """Test rendering a bar with no plates."""
+        svg = generate_barbell_svg(45, {})
+        
+        self.assertNotIn("<use ", svg)
+        self.assertIn('viewBox="0 0 220 84"', svg)
+    
+    def test_kg_plates(self):
+        """Test that kg plates use the kg palette."""
+        svg = generate_barbell_svg(20, {25: 1, 1.25: 1}, unit="kg")
+        
+        self.assertIn("#DC2626", svg)
+        self.assertIn("#C0C0C0", svg)
+        self.assertIn("#DC2626", generate_barbell_visualization(20, {25: 1, 20: 1, 1.25: 1}, unit="kg"))
+        self.assertIn(DEFAULT_PLATE_COLOR, generate_barbell_visualization(20, {0.3: 1}, unit="kg"))
+
+
+
+class TestRenderCache(unittest.TestCase):
+    
+    def setUp(self):
+        """Start each test from an empty shared cache."""
+        RENDER_CACHE.clear()
+    
+    def test_canonical_key(self):
+        """Test that equivalent loadouts share one key."""
+        self.assertEqual(
+            loadout_key(45, {45: 2, 2.5: 1, 10: 0}),
+            loadout_key(45.0, {2.5: 1, 45: 2})
+        )
+    
+    def test_hits_and_misses(self):
+        """Test that repeated loadouts are served from the cache."""
+        first = render_loadout(45, {45: 2, 10: 1})
+        second = render_loadout(45.0, {10: 1, 45: 2, 5: 0})
+        
+        self.assertIs(first, second)
+        self.assertEqual(first[1], "45 x 2\n10 x 1")
+        stats = RENDER_CACHE.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = LRUCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 0)
+        cache.get_or_compute("c", lambda: 3)
+        
+        self.assertEqual(cache.get_or_compute("a", lambda: 0), 1)
+        self.assertEqual(cache.get_or_compute("b", lambda: 0), 0)
+        self.assertEqual(cache.stats().evictions, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
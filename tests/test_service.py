@@ -0,0 +1,76 @@
+"""Unit tests for the shared calculation service."""
+
+import unittest
+
+from utils import service
+from utils.units import Weight
+
+
+class TestBarbellSetup(unittest.TestCase):
+    
+    def setUp(self):
+        """Start each test with empty service caches."""
+        service.SETUP_CACHE.clear()
+        service.PERCENT_CACHE.clear()
+    
+    def test_collars_and_inventory(self):
+        """Test a loading that accounts for collars against a limited inventory."""
+        setup = service.barbell_setup(230, 45, {45: 1, 25: 1, 10: 1}, collar_weight=5)
+        
+        self.assertEqual(setup.plates, ((45, 1), (25, 1), (10, 1)))
+        self.assertEqual(setup.achieved_total, 210)
+        self.assertEqual(setup.delta_total, -20)
+        self.assertFalse(setup.exact)
+    
+    def test_unlimited_standard_plates(self):
+        """Test that no inventory means as many standard plates as needed."""
+        setup = service.barbell_setup(675, 45)
+        
+        self.assertEqual(setup.plates, ((45, 7),))
+        self.assertTrue(setup.exact)
+    
+    def test_sleeve_fit(self):
+        """Test that a short sleeve limits the load and is part of the cache key."""
+        thickness = {25: 67, 20: 54}
+        free = service.barbell_setup(220, 20, {25: 4, 20: 2}, unit="kg")
+        fitted = service.barbell_setup(220, 20, {25: 4, 20: 2}, unit="kg", sleeve_length=150, thickness=thickness)
+        
+        self.assertEqual(free.achieved_total, 220)
+        self.assertEqual(fitted.plates, ((25, 2),))
+        self.assertEqual(fitted.achieved_total, 120)
+    
+    def test_equivalent_requests_share_one_entry(self):
+        """Test that float and Weight keys, and unsorted inventories, hit the same cache entry."""
+        first = service.barbell_setup(225.0, 45.0, {45: 2, 25: 2, 10: 0})
+        second = service.barbell_setup(225, 45, {Weight.of(25): 2, Weight.of(45): 2})
+        
+        self.assertIs(first, second)
+        self.assertEqual(service.SETUP_CACHE.stats().misses, 1)
+
+
+class TestPercentTable(unittest.TestCase):
+    
+    def setUp(self):
+        """Start each test with empty service caches."""
+        service.PERCENT_CACHE.clear()
+    
+    def test_rows_only(self):
+        """Test a table without a bar has no loadings."""
+        table = service.percent_table(315, "Nearest 1.0", "lb")
+        
+        self.assertEqual(len(table.rows), 21)
+        self.assertIsNone(table.loadings)
+    
+    def test_loadings_cached(self):
+        """Test per-row loadings and that a repeat request is served from cache."""
+        inventory = {45: 4, 25: 2, 10: 2, 5: 2, 2.5: 2}
+        table = service.percent_table(315, "Nearest 1.0", "lb", 45, inventory)
+        again = service.percent_table(315.0, "Nearest 1.0", "lb", 45.0, dict(inventory))
+        
+        self.assertIs(table, again)
+        self.assertEqual(table.loadings[-1].achieved, 315)
+        self.assertEqual(service.PERCENT_CACHE.stats().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
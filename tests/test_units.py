@@ -0,0 +1,49 @@
+"""Unit tests for unit conversion and the fixed-point weight type."""
+
+import unittest
+from utils.units import Weight, get_default_plates, format_weight
+
+
+class TestWeight(unittest.TestCase):
+    
+    def test_snaps_to_quarter_units(self):
+        """Test construction from floats and ints."""
+        self.assertEqual(Weight.of(2.5).quarters, 10)
+        self.assertEqual(Weight.of(1.25).quarters, 5)
+        self.assertEqual(Weight.of(20.41164), Weight.of(20.5))
+    
+    def test_matches_numeric_keys(self):
+        """Test that Weight and plain numbers are interchangeable dict keys."""
+        colors = {45: "blue", 2.5: "gray"}
+        self.assertEqual(colors[Weight.of(45)], "blue")
+        self.assertEqual(colors[Weight.of(2.5)], "gray")
+        self.assertEqual({Weight.of(1.25): 2}[1.25], 2)
+    
+    def test_exact_arithmetic(self):
+        """Test that integer arithmetic stays on the grid."""
+        total = sum(Weight.of(w) * 2 for w in (45, 2.5, 1.25))
+        self.assertIsInstance(total, Weight)
+        self.assertEqual(total, 97.5)
+        self.assertEqual(45 + Weight.of(2.5) * 2, Weight.of(50))
+        self.assertIsInstance(Weight.of(2.5) + 0.1, float)
+    
+    def test_formatting(self):
+        """Test string and format-spec output."""
+        self.assertEqual(str(Weight.of(45)), "45")
+        self.assertEqual(str(Weight.of(1.25)), "1.25")
+        self.assertEqual(f"{Weight.of(2.5):.1f}", "2.5")
+        self.assertEqual(format_weight(Weight.of(45), "lb"), "45 lb")
+        self.assertEqual(format_weight(Weight.of(1.25), "kg"), "1.25 kg")
+        self.assertEqual(format_weight(0.25, "lb"), "0.25 lb")
+        self.assertEqual(format_weight(101.25, "kg"), "101.25 kg")
+        self.assertEqual(format_weight(102.5, "kg"), "102.5 kg")
+    
+    def test_default_plates_use_weight_keys(self):
+        """Test that default plate sets are keyed by Weight."""
+        plates = get_default_plates("kg")
+        self.assertTrue(all(isinstance(weight, Weight) for weight in plates))
+        self.assertEqual(plates[1.25], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
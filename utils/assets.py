@@ -0,0 +1,138 @@
+"""Load-once static asset pipeline served through Streamlit static file serving."""
+
+import hashlib
+import io
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Repository root; Streamlit serves ./static next to app.py at app/static
+ROOT = Path(__file__).resolve().parent.parent
+STATIC_DIR = ROOT / "static"
+STATIC_URL = "app/static"
+
+# Stylesheets merged, in order, into one cacheable file
+STYLESHEETS = [ROOT / "styles" / "theme.css", ROOT / "styles" / "mobile.css"]
+
+# Header logo source and its display width in CSS pixels
+LOGO_PATH = ROOT / "assets" / "fortress-logo.png"
+LOGO_WIDTH = 60
+# Pixel density of the generated variant, so it stays sharp on phone screens
+LOGO_DENSITY = 2
+
+
+class StaticAsset(NamedTuple):
+    """A content-hashed asset; ``url`` is None when it could not be published."""
+    filename: str
+    url: Optional[str]
+    content: bytes
+
+
+_lock = threading.Lock()
+_assets: Dict[str, Tuple[Tuple[Optional[int], ...], StaticAsset]] = {}
+
+
+def dev_mode() -> bool:
+    """Whether source files are re-checked for changes on every use (FORTRESS_DEV=1)."""
+    return os.environ.get("FORTRESS_DEV", "") not in ("", "0")
+
+
+def _mtimes(paths: List[Path]) -> Tuple[Optional[int], ...]:
+    return tuple(path.stat().st_mtime_ns if path.exists() else None for path in paths)
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from CSS."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def publish(stem: str, suffix: str, content: bytes) -> StaticAsset:
+    """Write ``content`` to the static directory under a content-hashed name.
+
+    Older versions with the same stem are removed. If the directory is not
+    writable the asset is returned without a URL so callers can inline it.
+    """
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    filename = f"{stem}.{digest}{suffix}"
+    try:
+        STATIC_DIR.mkdir(exist_ok=True)
+        target = STATIC_DIR / filename
+        if not target.exists():
+            temp = target.with_suffix(target.suffix + ".tmp")
+            temp.write_bytes(content)
+            os.replace(temp, target)
+            for stale in STATIC_DIR.glob(f"{stem}.*{suffix}"):
+                if stale.name != filename:
+                    stale.unlink()
+    except OSError:
+        return StaticAsset(filename, None, content)
+    return StaticAsset(filename, f"{STATIC_URL}/{filename}", content)
+
+
+def cached_asset(name: str, sources: List[Path], build: Callable[[], Optional[StaticAsset]]) -> Optional[StaticAsset]:
+    """Build an asset once per process, rebuilding in dev mode when a source changes."""
+    with _lock:
+        entry = _assets.get(name)
+        if entry is not None and (not dev_mode() or entry[0] == _mtimes(sources)):
+            return entry[1]
+        mtimes = _mtimes(sources)
+        asset = build()
+        _assets[name] = (mtimes, asset)
+        return asset
+
+
+def _build_stylesheet() -> StaticAsset:
+    parts = [path.read_text(encoding="utf-8") for path in STYLESHEETS if path.exists()]
+    return publish("fortress", ".css", minify_css("\n".join(parts)).encode("utf-8"))
+
+
+def get_stylesheet() -> StaticAsset:
+    """The merged, minified theme + mobile stylesheet."""
+    return cached_asset("stylesheet", STYLESHEETS, _build_stylesheet)
+
+
+def stylesheet_html() -> str:
+    """Markup that loads the stylesheet: a cacheable <link>, or inline CSS as a fallback."""
+    asset = get_stylesheet()
+    if asset.url:
+        return f'<link rel="stylesheet" href="{asset.url}">'
+    return f"<style>{asset.content.decode('utf-8')}</style>"
+
+
+def resize_png(content: bytes, width: int) -> bytes:
+    """Downscale PNG bytes to ``width`` pixels wide, returning the input if PIL cannot."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return content
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            if image.width <= width:
+                return content
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.LANCZOS)
+            output = io.BytesIO()
+            resized.save(output, format="PNG", optimize=True)
+            return output.getvalue()
+    except Exception:
+        return content
+
+
+def _build_logo() -> Optional[StaticAsset]:
+    if not LOGO_PATH.exists():
+        return None
+    content = LOGO_PATH.read_bytes()
+    if not content:
+        return None
+    return publish(f"fortress-logo-{LOGO_WIDTH}", ".png", resize_png(content, LOGO_WIDTH * LOGO_DENSITY))
+
+
+def get_logo() -> Optional[StaticAsset]:
+    """The downscaled header logo, or None if there is no usable logo file."""
+    return cached_asset("logo", [LOGO_PATH], _build_logo)
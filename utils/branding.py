@@ -2,7 +2,10 @@
 
 import os
 import base64
+from functools import lru_cache
 import streamlit as st
+from utils import payload
+from utils.assets import LOGO_WIDTH, get_logo, stylesheet_html
 
 
 def get_logo_path():
@@ -10,15 +13,35 @@ def get_logo_path():
     return "assets/fortress-logo.png"
 
 
+@lru_cache(maxsize=4)
+def _encode_logo(logo_path, mtime_ns):
+    """Base64-encode a logo file; cached per path and modification time."""
+    with open(logo_path, "rb") as img_file:
+        return base64.b64encode(img_file.read()).decode()
+
+
 def _get_logo_base64(logo_path):
     """Convert logo image to base64 for inline embedding."""
     try:
-        with open(logo_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
+        return _encode_logo(logo_path, os.stat(logo_path).st_mtime_ns)
     except Exception:
         return ""
 
 
+def _get_logo_src(logo_path):
+    """Logo image source: external URL, cached static file, or inline base64 fallback."""
+    external_url = os.environ.get("FORTRESS_LOGO_URL")
+    if external_url:
+        return external_url
+    logo = get_logo()
+    if logo is None:
+        return ""
+    if logo.url:
+        return logo.url
+    logo_base64 = _get_logo_base64(logo_path)
+    return f"data:image/png;base64,{logo_base64}" if logo_base64 else ""
+
+
 def display_logo_and_title():
     """Display the logo and app title in the header."""
     logo_path = get_logo_path()
@@ -28,61 +51,24 @@ def display_logo_and_title():
     with col1:
         try:
             # Display logo with black background using HTML
-            logo_base64 = _get_logo_base64(logo_path)
-            if logo_base64:
-                st.markdown(f"""
+            logo_src = _get_logo_src(logo_path)
+            if logo_src:
+                payload.markdown("branding", f"""
                 <div style="background-color: #000000; padding: 8px; border-radius: 8px; display: inline-block; margin-bottom: 8px;">
-                    <img src="data:image/png;base64,{logo_base64}" style="width: 60px; height: auto;">
+                    <img src="{logo_src}" style="width: {LOGO_WIDTH}px; height: auto;">
                 </div>
                 """, unsafe_allow_html=True)
             else:
-                st.markdown("**FORTRESS**")
+                payload.markdown("branding", "**FORTRESS**")
         except Exception:
             # Fallback to text if logo fails to load
-            st.markdown("**FORTRESS**")
+            payload.markdown("branding", "**FORTRESS**")
     
     with col2:
-        st.markdown("# Fortress Athlete Tools")
+        payload.markdown("branding", "# Fortress Athlete Tools")
 
 
 def apply_mobile_styles():
     """Apply mobile-first CSS styles with theme integration."""
-    st.markdown("""
-    <style>
-    /* Mobile-specific overrides that work with theme */
-    .stButton > button {
-        width: 100%;
-        height: 3rem;
-        font-size: 1.1rem;
-        margin: 0.5rem 0;
-    }
-    
-    .stNumberInput > div > div > input {
-        font-size: 1.1rem;
-        text-align: center;
-    }
-    
-    .stDataFrame {
-        width: 100%;
-    }
-    
-    .stDataFrame table {
-        font-family: 'Courier New', monospace;
-    }
-    
-    .stDataFrame td:last-child {
-        text-align: right;
-    }
-    
-    @media (max-width: 768px) {
-        .main > div {
-            padding: 0.5rem;
-        }
-        
-        .stButton > button {
-            height: 3.5rem;
-            font-size: 1.2rem;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # styles/mobile.css ships in the same cached stylesheet as the theme
+    payload.markdown("branding", stylesheet_html(), unsafe_allow_html=True)
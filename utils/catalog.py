@@ -0,0 +1,134 @@
+"""Named, immutable plate catalogs per unit and gym."""
+
+from typing import Dict, List, NamedTuple, Tuple
+
+from utils.units import Weight
+from utils.plates import PLATE_COLORS, KG_PLATE_COLORS, DEFAULT_PLATE_COLOR
+
+
+class Plate(NamedTuple):
+    """A physical plate type with an ID that is stable across catalogs and units."""
+    id: str
+    weight: Weight
+    unit: str
+    kind: str
+    color: str
+    thickness: float
+
+
+class PlateCatalog(NamedTuple):
+    """An immutable plate set (heaviest first) with default pair counts."""
+    id: str
+    name: str
+    unit: str
+    plates: Tuple[Plate, ...]
+    default_counts: Tuple[int, ...]
+
+    def plate(self, plate_id: str) -> Plate:
+        """Look up a plate of this catalog by ID."""
+        for plate in self.plates:
+            if plate.id == plate_id:
+                return plate
+        raise KeyError(plate_id)
+
+    def default_inventory(self) -> Dict[str, int]:
+        """Default pair counts keyed by plate ID."""
+        return {plate.id: count for plate, count in zip(self.plates, self.default_counts)}
+
+    def to_weights(self, counts: Dict[str, int]) -> Dict[Weight, int]:
+        """Convert plate-ID counts into the weight-keyed inventory the solver takes."""
+        inventory: Dict[Weight, int] = {}
+        for plate in self.plates:
+            count = counts.get(plate.id, 0)
+            inventory[plate.weight] = inventory.get(plate.weight, 0) + count
+        return inventory
+
+    def to_mixed(self, counts: Dict[str, int]) -> Dict[Tuple[Weight, str], int]:
+        """Convert plate-ID counts into a ``(weight, unit)``-keyed inventory (see :mod:`utils.mixed`)."""
+        return {(weight, self.unit): count for weight, count in self.to_weights(counts).items()}
+
+    def thickness(self) -> Dict[Weight, float]:
+        """Physical thickness in mm per plate weight (the thickest plate when weights repeat)."""
+        widths: Dict[Weight, float] = {}
+        for plate in self.plates:
+            widths[plate.weight] = max(widths.get(plate.weight, 0.0), plate.thickness)
+        return widths
+
+
+# Typical physical plate thickness in mm, per kind and unit
+PLATE_THICKNESS_MM = {
+    ("iron", "lb"): {45: 38, 35: 32, 25: 25, 15: 22, 10: 19, 5: 16, 2.5: 13},
+    ("change", "lb"): {1: 10, 0.5: 8, 0.25: 6},
+    ("bumper", "kg"): {25: 67, 20: 54, 15: 43, 10: 31, 5: 27},
+    ("change", "kg"): {2.5: 19, 2: 19, 1.5: 17, 1.25: 16, 1: 13, 0.5: 10, 0.25: 8},
+}
+
+# Loadable sleeve length in mm of a standard Olympic bar
+DEFAULT_SLEEVE_LENGTH_MM = 415
+
+# Used for plates missing from PLATE_THICKNESS_MM
+DEFAULT_THICKNESS_MM = 30
+
+
+def _plate(kind: str, unit: str, weight: float) -> Plate:
+    palette = PLATE_COLORS if unit == "lb" else KG_PLATE_COLORS
+    weight = Weight.of(weight)
+    thickness = PLATE_THICKNESS_MM.get((kind, unit), {}).get(weight, DEFAULT_THICKNESS_MM)
+    return Plate(f"{kind}-{unit}-{weight}", weight, unit, kind, palette.get(weight, DEFAULT_PLATE_COLOR), thickness)
+
+
+def _catalog(catalog_id: str, name: str, unit: str, plates: List[Tuple[str, float, int]]) -> PlateCatalog:
+    plates = sorted(plates, key=lambda plate: plate[1], reverse=True)
+    return PlateCatalog(
+        catalog_id,
+        name,
+        unit,
+        tuple(_plate(kind, unit, weight) for kind, weight, _ in plates),
+        tuple(count for _, _, count in plates)
+    )
+
+
+CATALOGS = {
+    catalog.id: catalog for catalog in (
+        _catalog("iron_lb", "Iron (lb)", "lb", [
+            ("iron", 45, 2), ("iron", 35, 2), ("iron", 25, 2), ("iron", 15, 2),
+            ("iron", 10, 2), ("iron", 5, 2), ("iron", 2.5, 2)
+        ]),
+        _catalog("iron_change_lb", "Iron + change plates (lb)", "lb", [
+            ("iron", 45, 2), ("iron", 35, 2), ("iron", 25, 2), ("iron", 15, 2),
+            ("iron", 10, 2), ("iron", 5, 2), ("iron", 2.5, 2),
+            ("change", 1, 2), ("change", 0.5, 2), ("change", 0.25, 2)
+        ]),
+        _catalog("bumper_kg", "Bumper (kg)", "kg", [
+            ("bumper", 25, 2), ("bumper", 20, 2), ("bumper", 15, 2), ("bumper", 10, 2),
+            ("bumper", 5, 2), ("change", 2.5, 2), ("change", 1.25, 2)
+        ]),
+        _catalog("bumper_change_kg", "Bumper + change plates (kg)", "kg", [
+            ("bumper", 25, 2), ("bumper", 20, 2), ("bumper", 15, 2), ("bumper", 10, 2),
+            ("bumper", 5, 2), ("change", 2.5, 2), ("change", 2, 1), ("change", 1.5, 1),
+            ("change", 1.25, 2), ("change", 1, 1), ("change", 0.5, 1), ("change", 0.25, 1)
+        ]),
+    )
+}
+
+# Catalog used when a unit is first selected
+DEFAULT_CATALOGS = {"lb": "iron_lb", "kg": "bumper_kg"}
+
+
+def get_catalog(catalog_id: str) -> PlateCatalog:
+    """Get a catalog by ID."""
+    return CATALOGS[catalog_id]
+
+
+def get_default_catalog(unit: str) -> PlateCatalog:
+    """Get the default catalog for a unit."""
+    return CATALOGS[DEFAULT_CATALOGS[unit]]
+
+
+def catalogs_for_unit(unit: str) -> List[PlateCatalog]:
+    """All catalogs of one unit, default first."""
+    default = DEFAULT_CATALOGS[unit]
+    return sorted(
+        (catalog for catalog in CATALOGS.values() if catalog.unit == unit),
+        key=lambda catalog: catalog.id != default
+    )
@@ -0,0 +1,140 @@
+"""Printable full-range loading charts (every total from the bar up, in fixed steps)."""
+
+import csv
+import html
+import io
+import math
+from typing import Dict, List, NamedTuple, Optional
+
+from utils.percent import loadings_for_totals
+from utils.plates import format_plate_stack
+from utils.units import Weight, format_weight
+
+# Heaviest total listed on a chart, per unit
+DEFAULT_MAX_TOTAL = {"lb": 700.0, "kg": 320.0}
+
+# Spacing between listed totals, per unit
+DEFAULT_STEP = {"lb": 5.0, "kg": 2.5}
+
+
+class ChartRow(NamedTuple):
+    """One chart line: the listed total and how to load it."""
+    total: float
+    plates: list
+    achieved: float
+    delta: float
+
+
+def platform_inventory(inventory: Dict[float, int], bar_weight: float, max_total: float) -> Dict[Weight, int]:
+    """Extend an inventory with enough of its heaviest plate to reach ``max_total``."""
+    inventory = {Weight.of(weight): count for weight, count in inventory.items() if count > 0}
+    if inventory:
+        heaviest = max(inventory)
+        needed = math.ceil(max(max_total - bar_weight, 0) / 2 / float(heaviest))
+        inventory[heaviest] = max(inventory[heaviest], needed)
+    return inventory
+
+
+def loading_chart(
+    bar_weight: float,
+    inventory: Dict[float, int],
+    unit: str = "lb",
+    step: Optional[float] = None,
+    max_total: Optional[float] = None
+) -> List[ChartRow]:
+    """Loadings for every total from the bar to ``max_total``, packed in one batched pass."""
+    step = step or DEFAULT_STEP[unit]
+    max_total = max_total or DEFAULT_MAX_TOTAL[unit]
+    count = int(math.floor((max_total - bar_weight) / step + 1e-9)) + 1
+    totals = [bar_weight + i * step for i in range(max(count, 0))]
+    loadings = loadings_for_totals(totals, bar_weight, inventory)
+    return [ChartRow(total, loading.plates, loading.achieved, loading.delta) for total, loading in zip(totals, loadings)]
+
+
+def _plates_text(row: ChartRow, unit: str) -> str:
+    return format_plate_stack(row.plates, unit) if row.plates else "Bar only"
+
+
+def _delta_text(row: ChartRow, unit: str) -> str:
+    if abs(row.delta) < 0.01:
+        return ""
+    return f"{'+' if row.delta > 0 else '-'}{format_weight(abs(row.delta), unit)}"
+
+
+def chart_csv(rows: List[ChartRow], unit: str = "lb") -> str:
+    """Chart as CSV text."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["Total", "Plates (per side)", "Achieved", "Delta", "Unit"])
+    for row in rows:
+        writer.writerow([f"{row.total:g}", _plates_text(row, unit), f"{row.achieved:g}", f"{row.delta:g}", unit])
+    return output.getvalue()
+
+
+def chart_html(rows: List[ChartRow], unit: str = "lb", title: str = "Loading Chart") -> str:
+    """Chart as a standalone, print-friendly HTML page."""
+    body = "".join(
+        f"<tr><td>{html.escape(format_weight(row.total, unit))}</td>"
+        f"<td>{html.escape(_plates_text(row, unit))}</td>"
+        f"<td>{html.escape(_delta_text(row, unit))}</td></tr>"
+        for row in rows
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title><style>"
+        "@page{margin:12mm}body{font-family:-apple-system,'Segoe UI',sans-serif;font-size:11pt}"
+        "h1{font-size:16pt}table{width:100%;border-collapse:collapse}"
+        "th,td{padding:2px 8px;text-align:left;border-bottom:1px solid #E2E8F0}"
+        "tr:nth-child(even){background:#F8FAFC}thead{display:table-header-group}"
+        f"</style></head><body><h1>{html.escape(title)}</h1><table>"
+        "<thead><tr><th>Total</th><th>Plates (per side)</th><th>Delta</th></tr></thead>"
+        f"<tbody>{body}</tbody></table></body></html>"
+    )
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def chart_pdf(rows: List[ChartRow], unit: str = "lb", title: str = "Loading Chart") -> bytes:
+    """Chart as a minimal multi-page PDF (US Letter, built-in Courier font)."""
+    lines = [f"{'Total':>10}  {'Plates (per side)':<52}  Delta"]
+    for row in rows:
+        lines.append(f"{format_weight(row.total, unit):>10}  {_plates_text(row, unit):<52.52}  {_delta_text(row, unit)}")
+
+    lines_per_page = 60
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Objects 1-3 are the catalog, page tree and font; each page adds a page and a content stream
+    objects = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>"]
+    page_ids = []
+    for number, page_lines in enumerate(pages, start=1):
+        header = f"{title} ({number}/{len(pages)})"
+        text = [f"BT /F1 14 Tf 40 750 Td ({_pdf_escape(header)}) Tj ET", "BT /F1 9 Tf 11 TL 40 724 Td"]
+        text.extend(f"({_pdf_escape(line)}) '" for line in page_lines)
+        text.append("ET")
+        stream = "\n".join(text).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids)
+    )
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
@@ -0,0 +1,104 @@
+"""Loader's sheets for a flight of lifters sharing one bar."""
+
+import csv
+import io
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from utils.ladder import describe_moves, plate_moves, solve_stacks
+from utils.plates import format_plate_stack, freeze_inventory, get_per_side_breakdown
+from utils.units import Weight, format_weight
+
+
+class Attempt(NamedTuple):
+    """One lifter's attempt (total weight, collars included)."""
+    lifter: str
+    weight: float
+
+
+class SheetRow(NamedTuple):
+    """One loading of the flight and the plate changes (per side) that lead to it."""
+    order: int
+    lifter: str
+    weight: float
+    achieved: float
+    plates: List[Tuple[Weight, int]]
+    strip: Tuple[Weight, ...]
+    add: Tuple[Weight, ...]
+    bare: bool
+
+    @property
+    def moves(self) -> int:
+        return len(self.strip) + len(self.add)
+
+
+def parse_attempts(text: str) -> List[Attempt]:
+    """Attempts from lines of ``lifter, weight`` (or just ``weight``)."""
+    attempts = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        lifter, _, weight = line.rpartition(",")
+        try:
+            attempts.append(Attempt(lifter.strip(), float(weight)))
+        except ValueError:
+            raise ValueError(f"Not an attempt: {line.strip()!r}") from None
+    return attempts
+
+
+def loading_order(attempts: Iterable[Attempt]) -> List[Attempt]:
+    """Attempts in the order the bar is loaded: ascending weight, ties in entry order."""
+    return sorted(attempts, key=lambda attempt: attempt.weight)
+
+
+def loading_sheet(
+    attempts: Iterable[Attempt],
+    bar_weight: float,
+    inventory: Dict[float, int],
+    collar_weight: float = 0.0
+) -> List[SheetRow]:
+    """The loader's sheet for a flight, one row per loading.
+
+    The whole flight is solved at once, since every loading depends on the
+    ones around it. Attempts are loaded exactly when the inventory allows (otherwise at the
+    closest load under). Changes that would strip the bar bare are avoided
+    first, then the total plate moves across the whole flight are minimized.
+    """
+    order = loading_order(attempts)
+    loaded = round(float(bar_weight + collar_weight), 6)
+    targets = tuple(round(float(attempt.weight), 6) for attempt in order)
+    path = solve_stacks(targets, loaded, freeze_inventory(inventory), 0.0, keep_inner=True)
+
+    rows = []
+    previous: Tuple[Weight, ...] = ()
+    for number, (attempt, stack) in enumerate(zip(order, path), 1):
+        plates = tuple(Weight(units) for units in stack)
+        strip, add = plate_moves(previous, plates)
+        achieved = bar_weight + collar_weight + 2 * float(Weight(sum(stack)))
+        bare = bool(previous) and len(strip) == len(previous)
+        rows.append(SheetRow(number, attempt.lifter, attempt.weight, achieved, get_per_side_breakdown(Counter(plates)), strip, add, bare))
+        previous = plates
+    return rows
+
+
+def sheet_csv(rows: Iterable[SheetRow], unit: str = "lb") -> Iterator[str]:
+    """Stream a loading sheet as CSV lines (header first)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def line(values: Sequence[str]) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield line(["Order", "Lifter", "Attempt", "Loaded", "Plates (per side)", "Change (per side)"])
+    for row in rows:
+        yield line([
+            str(row.order),
+            row.lifter,
+            format_weight(row.weight, unit),
+            format_weight(row.achieved, unit),
+            format_plate_stack(row.plates, unit) if row.plates else "Bar only",
+            describe_moves(row.strip, row.add, unit)
+        ])
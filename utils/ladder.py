@@ -0,0 +1,247 @@
+"""Warm-up ladders that reach a top set with as few plate changes as possible."""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from utils.percent import percent_rows
+from utils.plates import FrozenInventory, PlateIndex, freeze_inventory, get_per_side_breakdown, get_plate_index
+from utils.units import Weight
+
+# Allowed distance of each set's load from its target (total weight), per unit
+DEFAULT_TOLERANCE = {"lb": 5.0, "kg": 2.5}
+
+# Widest allowed miss the Percent Calculator offers, per unit
+MAX_TOLERANCE = {"lb": 20.0, "kg": 10.0}
+
+# A typical ramp to a top set, in percent
+DEFAULT_RAMP = [40, 50, 60, 70, 80, 90, 100]
+
+# Candidate loads per set may use this many plates more than the fewest that fit.
+# A heuristic that keeps the search small: a ladder through even heavier stacks
+# can occasionally save a move, though random checks against every stack
+# sequence have not found one.
+EXTRA_PLATES = 4
+
+# Hard cap on the stacks enumerated per set, on top of one stack per reachable
+# total, so wide tolerances with many pairs stay fast
+MAX_CANDIDATES = 256
+
+# One side of the bar in quarter units, innermost plate first (heaviest first)
+Stack = Tuple[int, ...]
+
+
+class LadderStep(NamedTuple):
+    """One set of a ladder and the plate changes (per side) that lead to it."""
+    percent: float
+    target: float
+    achieved: float
+    plates: List[Tuple[Weight, int]]
+    strip: Tuple[Weight, ...]
+    add: Tuple[Weight, ...]
+
+    @property
+    def moves(self) -> int:
+        return len(self.strip) + len(self.add)
+
+
+class Ladder(NamedTuple):
+    """A warm-up ladder and its total plate moves per side."""
+    steps: List[LadderStep]
+    total_moves: int
+
+
+def plate_moves(current: Sequence[Weight], following: Sequence[Weight]) -> Tuple[Tuple[Weight, ...], Tuple[Weight, ...]]:
+    """Plates to strip (outermost first) and then add to go from one stack to the next.
+
+    Plates only come off and go on at the outer end, so everything outside the
+    common inner part of the two stacks is stripped and re-added.
+    """
+    common = 0
+    for inner, other in zip(current, following):
+        if inner != other:
+            break
+        common += 1
+    return tuple(reversed(current[common:])), tuple(following[common:])
+
+
+def _stacks_in_window(inventory: FrozenInventory, low: int, high: int, max_plates: int) -> List[Stack]:
+    """Per-side stacks of at most ``max_plates`` from ``inventory`` pairs weighing ``low`` to ``high`` quarters.
+
+    Heavier stacks come first; the search stops after :data:`MAX_CANDIDATES`.
+    """
+    plates = sorted((weight.quarters for weight, count in inventory if weight.quarters > 0 for _ in range(count)), reverse=True)
+    # Heaviest load of r plates from position i onward: heaviest[i + r] - heaviest[i]
+    heaviest = [0]
+    for units in plates:
+        heaviest.append(heaviest[-1] + units)
+
+    # Equal plates are interchangeable, so only the first of a run starts a
+    # branch; the next branch starts at the first lighter plate
+    end = len(plates)
+    lighter = [end] * end
+    for position in range(end - 2, -1, -1):
+        lighter[position] = position + 1 if plates[position + 1] != plates[position] else lighter[position + 1]
+
+    stacks = []
+
+    def extend(start: int, total: int, stack: Stack):
+        if total >= low:
+            stacks.append(stack)
+        room = max_plates - len(stack)
+        position = start
+        while position < end and len(stacks) < MAX_CANDIDATES:
+            units = plates[position]
+            if total + heaviest[min(position + room, end)] - heaviest[position] < low:
+                # Lighter plates from here on cannot reach the window either
+                break
+            if total + units <= high:
+                extend(position + 1, total + units, stack + (units,))
+            position = lighter[position]
+
+    extend(0, 0, ())
+    return stacks
+
+
+def _fewest_stacks(index: PlateIndex, low: int, high: int) -> List[Stack]:
+    """Stacks weighing ``low`` to ``high`` quarters with at most :data:`EXTRA_PLATES` more than the fewest plates.
+
+    The index settles reachability and the fewest plates by bisecting its
+    totals. Every reachable total keeps its fewest-plates stack, however
+    many others the :data:`MAX_CANDIDATES` cap leaves out.
+    """
+    stacks = {}
+    for position in range(bisect_left(index.totals, low), bisect_right(index.totals, high)):
+        stack = tuple(weight.quarters for weight, count in index.combo(position) for _ in range(count))
+        stacks[tuple(sorted(stack, reverse=True))] = None
+    if not stacks:
+        return []
+    fewest = min(len(stack) for stack in stacks)
+    stacks.update(dict.fromkeys(_stacks_in_window(index.inventory, low, high, fewest + EXTRA_PLATES)))
+    return list(stacks)
+
+
+def _candidates(target: float, bar_weight: float, inventory: FrozenInventory, tolerance: float) -> List[Stack]:
+    index = get_plate_index(dict(inventory))
+    low = Weight.steps_ceil(max(target - tolerance - bar_weight, 0) / 2)
+    high = Weight.steps_floor(max(target + tolerance - bar_weight, 0) / 2)
+    stacks = _fewest_stacks(index, low, high) if low <= high else []
+    if stacks:
+        return stacks
+    # Nothing within tolerance: fall back to the closest load at or under the target, in any of its stacks
+    _, per_side = index.nearest_under(max(target - bar_weight, 0) / 2)
+    quarters = Weight.of(per_side).quarters
+    return _fewest_stacks(index, quarters, quarters)
+
+
+@lru_cache(maxsize=256)
+def solve_stacks(
+    targets: Tuple[float, ...],
+    bar_weight: float,
+    inventory: FrozenInventory,
+    tolerance: float,
+    keep_inner: bool = False
+) -> Tuple[Stack, ...]:
+    """Lowest-move sequence of stacks, one per target, starting from an empty bar.
+
+    Moves between stacks are ``len(a) + len(b) - 2 * common_prefix``, so each
+    layer is relaxed through a trie of the previous layer's stacks: the best
+    ``cost + len(a)`` below every prefix, minus twice the prefix depth.
+    With ``keep_inner``, changes that strip a loaded bar to nothing are
+    avoided first. Ties prefer loads closer to target, then fewer plates.
+
+    This is a heuristic. The search is exact only over each target's
+    candidates, which are capped at :data:`EXTRA_PLATES` more plates than
+    the fewest in tolerance and at :data:`MAX_CANDIDATES` stacks.
+    """
+    layer: Dict[Stack, Tuple[Tuple[int, int, int, int], Optional[Stack]]] = {(): ((0, 0, 0, 0), None)}
+    candidates: Dict[float, List[Stack]] = {}
+    history = []
+    for target in targets:
+        below: Dict[Stack, Tuple[Tuple[int, int, int, int], Stack]] = {}
+        values = [((cost[0], cost[1] + len(stack), cost[2], cost[3]), stack) for stack, (cost, _) in layer.items()]
+        for value, stack in values:
+            # Sharing no plates with a loaded bar means stripping it bare
+            bare = (value[0] + 1,) + value[1:] if keep_inner and stack else value
+            best = below.get(())
+            if best is None or bare < best[0]:
+                below[()] = (bare, stack)
+        # Cheapest first, so once a prefix is taken its shorter prefixes are too
+        values.sort(key=lambda entry: entry[0])
+        for value, stack in values:
+            for depth in range(len(stack), 0, -1):
+                prefix = stack[:depth]
+                if prefix in below:
+                    break
+                below[prefix] = (value, stack)
+
+        if target not in candidates:
+            candidates[target] = _candidates(target, bar_weight, inventory, tolerance)
+        # Deviation from target in quarter units of total weight
+        wanted = (target - bar_weight) * 4
+        following = {}
+        for stack in candidates[target]:
+            deviation = abs(sum(stack) * 2 - wanted)
+            best = None
+            for depth in range(len(stack) + 1):
+                entry = below.get(stack[:depth])
+                if entry is None:
+                    # No stack of the previous layer shares this prefix, or any longer one
+                    break
+                value, previous = entry
+                cost = (value[0], value[1] - 2 * depth + len(stack), value[2] + deviation, value[3] + len(stack))
+                if best is None or cost < best[0]:
+                    best = (cost, previous)
+            following[stack] = best
+        history.append(following)
+        layer = following
+
+    # Walk back from the cheapest final stack
+    stack = min(layer, key=lambda candidate: layer[candidate][0])
+    path = []
+    for following in reversed(history):
+        path.append(stack)
+        stack = following[stack][1]
+    return tuple(reversed(path))
+
+
+def describe_moves(strip: Sequence[Weight], add: Sequence[Weight], unit: str = "lb") -> str:
+    """Plate changes per side as a short line (e.g. "Strip 10 lb · Add 25 lb")."""
+    parts = []
+    if strip:
+        parts.append("Strip " + ", ".join(f"{float(weight):g} {unit}" for weight in strip))
+    if add:
+        parts.append("Add " + ", ".join(f"{float(weight):g} {unit}" for weight in add))
+    return " · ".join(parts) if parts else "No change"
+
+
+def warmup_ladder(
+    top_set: float,
+    bar_weight: float,
+    inventory: Dict[float, int],
+    percentages: Sequence[float] = DEFAULT_RAMP,
+    tolerance: Optional[float] = None,
+    rounding: str = "None",
+    unit: str = "lb"
+) -> Ladder:
+    """Ladder to ``top_set`` over a percent ramp with the fewest plate moves per side.
+
+    Each set may be loaded anywhere within ``tolerance`` (total weight) of its
+    target; sets with no load in range take the closest load under target.
+    ``inventory`` counts pairs; moves count one side of the bar.
+    """
+    tolerance = DEFAULT_TOLERANCE[unit] if tolerance is None else tolerance
+    rows = percent_rows(top_set, rounding, unit, percentages)
+    targets = tuple(round(float(row.rounded), 6) for row in rows)
+    path = solve_stacks(targets, round(float(bar_weight), 6), freeze_inventory(inventory), round(float(tolerance), 6))
+
+    steps = []
+    previous: Tuple[Weight, ...] = ()
+    for row, stack in zip(rows, path):
+        plates = tuple(Weight(units) for units in stack)
+        strip, add = plate_moves(previous, plates)
+        achieved = bar_weight + 2 * float(Weight(sum(stack)))
+        steps.append(LadderStep(row.percent, row.rounded, achieved, get_per_side_breakdown(Counter(plates)), strip, add))
+        previous = plates
+    return Ladder(steps, sum(step.moves for step in steps))
@@ -0,0 +1,199 @@
+"""Packing lb and kg plates together on one bar."""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from utils.cache import LRUCache
+from utils.plates import FrozenInventory, freeze_inventory, get_plate_index
+from utils.units import Weight
+
+# Exact common grid of 2.5e-9 kg. A pound is exactly 0.45359237 kg, so a quarter
+# pound is 45359237 grid units and a quarter kilogram 100000000.
+GRID_PER_QUARTER = {"lb": 45359237, "kg": 100000000}
+GRID_PER_UNIT = {unit: units * Weight.STEPS_PER_UNIT for unit, units in GRID_PER_QUARTER.items()}
+
+UNITS = ("lb", "kg")
+
+# The lb quarters of a grid total below 25 million lb: the lb step is invertible modulo the kg step
+LB_INVERSE = pow(GRID_PER_QUARTER["lb"], -1, GRID_PER_QUARTER["kg"])
+
+# Mixed inventories with at most this many (lb load, kg load) pairs get a sorted
+# table of every total; larger ones scan a per-unit table on each lookup
+MAX_TABLE = 1 << 15
+
+# Pairs on hand keyed by (plate weight, plate unit)
+MixedInventory = Dict[Tuple[float, str], int]
+
+# One plate type of a mixed load: (weight, unit, count)
+MixedPlate = Tuple[Weight, str, int]
+
+
+class MixedLoad(NamedTuple):
+    """A per-side load from a mixed inventory, its mass on the common grid."""
+    plates: List[MixedPlate]
+    grid: int
+
+    def weight(self, unit: str) -> float:
+        """The load's weight in ``unit``."""
+        return self.grid / GRID_PER_UNIT[unit]
+
+
+def to_grid(value: float, unit: str, up: bool = False) -> int:
+    """Grid units of ``value`` in ``unit``, rounded down (or up) exactly."""
+    # The decimal a user typed, not its binary approximation
+    scaled = Fraction(repr(float(value))) * GRID_PER_UNIT[unit]
+    return math.ceil(scaled) if up else math.floor(scaled)
+
+
+def split_inventory(inventory: MixedInventory) -> Tuple[FrozenInventory, ...]:
+    """Frozen single-unit inventories, in :data:`UNITS` order."""
+    for weight, unit in inventory:
+        if unit not in GRID_PER_UNIT:
+            raise ValueError(f"Unsupported plate unit: {unit}")
+    return tuple(
+        freeze_inventory({weight: count for (weight, plate_unit), count in inventory.items() if plate_unit == unit})
+        for unit in UNITS
+    )
+
+
+class MixedIndex:
+    """Every per-side load of a two-unit inventory, from one solver table per unit.
+
+    A mixed load is an lb load plus a kg load. The grid steps of the two units
+    share no common multiple below 25 million lb, so each combined total
+    splits one way. Up to :data:`MAX_TABLE` pairs, every combined total sits in
+    one sorted table for bisect lookups, like :class:`utils.plates.PlateIndex`.
+    Beyond that, lookups scan the smaller table for the best partner in the
+    other and remember recent answers.
+    """
+
+    __slots__ = ("inventory", "_indexes", "_table", "_outer", "_inner", "_floor", "_results")
+
+    def __init__(self, inventory: Tuple[FrozenInventory, ...]):
+        self.inventory = inventory
+        # The shared per-unit tables, so a mixed gym reuses single-unit work
+        self._indexes = {unit: get_plate_index(dict(frozen)) for unit, frozen in zip(UNITS, inventory)}
+        self._table = self._outer = self._inner = self._floor = self._results = None
+        lb, kg = (self._indexes[unit].totals for unit in UNITS)
+        if len(lb) * len(kg) <= MAX_TABLE:
+            kg_grid = [quarters * GRID_PER_QUARTER["kg"] for quarters in kg]
+            table = []
+            for quarters in lb:
+                offset = quarters * GRID_PER_QUARTER["lb"]
+                table.extend([offset + grid for grid in kg_grid])
+            table.sort()
+            self._table = array("q", table)
+            return
+        self._outer, self._inner = sorted(UNITS, key=lambda unit: len(self._indexes[unit].totals))
+        # Position of the heaviest inner load at or under each quarter count
+        totals = self._indexes[self._inner].totals
+        self._floor = [bisect_right(totals, quarters) - 1 for quarters in range(totals[-1] + 1)]
+        self._results = LRUCache(maxsize=4096)
+
+    def _best(self, target: int, over: bool) -> Optional[Tuple[int, int, int]]:
+        """``(grid, lb position, kg position)`` of the closest load under (or over) ``target``."""
+        table = self._table
+        if table is None:
+            return self._results.get_or_compute((target, over), lambda: self._scan(target, over))
+        if over:
+            position = bisect_left(table, target)
+            if position == len(table):
+                return None
+        else:
+            position = bisect_right(table, target) - 1
+        grid = table[position]
+        lb = grid * LB_INVERSE % GRID_PER_QUARTER["kg"]
+        kg = (grid - lb * GRID_PER_QUARTER["lb"]) // GRID_PER_QUARTER["kg"]
+        return grid, bisect_left(self._indexes["lb"].totals, lb), bisect_left(self._indexes["kg"].totals, kg)
+
+    def _scan(self, target: int, over: bool) -> Optional[Tuple[int, int, int]]:
+        outer, inner = self._indexes[self._outer].totals, self._indexes[self._inner].totals
+        outer_step, inner_step = GRID_PER_QUARTER[self._outer], GRID_PER_QUARTER[self._inner]
+        floor, top = self._floor, len(self._floor) - 1
+        # Lighter outer loads leave more than the heaviest inner load can fill; of
+        # those only the heaviest can be best, so the scan starts there
+        start = max(bisect_right(outer, (target - inner[-1] * inner_step) // outer_step) - 1, 0)
+        best = None
+        for position in range(start, len(outer)):
+            quarters = outer[position]
+            rest = target - quarters * outer_step
+            if over:
+                needed = max(-(-rest // inner_step), 0)
+                if needed > top:
+                    continue
+                inner_position = floor[needed]
+                if inner[inner_position] < needed:
+                    inner_position += 1
+            else:
+                if rest < 0:
+                    break
+                inner_position = floor[min(rest // inner_step, top)]
+            grid = quarters * outer_step + inner[inner_position] * inner_step
+            if best is None or (grid < best[0] if over else grid > best[0]):
+                best = (grid, position, inner_position)
+            if over and rest <= 0:
+                # This outer load alone reaches the target; heavier ones only overshoot more
+                break
+        if best is None:
+            return None
+        positions = {self._outer: best[1], self._inner: best[2]}
+        return best[0], positions["lb"], positions["kg"]
+
+    def _load(self, best: Tuple[int, int, int]) -> MixedLoad:
+        grid, *positions = best
+        plates = [
+            (weight, unit, count)
+            for unit, position in zip(UNITS, positions)
+            for weight, count in self._indexes[unit].combo(position)
+        ]
+        # Heaviest first by mass, as the plates go on the sleeve
+        plates.sort(key=lambda plate: plate[0].quarters * GRID_PER_QUARTER[plate[1]], reverse=True)
+        return MixedLoad(plates, grid)
+
+    def pack(self, target_per_side: float, unit: str, prefer_over: bool = False) -> Tuple[MixedLoad, float]:
+        """Closest per-side load to ``target_per_side`` (in ``unit``) and its delta in ``unit``.
+
+        Same rules as :func:`utils.plates.pack_plates`: at or under the target,
+        or at or over it with ``prefer_over`` when the inventory reaches it.
+        """
+        target = max(target_per_side, 0)
+        best = self._best(to_grid(target, unit, up=True), over=True) if prefer_over else None
+        load = self._load(best or self._best(to_grid(target, unit), over=False))
+        return load, load.weight(unit) - target_per_side
+
+
+@lru_cache(maxsize=64)
+def _cached_mixed_index(inventory: Tuple[FrozenInventory, ...]) -> MixedIndex:
+    return MixedIndex(inventory)
+
+
+@lru_cache(maxsize=256)
+def _mixed_index_for_items(items: Tuple[Tuple[Tuple[float, str], int], ...]) -> MixedIndex:
+    # Raw dict items skip re-splitting inventories that were seen before
+    return _cached_mixed_index(split_inventory(dict(items)))
+
+
+def get_mixed_index(inventory: MixedInventory) -> MixedIndex:
+    """Shared, process-wide index for a mixed inventory."""
+    return _mixed_index_for_items(tuple(inventory.items()))
+
+
+def pack_mixed(
+    target_per_side: float,
+    inventory: MixedInventory,
+    unit: str = "lb",
+    prefer_over: bool = False
+) -> Tuple[MixedLoad, float]:
+    """Closest per-side load from plates of both units; see :meth:`MixedIndex.pack`."""
+    return get_mixed_index(inventory).pack(target_per_side, unit, prefer_over)
+
+
+def format_mixed_stack(plates: List[MixedPlate]) -> str:
+    """Format a mixed per-side plate list as one line (e.g. "20 kg x 1, 45 lb x 1")."""
+    if not plates:
+        return "No plates needed"
+    return ", ".join(f"{weight} {unit} x {count}" for weight, unit, count in plates)
@@ -0,0 +1,143 @@
+"""Per-run payload accounting for markdown/HTML sent to the browser.
+
+Scripts wrap each run in ``start_page``/``finish_page`` and emit metered
+markup through ``markdown(source, body)``. Sizes are aggregated per page and
+checked against ``PAGE_BUDGETS``; ``FORTRESS_PAYLOAD_STRICT=1`` turns an
+over-budget run into an error instead of a logged warning.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple
+
+logger = logging.getLogger("fortress.payload")
+
+# Metered bytes allowed per run of each page (or fragment)
+PAGE_BUDGETS = {
+    "app": 4096,
+    "app:barbell_builder": 3072,
+    "percent_calculator": 4096,
+    "barbell_calculator": 4096,
+}
+
+# Runs kept per page for the aggregate report
+WINDOW = 200
+
+_history: Dict[str, Deque[Dict[str, int]]] = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class PayloadBudgetError(RuntimeError):
+    """A run emitted more metered bytes than its page budget (strict mode only)."""
+
+
+class PayloadReport(NamedTuple):
+    """Metered bytes of one run, by source."""
+    page: str
+    total: int
+    by_source: Dict[str, int]
+    budget: int
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.total > self.budget
+
+
+class PageStats(NamedTuple):
+    """Aggregate metered bytes over the recent runs of one page."""
+    page: str
+    runs: int
+    last: int
+    mean: float
+    max: int
+    by_source: Dict[str, float]
+    budget: int
+
+
+def _stack() -> List[PayloadReport]:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def strict_mode() -> bool:
+    """True when over-budget runs should raise."""
+    return os.environ.get("FORTRESS_PAYLOAD_STRICT", "") not in ("", "0")
+
+
+def start_page(page: str):
+    """Begin metering a run of ``page``; runs nest (a fragment inside its page)."""
+    if ":" not in page:
+        # A full script run starts fresh; runs cut short by st.rerun() never finished
+        _stack().clear()
+    _stack().append(PayloadReport(page, 0, {}, PAGE_BUDGETS.get(page)))
+
+
+def measure(source: str, body: str) -> int:
+    """Count ``body`` against ``source`` in every active run, returning its size in bytes."""
+    size = len(body.encode("utf-8"))
+    stack = _stack()
+    for i, run in enumerate(stack):
+        run.by_source[source] = run.by_source.get(source, 0) + size
+        stack[i] = run._replace(total=run.total + size)
+    return size
+
+
+def markdown(source: str, body: str, **kwargs):
+    """``st.markdown`` with the body metered under ``source``."""
+    import streamlit as st
+    measure(source, body)
+    return st.markdown(body, **kwargs)
+
+
+def finish_page() -> PayloadReport:
+    """End the innermost run, record it and check its budget."""
+    stack = _stack()
+    if not stack:
+        return None
+    report = stack.pop()
+    with _lock:
+        history = _history.get(report.page)
+        if history is None:
+            history = _history[report.page] = deque(maxlen=WINDOW)
+        history.append(dict(report.by_source, total=report.total))
+
+    logger.debug(json.dumps({"event": "payload", "page": report.page, "total_bytes": report.total,
+                             "by_source": report.by_source, "budget": report.budget}))
+    if report.over_budget:
+        message = f"{report.page} emitted {report.total} metered bytes (budget {report.budget}): {report.by_source}"
+        if strict_mode():
+            raise PayloadBudgetError(message)
+        logger.warning(message)
+    return report
+
+
+def page_stats(page: str = None) -> List[PageStats]:
+    """Aggregate sizes per page over recent runs, optionally for one page."""
+    with _lock:
+        histories = [(name, list(runs)) for name, runs in _history.items() if page is None or name == page]
+    stats = []
+    for name, runs in histories:
+        totals = [run["total"] for run in runs]
+        sources = sorted({source for run in runs for source in run if source != "total"})
+        stats.append(PageStats(
+            name,
+            len(runs),
+            totals[-1],
+            sum(totals) / len(totals),
+            max(totals),
+            {source: sum(run.get(source, 0) for run in runs) / len(runs) for source in sources},
+            PAGE_BUDGETS.get(name),
+        ))
+    return stats
+
+
+def reset():
+    """Forget recorded runs and any unfinished runs on this thread."""
+    with _lock:
+        _history.clear()
+    _stack().clear()
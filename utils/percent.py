@@ -0,0 +1,77 @@
+"""Percent table and per-row barbell loading calculations."""
+
+import csv
+import io
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from utils.plates import PlateIndex, get_plate_index
+from utils.units import ROUNDING_INCREMENTS, round_weight
+
+# 0% to 100% in 5% increments
+PERCENTAGES = list(range(0, 105, 5))
+
+# Rounding rules understood by utils.units.round_weight
+ROUNDING_OPTIONS = list(ROUNDING_INCREMENTS)
+
+
+class PercentRow(NamedTuple):
+    """One row of a percent table."""
+    percent: float
+    weight: float
+    rounded: float
+
+
+class Loading(NamedTuple):
+    """A barbell loading for one total: per-side plates, achieved total and delta."""
+    plates: List[Tuple[float, int]]
+    achieved: float
+    delta: float
+
+
+def percent_rows(
+    base_weight: float,
+    rounding: str = "None",
+    unit: str = "lb",
+    percentages: Sequence[float] = PERCENTAGES
+) -> List[PercentRow]:
+    """Exact and rounded weights for each percentage of ``base_weight``."""
+    rows = []
+    for pct in percentages:
+        weight = base_weight * (pct / 100)
+        rows.append(PercentRow(pct, weight, round_weight(weight, rounding, unit)))
+    return rows
+
+
+def loadings_for_totals(
+    totals: Sequence[float],
+    bar_weight: float,
+    inventory: Dict[float, int],
+    prefer_over: bool = False
+) -> List[Loading]:
+    """Pack every total (bar included) against one inventory in a single batched pass."""
+    return loadings_from_index(get_plate_index(inventory), totals, bar_weight, prefer_over)
+
+
+def loadings_from_index(
+    index: PlateIndex,
+    totals: Sequence[float],
+    bar_weight: float,
+    prefer_over: bool = False
+) -> List[Loading]:
+    """Like :func:`loadings_for_totals`, for callers that already hold the index."""
+    per_side = [max(total - bar_weight, 0) / 2 for total in totals]
+    batch = index.pack_batch(per_side, prefer_over)
+    loadings = []
+    for total, plates, achieved_per_side in zip(totals, batch.plates, batch.achieved):
+        achieved = bar_weight + achieved_per_side * 2
+        loadings.append(Loading(plates, achieved, achieved - total))
+    return loadings
+
+
+def table_csv(columns: Dict[str, List[str]]) -> str:
+    """CSV text for a column-oriented table (header row first), without pandas."""
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(zip(*columns.values()))
+    return output.getvalue()
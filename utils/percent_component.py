@@ -0,0 +1,39 @@
+"""Browser-rendered Percent Calculator table (static Streamlit component)."""
+
+from pathlib import Path
+from typing import Optional
+
+import streamlit.components.v1 as components
+
+from utils.assets import get_stylesheet
+from utils.percent import PERCENTAGES, ROUNDING_OPTIONS
+from utils.units import ROUNDING_INCREMENTS
+
+_FRONTEND_DIR = Path(__file__).resolve().parent.parent / "components" / "percent_table"
+_percent_table = components.declare_component("percent_table", path=str(_FRONTEND_DIR))
+
+# The component is served from <app>/component/<name>/, so this reaches the app
+# root (and static files) under any server.baseUrlPath
+APP_ROOT = "../../"
+
+# (label, increment) pairs, the same rules as the Percent Calculator page
+ROUNDINGS = [(label, ROUNDING_INCREMENTS[label]) for label in ROUNDING_OPTIONS]
+
+
+def percent_table(base_weight: float = 100.0, unit: str = "lb", key: Optional[str] = None) -> dict:
+    """Render the percent table in the browser.
+
+    Typing, rounding and copying are handled client-side. Python only sees the
+    settled ``{"base_weight": ..., "unit": ...}`` after the input is committed,
+    so keystrokes cause no reruns.
+    """
+    stylesheet = get_stylesheet()
+    return _percent_table(
+        base_weight=base_weight,
+        unit=unit,
+        percentages=PERCENTAGES,
+        roundings=ROUNDINGS,
+        stylesheet=f"{APP_ROOT}{stylesheet.url}" if stylesheet.url else None,
+        key=key,
+        default={"base_weight": base_weight, "unit": unit}
+    )
@@ -0,0 +1,174 @@
+"""Plan several bars that draw from one shared plate inventory."""
+
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from utils.plates import FrozenInventory, PlateIndex, freeze_inventory
+from utils.units import Weight
+
+# Deviation (total weight) below which a bar counts as on target
+SHORT_TOLERANCE = 0.01
+
+# Passes of re-solving one bar (or a pair of bars) against what the others leave
+MAX_ROUNDS = 8
+
+# Loads tried for a short bar when re-solving it together with another bar
+PAIR_CANDIDATES = 16
+
+
+class BarPlan(NamedTuple):
+    """One bar's share of the inventory: per-side plates and how close it gets."""
+    target: float
+    achieved: float
+    plates: List[Tuple[float, int]]
+    deviation: float
+
+
+class ClassPlan(NamedTuple):
+    """Loadings for every bar, in input order, and what is left on the tree."""
+    bars: List[BarPlan]
+    total_deviation: float
+    short: List[int]
+    leftover: Dict[Weight, int]
+
+
+def _per_side_target(target: float, bar_weight: float) -> Weight:
+    return Weight(Weight.steps_floor(max(target - bar_weight, 0) / 2))
+
+
+def _solve(
+    target: Weight,
+    available: Dict[Weight, int],
+    indexes: Dict[FrozenInventory, PlateIndex],
+    results: Dict[Tuple[int, FrozenInventory], Tuple[int, Tuple[Tuple[Weight, int], ...]]]
+) -> Tuple[int, Tuple[Tuple[Weight, int], ...]]:
+    """Best per-side load at or under ``target`` from ``available`` pairs, as ``(units, combo)``.
+
+    Indexes are kept per plan call rather than in the shared process caches,
+    which the many intermediate inventories would otherwise flush.
+    """
+    capped = _capped(target, available)
+    key = (target.quarters, capped)
+    result = results.get(key)
+    if result is None:
+        plates, achieved = _index(capped, indexes).nearest_under(float(target))
+        result = results[key] = (Weight.steps_floor(achieved), tuple(plates))
+    return result
+
+
+def _capped(target: Weight, available: Dict[Weight, int]) -> FrozenInventory:
+    # Never index more of a plate than this bar could use; keeps each solve small
+    return freeze_inventory({
+        weight: min(count, target.quarters // weight.quarters)
+        for weight, count in available.items() if weight.quarters > 0
+    })
+
+
+def _index(capped: FrozenInventory, indexes: Dict[FrozenInventory, PlateIndex]) -> PlateIndex:
+    index = indexes.get(capped)
+    if index is None:
+        index = indexes[capped] = PlateIndex(capped)
+    return index
+
+
+def _plate_count(combo) -> int:
+    return sum(count for _, count in combo)
+
+
+def _take(available: Dict[Weight, int], combo, sign: int):
+    for weight, count in combo:
+        available[weight] += sign * count
+
+
+def _pair_move(short: int, other: int, wanted, loads, available, indexes, results) -> bool:
+    """Re-solve a short bar together with one other bar; True if their combined load improved.
+
+    The short bar tries its best loads from both bars' plates (closest first)
+    and the other bar is re-solved with what remains. This frees plates that
+    single-bar re-solves cannot, e.g. a 25 held by one bar that could use 10s.
+    """
+    _take(available, loads[short][1], 1)
+    _take(available, loads[other][1], 1)
+    best = (loads[short][0] + loads[other][0], -_plate_count(loads[short][1]) - _plate_count(loads[other][1]))
+    choice = None
+    index = _index(_capped(wanted[short], available), indexes)
+    position = index.positions([float(wanted[short])])[0]
+    tried = 0
+    while position >= 0 and index.totals[position] > loads[short][0] and tried < PAIR_CANDIDATES:
+        combo = index.combo(position)
+        _take(available, combo, -1)
+        partner = _solve(wanted[other], available, indexes, results)
+        _take(available, combo, 1)
+        score = (index.totals[position] + partner[0], -_plate_count(combo) - _plate_count(partner[1]))
+        if score > best:
+            best, choice = score, ((index.totals[position], combo), partner)
+        position -= 1
+        tried += 1
+    if choice is not None:
+        loads[short], loads[other] = choice
+    _take(available, loads[short][1], -1)
+    _take(available, loads[other][1], -1)
+    return choice is not None
+
+
+def plan_bars(
+    targets: Sequence[float],
+    bar_weight: float,
+    inventory: Dict[float, int],
+    tolerance: float = SHORT_TOLERANCE
+) -> ClassPlan:
+    """Load every bar as close to its target as the shared inventory allows.
+
+    ``inventory`` counts pairs, one plate per side. Bars are only ever loaded
+    at or under their targets, never over a prescribed weight, so "as close
+    as possible" means the total shortfall is minimized: each bar first gets
+    its ideal load; if the tree runs short, bars are filled heaviest first and
+    then re-solved one at a time against what the others leave until no bar
+    improves.
+    """
+    available = {weight: count for weight, count in freeze_inventory(inventory)}
+    wanted = [_per_side_target(target, bar_weight) for target in targets]
+    indexes: Dict[FrozenInventory, PlateIndex] = {}
+    results: Dict = {}
+
+    # Ideal loads; if the tree covers them all, they are optimal
+    loads = [_solve(target, available, indexes, results) for target in wanted]
+    needed: Dict[Weight, int] = {}
+    for _, combo in loads:
+        for weight, count in combo:
+            needed[weight] = needed.get(weight, 0) + count
+    if any(count > available.get(weight, 0) for weight, count in needed.items()):
+        # Heaviest targets first: they are the ones that need the big plates
+        loads = [(0, ())] * len(wanted)
+        for position in sorted(range(len(wanted)), key=lambda i: -wanted[i].quarters):
+            loads[position] = _solve(wanted[position], available, indexes, results)
+            _take(available, loads[position][1], -1)
+
+        # Coordinate descent: give one bar back its plates and re-solve it,
+        # then re-solve short bars in pairs with bars holding plates they lack
+        for _ in range(MAX_ROUNDS):
+            improved = False
+            for position, target in enumerate(wanted):
+                _take(available, loads[position][1], 1)
+                candidate = _solve(target, available, indexes, results)
+                if (candidate[0], -_plate_count(candidate[1])) > (loads[position][0], -_plate_count(loads[position][1])):
+                    loads[position] = candidate
+                    improved = True
+                _take(available, loads[position][1], -1)
+            for short in [position for position, target in enumerate(wanted) if loads[position][0] < target.quarters]:
+                for other in range(len(wanted)):
+                    if other != short and loads[other][1] and loads[short][0] < wanted[short].quarters:
+                        improved = _pair_move(short, other, wanted, loads, available, indexes, results) or improved
+            if not improved:
+                break
+    else:
+        for _, combo in loads:
+            _take(available, combo, -1)
+
+    bars = []
+    for target, (units, combo) in zip(targets, loads):
+        achieved = bar_weight + float(Weight(units)) * 2 if target > bar_weight else bar_weight
+        bars.append(BarPlan(target, achieved, list(combo), max(target - achieved, 0.0)))
+    total = sum(bar.deviation for bar in bars)
+    short = [position for position, bar in enumerate(bars) if bar.deviation > tolerance]
+    leftover = {weight: count for weight, count in sorted(available.items(), reverse=True) if count > 0}
+    return ClassPlan(bars, total, short, leftover)
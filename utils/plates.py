@@ -1,9 +1,14 @@
 """Plate utilities for tap-to-build barbell calculator."""
 
-from typing import Dict, List, Tuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from utils.cache import LRUCache
+from utils.units import Weight
 
 # Available plate weights in pounds (heaviest to lightest)
-PLATE_WEIGHTS = [45, 35, 25, 15, 10, 5, 2.5, 1]
+PLATE_WEIGHTS = [Weight.of(weight) for weight in (45, 35, 25, 15, 10, 5, 2.5, 1)]
 
 # Plate thickness in pixels for visualization
 PLATE_THICKNESS = {
@@ -29,6 +34,35 @@ PLATE_COLORS = {
     1: "#C0C0C0"      # Silver
 }
 
+# Competition colors for kilogram plates
+KG_PLATE_COLORS = {
+    25: "#DC2626",    # Red
+    20: "#2563EB",    # Blue
+    15: "#FACC15",    # Yellow
+    10: "#16A34A",    # Green
+    5: "#F8FAFC",     # White
+    2.5: "#0F172A",   # Black
+    1.25: "#C0C0C0"   # Silver
+}
+
+# Plate thickness in pixels for kilogram plates
+KG_PLATE_THICKNESS = {
+    25: 40,
+    20: 38,
+    15: 32,
+    10: 26,
+    5: 18,
+    2.5: 14,
+    1.25: 10
+}
+
+# Rendered loadouts shared by every session (see render_loadout)
+RENDER_CACHE = LRUCache(maxsize=4096)
+
+# Fallbacks for plates outside the known sets
+DEFAULT_PLATE_COLOR = "#94A3B8"
+DEFAULT_PLATE_THICKNESS = 10
+
 def calculate_total_weight(bar_weight: float, pair_counts: Dict[float, int]) -> float:
     """Calculate total barbell weight."""
     plate_weight = sum(weight * count * 2 for weight, count in pair_counts.items())
@@ -40,12 +74,370 @@ def calculate_per_side_weight(pair_counts: Dict[float, int]) -> float:
 
 def get_per_side_breakdown(pair_counts: Dict[float, int]) -> List[Tuple[float, int]]:
     """Get per-side breakdown sorted by weight (heaviest first)."""
-    breakdown = []
-    for weight in PLATE_WEIGHTS:  # Already sorted heaviest to lightest
-        count = pair_counts.get(weight, 0)
+    return sorted(((weight, count) for weight, count in pair_counts.items() if count > 0), reverse=True)
+
+def _weight_label(weight: float) -> str:
+    """Format a plate weight without a trailing .0."""
+    return str(Weight.of(weight))
+
+def _count_encoding(items: List[Tuple[Weight, int, int]], counts: Sequence[int]) -> List[int]:
+    """Place values that pack per-type counts into one int, heaviest type most significant.
+
+    Comparing packed ints then orders combinations like comparing their count
+    tuples, without building a tuple per candidate.
+    """
+    base = max(counts, default=0) + 1
+    return [base ** (len(items) - 1 - index) for index in range(len(items))]
+
+def _decode_counts(key: int, places: List[int]) -> Tuple[int, ...]:
+    counts = []
+    for place in places:
+        used, key = divmod(key, place)
+        counts.append(used)
+    return tuple(counts)
+
+Reachable = Tuple[Dict[int, Tuple[int, int]], List[int]]
+
+def _solve_reachable(items: List[Tuple[Weight, int, int]], cap: int) -> Reachable:
+    """Bounded knapsack over plate types, keeping the fewest plates per reachable total.
+
+    ``items`` holds ``(weight, quarters, count)`` sorted heaviest first. Returns a map
+    from total units to ``(plate_count, packed_counts)`` and the place values that
+    unpack the counts (see :func:`_decode_counts`); totals above ``cap`` are pruned.
+    """
+    places = _count_encoding(items, [count for _, _, count in items])
+    reachable = {0: (0, 0)}
+    for (_, units, count), place in zip(items, places):
+        if units <= 0 or count <= 0:
+            continue
+        extended = dict(reachable)
+        for total, (plates, key) in reachable.items():
+            for used in range(1, count + 1):
+                new_total = total + units * used
+                if new_total > cap:
+                    break
+                current = extended.get(new_total)
+                # Fewest plates first, then heavier plates for equal counts
+                if current is None or plates + used < current[0] or (
+                    plates + used == current[0] and key + place * used > current[1]
+                ):
+                    extended[new_total] = (plates + used, key + place * used)
+        reachable = extended
+    return reachable, places
+
+# A (plate_count, width, packed_counts) Pareto front; shared between DP stages, so never mutated
+Front = Tuple[Tuple[int, int, int], ...]
+
+def _solve_fitting(
+    items: List[Tuple[Weight, int, int]],
+    widths: Sequence[int],
+    sleeve: int
+) -> Reachable:
+    """Like :func:`_solve_reachable`, keeping only loads whose plates fit on the sleeve.
+
+    ``widths`` holds each item's thickness and ``sleeve`` the usable sleeve
+    length, in the same integer units. Each total keeps its Pareto front of
+    ``(plate_count, width)`` so a thinner but larger combination is not lost
+    to a smaller one that leaves no room; loads wider than the sleeve are
+    pruned as they are built. Equal plate counts keep the heavier plates, as
+    in :func:`_solve_reachable`.
+    """
+    counts_fitting = [min(count, sleeve // width) if width > 0 else count for (_, _, count), width in zip(items, widths)]
+    if sum(width * count for width, count in zip(widths, counts_fitting)) <= sleeve:
+        # No combination can overflow; the plain solver over the plates that fit is exact
+        items = [(weight, units, count) for (weight, units, _), count in zip(items, counts_fitting)]
+        return _solve_reachable(items, sum(units * count for _, units, count in items))
+    # Thinnest plates first: the thick ones then come last, where most loads
+    # run out of sleeve and break off early, which keeps the fronts small
+    order = sorted(range(len(items)), key=lambda index: widths[index])
+    # Width still addable after each step; a load with room for all of it can never overflow
+    room_needed = [0] * (len(order) + 1)
+    for step in range(len(order) - 1, -1, -1):
+        room_needed[step] = room_needed[step + 1] + widths[order[step]] * counts_fitting[order[step]]
+
+    places = _count_encoding(items, counts_fitting)
+    fronts: Dict[int, Front] = {0: ((0, 0, 0),)}
+    for step, index in enumerate(order):
+        units, width, count = items[index][1], widths[index], counts_fitting[index]
+        if units <= 0 or count <= 0:
+            continue
+        slack = sleeve - room_needed[step + 1]
+        # (plates, width, total, packed count) added by each number of pairs of this plate
+        steps = [(used, width * used, units * used, places[index] * used) for used in range(1, count + 1)]
+        extended = dict(fronts)
+        get = extended.get
+        for total, front in fronts.items():
+            for plates, used_width, key in front:
+                for used, added_width, added_units, added_key in steps:
+                    new_width = used_width + added_width
+                    if new_width > sleeve:
+                        break
+                    # Width no longer matters once the rest always fits; 0 collapses the front
+                    if new_width <= slack:
+                        new_width = 0
+                    new_total = total + added_units
+                    new_plates, new_key = plates + used, key + added_key
+                    target = get(new_total)
+                    if target is None:
+                        extended[new_total] = ((new_plates, new_width, new_key),)
+                    elif len(target) == 1:
+                        # Most fronts hold one entry; settle those without the general merge
+                        other_plates, other_width, other_key = target[0]
+                        if other_plates <= new_plates and other_width <= new_width and (
+                            other_plates < new_plates or other_key >= new_key
+                        ):
+                            continue
+                        if new_plates <= other_plates and new_width <= other_width and (
+                            new_plates < other_plates or new_key >= other_key
+                        ):
+                            extended[new_total] = ((new_plates, new_width, new_key),)
+                        else:
+                            extended[new_total] = target + ((new_plates, new_width, new_key),)
+                    else:
+                        extended[new_total] = _add_to_front(target, (new_plates, new_width, new_key))
+        fronts = extended
+    # Closest load is chosen later; here each total needs only its fewest-plates combination
+    best = {}
+    for total, front in fronts.items():
+        plates, _, key = front[0] if len(front) == 1 else min(front, key=lambda entry: (entry[0], -entry[2]))
+        best[total] = (plates, key)
+    return best, places
+
+def _add_to_front(front: Front, candidate: Tuple[int, int, int]) -> Front:
+    """``front`` with ``candidate`` merged in, dropping entries it dominates.
+
+    An entry dominates another with no more plates and no more width, and
+    either fewer plates or heavier plates (a larger packed key).
+    """
+    plates, width, key = candidate
+    for other_plates, other_width, other_key in front:
+        if other_plates <= plates and other_width <= width and (other_plates < plates or other_key >= key):
+            return front
+    kept = [
+        entry for entry in front
+        if not (plates <= entry[0] and width <= entry[1] and (plates < entry[0] or key >= entry[2]))
+    ]
+    kept.append(candidate)
+    return tuple(kept)
+
+FrozenInventory = Tuple[Tuple[Weight, int], ...]
+
+# Sleeve constraint: per-plate thickness aligned with a FrozenInventory, and the
+# usable sleeve length, both in tenths of a millimetre
+SleeveFit = Tuple[Tuple[int, ...], int]
+
+def freeze_inventory(available_plates: Dict[float, int]) -> FrozenInventory:
+    """Canonical hashable form of a plate inventory (heaviest first, empty slots dropped).
+
+    Keys are snapped to :class:`Weight`, so float and Weight keys for the same
+    plate share one entry.
+    """
+    merged: Dict[Weight, int] = {}
+    for weight, count in available_plates.items():
         if count > 0:
-            breakdown.append((weight, count))
-    return breakdown
+            key = Weight.of(weight)
+            merged[key] = merged.get(key, 0) + int(count)
+    return tuple(sorted(merged.items(), reverse=True))
+
+class PlateIndex:
+    """Every achievable per-side total of one inventory, sorted for bisect lookups.
+
+    Built once per inventory; each total keeps its fewest-plates combination.
+    Totals are stored as integer quarter units (see :class:`Weight`). With a
+    ``fit``, only loads that fit on the sleeve are indexed.
+    """
+
+    __slots__ = ("inventory", "fit", "totals", "_weights", "_keys", "_places", "_combos", "_positions", "_array")
+
+    def __init__(self, inventory: FrozenInventory, fit: Optional[SleeveFit] = None):
+        items = [(weight, weight.quarters, count) for weight, count in inventory]
+        if fit is None:
+            reachable, places = _solve_reachable(items, sum(units * count for _, units, count in items))
+        else:
+            reachable, places = _solve_fitting(items, *fit)
+        self.inventory = inventory
+        self.fit = fit
+        self.totals = sorted(reachable)
+        self._weights = [weight for weight, _, _ in items]
+        self._keys = [reachable[total][1] for total in self.totals]
+        self._places = places
+        self._combos: Dict[int, Tuple[Tuple[Weight, int], ...]] = {}
+        self._positions = {total: position for position, total in enumerate(self.totals)}
+        self._array = None
+
+    def combo(self, position: int) -> Tuple[Tuple[Weight, int], ...]:
+        """Per-side ``(weight, count)`` plates of the load at ``position``, unpacked on first use."""
+        combo = self._combos.get(position)
+        if combo is None:
+            counts = _decode_counts(self._keys[position], self._places)
+            combo = self._combos[position] = tuple(
+                (weight, used) for weight, used in zip(self._weights, counts) if used > 0
+            )
+        return combo
+
+    def _entry(self, position: int) -> Tuple[List[Tuple[float, int]], float]:
+        return list(self.combo(position)), float(Weight(self.totals[position]))
+
+    def exact(self, target: float) -> Optional[List[Tuple[float, int]]]:
+        """Plates that hit ``target`` exactly, or ``None`` if it is not achievable."""
+        steps = Weight.steps_floor(target)
+        if steps != Weight.steps_ceil(target):
+            return None
+        position = self._positions.get(steps)
+        return None if position is None else list(self.combo(position))
+
+    def nearest_under(self, target: float) -> Tuple[List[Tuple[float, int]], float]:
+        """Heaviest load at or under ``target`` (an empty bar at worst)."""
+        position = bisect_right(self.totals, Weight.steps_floor(max(target, 0))) - 1
+        return self._entry(position)
+
+    def nearest_over(self, target: float) -> Optional[Tuple[List[Tuple[float, int]], float]]:
+        """Lightest load at or over ``target``, or ``None`` if it is out of reach."""
+        position = bisect_left(self.totals, Weight.steps_ceil(max(target, 0)))
+        return self._entry(position) if position < len(self.totals) else None
+
+    def pack(self, target_per_side: float, prefer_over: bool = False) -> Tuple[List[Tuple[float, int]], float, float]:
+        """Same contract as :func:`pack_plates`."""
+        best = self.nearest_over(target_per_side) if prefer_over else None
+        plates, achieved = best or self.nearest_under(target_per_side)
+        return plates, achieved, achieved - target_per_side
+
+    def positions(self, targets: Sequence[float], prefer_over: bool = False) -> List[int]:
+        """Index positions of the best load for each target (see :meth:`pack`)."""
+        totals = self.totals
+        last = len(totals)
+        result = []
+        for target in targets:
+            target = max(target, 0)
+            position = bisect_left(totals, Weight.steps_ceil(target)) if prefer_over else last
+            if position == last:
+                position = bisect_right(totals, Weight.steps_floor(target)) - 1
+            result.append(position)
+        return result
+
+    def totals_array(self):
+        """Sorted totals as a NumPy array, built on first use."""
+        if self._array is None:
+            import numpy as np
+            self._array = np.asarray(self.totals, dtype=np.int64)
+        return self._array
+
+    def pack_batch(self, targets: Sequence[float], prefer_over: bool = False) -> "PackBatch":
+        """Pack many per-side targets in one pass.
+
+        NumPy input is answered with one vectorized ``searchsorted`` and returns
+        NumPy ``achieved``/``delta`` columns; other input returns lists.
+        """
+        if hasattr(targets, "__array__"):
+            import numpy as np
+            values = np.asarray(targets, dtype=float)
+            totals = self.totals_array()
+            scaled = np.maximum(values, 0) * Weight.STEPS_PER_UNIT
+            positions = np.searchsorted(totals, np.floor(scaled + 1e-9).astype(np.int64), side="right") - 1
+            if prefer_over:
+                over = np.searchsorted(totals, np.ceil(scaled - 1e-9).astype(np.int64), side="left")
+                positions = np.where(over < len(totals), over, positions)
+            achieved = totals[positions] / Weight.STEPS_PER_UNIT
+            plates = [list(self.combo(position)) for position in positions.tolist()]
+            return PackBatch(plates, achieved, achieved - values)
+
+        values = list(targets)
+        positions = self.positions(values, prefer_over)
+        achieved = [self.totals[position] / Weight.STEPS_PER_UNIT for position in positions]
+        plates = [list(self.combo(position)) for position in positions]
+        return PackBatch(plates, achieved, [got - target for got, target in zip(achieved, values)])
+
+@lru_cache(maxsize=64)
+def _cached_index(inventory: FrozenInventory, fit: Optional[SleeveFit] = None) -> PlateIndex:
+    return PlateIndex(inventory, fit)
+
+@lru_cache(maxsize=256)
+def _index_for_items(items: Tuple[Tuple[float, int], ...]) -> PlateIndex:
+    # Raw dict items skip re-freezing inventories that were seen before
+    return _cached_index(freeze_inventory(dict(items)))
+
+def _tenths(mm: float) -> int:
+    return int(round(float(mm) * 10))
+
+@lru_cache(maxsize=256)
+def _fitted_index_for_items(
+    items: Tuple[Tuple[float, int], ...],
+    sleeve_length: float,
+    thickness: Tuple[Tuple[float, float], ...]
+) -> PlateIndex:
+    inventory = freeze_inventory(dict(items))
+    widths = {Weight.of(weight): _tenths(mm) for weight, mm in thickness}
+    missing = [str(weight) for weight, _ in inventory if weight not in widths]
+    if missing:
+        raise ValueError(f"No thickness given for plates: {', '.join(missing)}")
+    return _cached_index(inventory, (tuple(widths[weight] for weight, _ in inventory), _tenths(sleeve_length)))
+
+def get_plate_index(
+    available_plates: Dict[float, int],
+    sleeve_length: Optional[float] = None,
+    thickness: Optional[Dict[float, float]] = None
+) -> PlateIndex:
+    """Shared, process-wide index for an inventory, optionally limited to loads that fit the sleeve."""
+    if sleeve_length is None:
+        return _index_for_items(tuple(available_plates.items()))
+    return _fitted_index_for_items(tuple(available_plates.items()), sleeve_length, tuple((thickness or {}).items()))
+
+def pack_plates(
+    target_per_side: float,
+    available_plates: Dict[float, int],
+    prefer_over: bool = False,
+    sleeve_length: Optional[float] = None,
+    thickness: Optional[Dict[float, float]] = None
+) -> Tuple[List[Tuple[float, int]], float, float]:
+    """Find the closest achievable per-side load from a bounded plate inventory.
+
+    ``available_plates`` maps plate weight to the number of pairs on hand. The
+    best load at or under the target is returned, or at or over it when
+    ``prefer_over`` is set (falling back to the heaviest load if the target is
+    out of reach). Ties are broken by fewest plates.
+
+    With ``sleeve_length`` (mm of usable sleeve), only loads whose plates fit
+    are considered; ``thickness`` maps each plate weight to its thickness in mm
+    (see :meth:`utils.catalog.PlateCatalog.thickness`).
+
+    Returns ``(plates, achieved, delta)`` where ``plates`` is a list of
+    ``(weight, count)`` per side, heaviest first, and ``delta`` is
+    ``achieved - target_per_side``.
+    """
+    return get_plate_index(available_plates, sleeve_length, thickness).pack(target_per_side, prefer_over)
+
+def stack_thickness(plates: List[Tuple[float, int]], thickness: Dict[float, float]) -> float:
+    """Sleeve length in mm taken by one side's plates."""
+    widths = {Weight.of(weight): mm for weight, mm in thickness.items()}
+    return sum(widths[Weight.of(weight)] * count for weight, count in plates)
+
+class PackBatch(NamedTuple):
+    """Columnar result of :func:`pack_plates_batch`, one entry per target."""
+    plates: List[List[Tuple[float, int]]]
+    achieved: Sequence[float]
+    delta: Sequence[float]
+
+def pack_plates_batch(
+    targets: Sequence[float],
+    available_plates: Dict[float, int],
+    prefer_over: bool = False
+) -> PackBatch:
+    """Pack many per-side targets against one inventory in a single pass.
+
+    Accepts a plain sequence or a NumPy array; see :meth:`PlateIndex.pack_batch`.
+    """
+    return get_plate_index(available_plates).pack_batch(targets, prefer_over)
+
+def format_plate_stack(plates: List[Tuple[float, int]], unit: str = "lb") -> str:
+    """Format a per-side plate list as a single line (e.g. "45 lb x 2, 5 lb x 1")."""
+    if not plates:
+        return "No plates needed"
+    return ", ".join(f"{_weight_label(weight)} {unit} x {count}" for weight, count in plates)
+
+def calculate_plate_colors(plates: List[Tuple[float, int]], unit: str = "lb") -> List[Tuple[str, int]]:
+    """Map a per-side plate list to ``(color, count)`` pairs in the same order."""
+    palette = PLATE_COLORS if unit == "lb" else KG_PLATE_COLORS
+    return [(palette.get(weight, DEFAULT_PLATE_COLOR), count) for weight, count in plates]
 
 def format_per_side_breakdown(pair_counts: Dict[float, int]) -> str:
     """Format per-side breakdown as vertical text."""
@@ -55,21 +447,22 @@ def format_per_side_breakdown(pair_counts: Dict[float, int]) -> str:
     
     lines = []
     for weight, count in breakdown:
-        weight_str = f"{int(weight)}" if weight == int(weight) else f"{weight}"
-        lines.append(f"{weight_str} x {count}")
+        lines.append(f"{_weight_label(weight)} x {count}")
     
     return "\n".join(lines)
 
-def generate_barbell_visualization(bar_weight: float, pair_counts: Dict[float, int]) -> str:
+def generate_barbell_visualization(bar_weight: float, pair_counts: Dict[float, int], unit: str = "lb") -> str:
     """Generate HTML for barbell visualization."""
+    colors = PLATE_COLORS if unit == "lb" else KG_PLATE_COLORS
+    thicknesses = PLATE_THICKNESS if unit == "lb" else KG_PLATE_THICKNESS
     # Get plates sorted by weight for proper ordering (heaviest innermost)
     plates_per_side = get_per_side_breakdown(pair_counts)
     
     # Build left side plates (lightest to heaviest for proper visual stacking)
     left_plates = []
     for weight, count in plates_per_side:
-        color = PLATE_COLORS[weight]
-        thickness = PLATE_THICKNESS[weight]
+        color = colors.get(weight, DEFAULT_PLATE_COLOR)
+        thickness = thicknesses.get(weight, DEFAULT_PLATE_THICKNESS)
         for _ in range(count):
             left_plates.append(f'<div style="display: inline-block; width: {thickness}px; height: 80px; background-color: {color}; border: 2px solid #333; margin: 1px; vertical-align: middle;"></div>')
     
@@ -82,8 +475,8 @@ def generate_barbell_visualization(bar_weight: float, pair_counts: Dict[float, i
     # Build right side plates (heaviest to lightest for proper visual stacking)
     right_plates = []
     for weight, count in plates_per_side:
-        color = PLATE_COLORS[weight]
-        thickness = PLATE_THICKNESS[weight]
+        color = colors.get(weight, DEFAULT_PLATE_COLOR)
+        thickness = thicknesses.get(weight, DEFAULT_PLATE_THICKNESS)
         for _ in range(count):
             right_plates.append(f'<div style="display: inline-block; width: {thickness}px; height: 80px; background-color: {color}; border: 2px solid #333; margin: 1px; vertical-align: middle;"></div>')
     
@@ -97,3 +490,71 @@ def generate_barbell_visualization(bar_weight: float, pair_counts: Dict[float, i
     '''
     
     return barbell_html
+
+def generate_barbell_svg(
+    bar_weight: float,
+    pair_counts: Dict[float, int],
+    unit: str = "lb",
+    id_prefix: str = "bb"
+) -> str:
+    """Generate a compact SVG barbell visualization.
+
+    Each plate type is defined once as a tiling ``<pattern>`` and every run of
+    identical plates is a single pattern-filled ``<rect>``. One side is drawn
+    once as a ``<symbol>`` and placed twice, mirrored on the left.
+    """
+    colors = PLATE_COLORS if unit == "lb" else KG_PLATE_COLORS
+    thicknesses = PLATE_THICKNESS if unit == "lb" else KG_PLATE_THICKNESS
+
+    defs = []
+    runs = []
+    side_width = 0
+    for weight, count in get_per_side_breakdown(pair_counts):
+        pattern_id = f"{id_prefix}{len(defs)}"
+        thickness = thicknesses.get(weight, DEFAULT_PLATE_THICKNESS)
+        pitch = thickness + 6  # 2px border and 1px margin on each side
+        color = colors.get(weight, DEFAULT_PLATE_COLOR)
+        defs.append(
+            f'<pattern id="{pattern_id}" width="{pitch}" height="84" patternUnits="userSpaceOnUse">'
+            f'<rect x="2" y="2" width="{thickness + 2}" height="80" fill="{color}"/></pattern>'
+        )
+        offset = f' transform="translate({side_width})"' if side_width else ""
+        runs.append(f'<rect{offset} width="{pitch * count}" height="84" fill="url(#{pattern_id})"/>')
+        side_width += pitch * count
+
+    bar_start = side_width + 10
+    width = bar_start * 2 + 200
+    sides = ""
+    if runs:
+        defs.append(f'<symbol id="{id_prefix}s" overflow="visible">{"".join(runs)}</symbol>')
+        sides = (
+            f'<use href="#{id_prefix}s" transform="matrix(-1 0 0 1 {side_width} 0)"/>'
+            f'<use href="#{id_prefix}s" x="{bar_start + 210}"/>'
+        )
+
+    return (
+        f'<svg class="barbell-container" viewBox="0 0 {width} 84" width="100%" style="max-width:{width}px" '
+        f'role="img" aria-label="{bar_weight} {unit} bar">'
+        f'<defs stroke="#333" stroke-width="2">{"".join(defs)}</defs>'
+        f'<rect x="{bar_start}" y="32" width="200" height="20" rx="10" fill="#444"/>{sides}</svg>'
+    )
+
+LoadoutKey = Tuple[float, str, Tuple[Tuple[float, int], ...]]
+
+def loadout_key(bar_weight: float, pair_counts: Dict[float, int], unit: str = "lb") -> LoadoutKey:
+    """Hashable form of a loadout: bar, unit and the non-empty plate counts, sorted.
+
+    Weight and numeric keys hash and compare alike, so no normalisation pass
+    is needed for equal loadouts to share one key.
+    """
+    return (bar_weight, unit, tuple(sorted(item for item in pair_counts.items() if item[1])))
+
+def render_loadout(bar_weight: float, pair_counts: Dict[float, int], unit: str = "lb") -> Tuple[str, str]:
+    """Barbell SVG and per-side breakdown text for a loadout, memoized in RENDER_CACHE."""
+    key = loadout_key(bar_weight, pair_counts, unit)
+
+    def render() -> Tuple[str, str]:
+        plates = dict(key[2])
+        return generate_barbell_svg(bar_weight, plates, unit), format_per_side_breakdown(plates)
+
+    return RENDER_CACHE.get_or_compute(key, render)
@@ -0,0 +1,147 @@
+"""Opt-in per-rerun timing of script phases.
+
+Enable with ``FORTRESS_PROFILE=1`` or the ``?profile=1`` query flag. Each
+script run logs one structured line on the ``fortress.profile`` logger and
+feeds rolling per-phase windows shown in a debug panel. Unless logging has
+been configured elsewhere, the lines go to stderr.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, NamedTuple, Tuple
+
+from utils import payload
+
+logger = logging.getLogger("fortress.profile")
+
+# Script runs kept per (script, phase) for the rolling percentiles
+WINDOW = 200
+
+_windows: Dict[Tuple[str, str], Deque[float]] = {}
+_lock = threading.Lock()
+
+
+class PhaseStats(NamedTuple):
+    """Rolling timings for one phase of one script, in milliseconds."""
+    script: str
+    phase: str
+    runs: int
+    p50: float
+    p95: float
+
+
+def profiling_enabled() -> bool:
+    """True when ``FORTRESS_PROFILE`` is set or the page has ``?profile=1``."""
+    if os.environ.get("FORTRESS_PROFILE", "") not in ("", "0"):
+        return True
+    try:
+        import streamlit as st
+        return st.query_params.get("profile", "") not in ("", "0")
+    except Exception:
+        return False
+
+
+def record(script: str, phase: str, ms: float):
+    """Add one phase timing to its rolling window."""
+    with _lock:
+        window = _windows.get((script, phase))
+        if window is None:
+            window = _windows[(script, phase)] = deque(maxlen=WINDOW)
+        window.append(ms)
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def phase_stats(script: str = None) -> List[PhaseStats]:
+    """p50/p95 per recorded phase, optionally for one script."""
+    with _lock:
+        windows = [(key, sorted(values)) for key, values in _windows.items() if script is None or key[0] == script]
+    return [
+        PhaseStats(name, phase, len(values), _percentile(values, 50), _percentile(values, 95))
+        for (name, phase), values in windows
+    ]
+
+
+def reset():
+    """Forget all recorded timings."""
+    with _lock:
+        _windows.clear()
+
+
+class RunProfiler:
+    """Times the phases of one script (or fragment) run; a no-op when disabled."""
+
+    def __init__(self, script: str, enabled: bool):
+        self.script = script
+        self.enabled = enabled
+        self.phases: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block; repeated phases within one run add up."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        yield
+        self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def finish(self):
+        """Record this run's phases and emit its structured log line."""
+        if not self.enabled:
+            return
+        total = (time.perf_counter() - self._start) * 1000
+        for name, ms in self.phases.items():
+            record(self.script, name, ms)
+        record(self.script, "total", total)
+        logger.info(json.dumps({
+            "event": "script_run",
+            "script": self.script,
+            "total_ms": round(total, 3),
+            "phases_ms": {name: round(ms, 3) for name, ms in self.phases.items()},
+        }))
+
+
+def enable_logging():
+    """Send profile lines to stderr at INFO unless a handler is already configured."""
+    with _lock:
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+        if not logger.hasHandlers():
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+
+
+def start_run(script: str) -> RunProfiler:
+    """Profiler for one run of ``script``; disabled unless profiling is switched on."""
+    enabled = profiling_enabled()
+    if enabled:
+        enable_logging()
+    return RunProfiler(script, enabled)
+
+
+def show_debug_panel(profiler: RunProfiler):
+    """Finish ``profiler`` and show its script's rolling timings and payload sizes in a collapsed expander."""
+    profiler.finish()
+    if not profiler.enabled:
+        return
+    import streamlit as st
+    rows = [stats for stats in phase_stats() if stats.script.split(":")[0] == profiler.script.split(":")[0]]
+    lines = ["| Script | Phase | Runs | p50 ms | p95 ms |", "|---|---|---:|---:|---:|"]
+    lines.extend(f"| {s.script} | {s.phase} | {s.runs} | {s.p50:.2f} | {s.p95:.2f} |" for s in rows)
+    sizes = [stats for stats in payload.page_stats() if stats.page.split(":")[0] == profiler.script.split(":")[0]]
+    if sizes:
+        lines.extend(["", "| Page | Runs | Last B | Mean B | Max B | Budget B |", "|---|---:|---:|---:|---:|---:|"])
+        lines.extend(f"| {s.page} | {s.runs} | {s.last} | {s.mean:.0f} | {s.max} | {s.budget or '-'} |" for s in sizes)
+    with st.expander("Debug: rerun timings", expanded=False):
+        st.markdown("\n".join(lines))
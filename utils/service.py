@@ -0,0 +1,140 @@
+"""Shared calculation service for the app, pages, API and CLIs.
+
+Every entry point calls these functions instead of repeating the barbell and
+percent logic. Results are cached process-wide, keyed on canonical inputs
+(rounded numbers, frozen inventories), so the same request from different
+sessions is computed once. Cached values are tuples and must not be mutated.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from utils.cache import LRUCache
+from utils.mixed import MixedInventory, MixedPlate, pack_mixed, split_inventory
+from utils.percent import Loading, PercentRow, loadings_for_totals, percent_rows
+from utils.plates import FrozenInventory, freeze_inventory, pack_plates
+from utils.units import Weight
+
+# Plates assumed when no inventory is given (as many pairs as needed)
+STANDARD_PLATES = {"lb": (45, 35, 25, 10, 5, 2.5), "kg": (25, 20, 15, 10, 5, 2.5, 1.25)}
+
+SETUP_CACHE = LRUCache(maxsize=4096)
+PERCENT_CACHE = LRUCache(maxsize=1024)
+
+
+class BarbellSetup(NamedTuple):
+    """How to load one target: per-side plates and what the bar ends up weighing."""
+    plates: Tuple[Tuple[float, int], ...]
+    per_side: float
+    achieved_total: float
+    delta_total: float
+
+    @property
+    def exact(self) -> bool:
+        return abs(self.delta_total) <= 0.01
+
+
+class MixedSetup(NamedTuple):
+    """How to load one target from plates of both units; weights are in ``unit``."""
+    plates: Tuple[MixedPlate, ...]
+    per_side: float
+    achieved_total: float
+    delta_total: float
+    unit: str
+
+    @property
+    def exact(self) -> bool:
+        return abs(self.delta_total) <= 0.01
+
+
+class PercentTable(NamedTuple):
+    """Percent rows, plus per-row loadings when a bar and inventory were given."""
+    rows: Tuple[PercentRow, ...]
+    loadings: Optional[Tuple[Loading, ...]]
+
+
+def _number(value: float) -> float:
+    """Canonical cache-key form of a user-entered number."""
+    return round(float(value), 6)
+
+
+def _unlimited_inventory(per_side: float, unit: str) -> Dict[float, int]:
+    return {plate: int(per_side // plate) + 1 for plate in STANDARD_PLATES[unit]}
+
+
+def barbell_setup(
+    target_total: float,
+    bar_weight: float,
+    inventory: Optional[Dict[float, int]] = None,
+    collar_weight: float = 0.0,
+    prefer_over: bool = False,
+    unit: str = "lb",
+    sleeve_length: Optional[float] = None,
+    thickness: Optional[Dict[float, float]] = None
+) -> BarbellSetup:
+    """Closest loading of ``target_total`` on a bar (plus collars).
+
+    Without ``inventory``, the unit's standard plates are treated as unlimited.
+    With ``sleeve_length`` (mm), only loads whose plates fit are returned; see
+    :func:`utils.plates.pack_plates` for ``thickness``.
+    """
+    frozen: Optional[FrozenInventory] = None if inventory is None else freeze_inventory(inventory)
+    fit = None
+    if sleeve_length is not None:
+        fit = (_number(sleeve_length), tuple(sorted((Weight.of(w), _number(mm)) for w, mm in (thickness or {}).items())))
+    key = (_number(target_total), _number(bar_weight), _number(collar_weight), frozen, prefer_over, unit, fit)
+
+    def compute() -> BarbellSetup:
+        per_side_target = max(target_total - bar_weight - collar_weight, 0) / 2
+        available = dict(frozen) if frozen is not None else _unlimited_inventory(per_side_target, unit)
+        plates, per_side, _ = pack_plates(per_side_target, available, prefer_over, sleeve_length, thickness)
+        achieved_total = bar_weight + collar_weight + per_side * 2
+        return BarbellSetup(tuple(plates), per_side, achieved_total, achieved_total - target_total)
+
+    return SETUP_CACHE.get_or_compute(key, compute)
+
+
+def mixed_barbell_setup(
+    target_total: float,
+    bar_weight: float,
+    inventory: MixedInventory,
+    unit: str = "lb",
+    collar_weight: float = 0.0,
+    prefer_over: bool = False
+) -> MixedSetup:
+    """Closest loading of ``target_total`` from an inventory keyed by ``(weight, unit)``.
+
+    Target, bar and collars are in ``unit``; plates may be in either unit.
+    """
+    frozen = split_inventory(inventory)
+    key = ("mixed", _number(target_total), _number(bar_weight), _number(collar_weight), frozen, prefer_over, unit)
+
+    def compute() -> MixedSetup:
+        per_side_target = max(target_total - bar_weight - collar_weight, 0) / 2
+        load, _ = pack_mixed(per_side_target, inventory, unit, prefer_over)
+        per_side = load.weight(unit)
+        achieved_total = bar_weight + collar_weight + per_side * 2
+        return MixedSetup(tuple(load.plates), per_side, achieved_total, achieved_total - target_total, unit)
+
+    return SETUP_CACHE.get_or_compute(key, compute)
+
+
+def percent_table(
+    base_weight: float,
+    rounding: str = "None",
+    unit: str = "lb",
+    bar_weight: Optional[float] = None,
+    inventory: Optional[Dict[float, int]] = None
+) -> PercentTable:
+    """Percent rows for ``base_weight``, with loadings when ``bar_weight`` and ``inventory`` are given."""
+    frozen = None if inventory is None else freeze_inventory(inventory)
+    bar_key = None if bar_weight is None else _number(bar_weight)
+    key = (_number(base_weight), rounding, unit, bar_key, frozen)
+
+    def compute() -> PercentTable:
+        rows = tuple(percent_rows(base_weight, rounding, unit))
+        if bar_weight is None or frozen is None:
+            return PercentTable(rows, None)
+        loadings = loadings_for_totals([row.rounded for row in rows], bar_weight, dict(frozen))
+        return PercentTable(rows, tuple(loadings))
+
+    return PERCENT_CACHE.get_or_compute(key, compute)
@@ -1,16 +1,146 @@
 """Unit conversion and rounding utilities."""
 
+import math
+from functools import total_ordering
 from typing import Union
 
 
+@total_ordering
+class Weight:
+    """Exact weight stored as an integer count of quarter units (0.25 lb or 0.25 kg).
+
+    A Weight compares and hashes like the equal int/float, so it can stand in
+    for numeric plate keys. Arithmetic with ints or other Weights stays exact;
+    mixing in a float gives a float.
+    """
+
+    __slots__ = ("quarters",)
+
+    STEPS_PER_UNIT = 4
+
+    def __init__(self, quarters: int):
+        self.quarters = int(quarters)
+
+    @classmethod
+    def of(cls, value: Union["Weight", int, float]) -> "Weight":
+        """Snap a number to the nearest quarter unit."""
+        if isinstance(value, Weight):
+            return value
+        return cls(round(float(value) * cls.STEPS_PER_UNIT))
+
+    @classmethod
+    def steps_floor(cls, value: float) -> int:
+        """Largest quarter count not above ``value`` (tolerant of float noise)."""
+        return math.floor(float(value) * cls.STEPS_PER_UNIT + 1e-9)
+
+    @classmethod
+    def steps_ceil(cls, value: float) -> int:
+        """Smallest quarter count not below ``value`` (tolerant of float noise)."""
+        return math.ceil(float(value) * cls.STEPS_PER_UNIT - 1e-9)
+
+    def __float__(self) -> float:
+        return self.quarters / self.STEPS_PER_UNIT
+
+    def __int__(self) -> int:
+        return int(float(self))
+
+    def __round__(self, ndigits=None):
+        return round(float(self), ndigits)
+
+    def __bool__(self) -> bool:
+        return self.quarters != 0
+
+    def __hash__(self) -> int:
+        # Quarter values are exact binary fractions, so this matches hash(float)
+        return hash(float(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Weight):
+            return self.quarters == other.quarters
+        if isinstance(other, (int, float)):
+            return float(self) == other
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, Weight):
+            return self.quarters < other.quarters
+        if isinstance(other, (int, float)):
+            return float(self) < other
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, Weight):
+            return Weight(self.quarters + other.quarters)
+        if isinstance(other, int):
+            return Weight(self.quarters + other * self.STEPS_PER_UNIT)
+        if isinstance(other, float):
+            return float(self) + other
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Weight):
+            return Weight(self.quarters - other.quarters)
+        if isinstance(other, int):
+            return Weight(self.quarters - other * self.STEPS_PER_UNIT)
+        if isinstance(other, float):
+            return float(self) - other
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, int):
+            return Weight(other * self.STEPS_PER_UNIT - self.quarters)
+        if isinstance(other, float):
+            return other - float(self)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return Weight(self.quarters * other)
+        if isinstance(other, float):
+            return float(self) * other
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> float:
+        if isinstance(other, Weight):
+            return self.quarters / other.quarters
+        if isinstance(other, (int, float)):
+            return float(self) / other
+        return NotImplemented
+
+    def __neg__(self) -> "Weight":
+        return Weight(-self.quarters)
+
+    def __abs__(self) -> "Weight":
+        return Weight(abs(self.quarters))
+
+    def __str__(self) -> str:
+        if self.quarters % self.STEPS_PER_UNIT == 0:
+            return str(self.quarters // self.STEPS_PER_UNIT)
+        return repr(float(self))
+
+    def __repr__(self) -> str:
+        return f"Weight({self})"
+
+    def __format__(self, spec: str) -> str:
+        return format(float(self), spec) if spec else str(self)
+
+
+# The international pound is defined as exactly this many kilograms
+KG_PER_LB = 0.45359237
+
+
 def lb_to_kg(weight_lb: float) -> float:
     """Convert pounds to kilograms."""
-    return weight_lb * 0.453592
+    return weight_lb * KG_PER_LB
 
 
 def kg_to_lb(weight_kg: float) -> float:
     """Convert kilograms to pounds."""
-    return weight_kg / 0.453592
+    return weight_kg / KG_PER_LB
 
 
 def convert_weight(weight: float, from_unit: str, to_unit: str) -> float:
@@ -26,24 +156,32 @@ def convert_weight(weight: float, from_unit: str, to_unit: str) -> float:
         raise ValueError(f"Unsupported conversion: {from_unit} to {to_unit}")
 
 
+# Increment per rounding rule; 0 leaves the weight as is
+ROUNDING_INCREMENTS = {"None": 0, "Nearest 0.5": 0.5, "Nearest 1.0": 1}
+
+
 def round_weight(weight: float, rounding: str, unit: str = "lb") -> float:
-    """Round weight according to specified rounding rule."""
-    if rounding == "None":
-        return weight
-    elif rounding == "Nearest 0.5":
-        return round(weight * 2) / 2
-    elif rounding == "Nearest 1.0":
-        return round(weight)
-    else:
+    """Round weight according to specified rounding rule.
+
+    Halves round to the even multiple (Python's ``round``); the browser
+    percent table uses the same rule.
+    """
+    increment = ROUNDING_INCREMENTS.get(rounding, 0)
+    if not increment:
         return weight
+    return round(weight / increment) * increment
 
 
 def format_weight(weight: float, unit: str) -> str:
-    """Format weight for display."""
-    if weight == int(weight):
-        return f"{int(weight)} {unit}"
-    else:
-        return f"{weight:.1f} {unit}"
+    """Format weight for display, with up to two decimals so quarter units show in full."""
+    text = f"{float(weight):.2f}".rstrip("0").rstrip(".")
+    return f"{'0' if text == '-0' else text} {unit}"
+
+
+def format_dual_weight(weight: float, unit: str) -> str:
+    """Format weight in its unit with the other unit alongside (e.g. "100 kg (220.5 lb)")."""
+    other = "kg" if unit == "lb" else "lb"
+    return f"{format_weight(weight, unit)} ({format_weight(round(convert_weight(weight, unit, other), 1), other)})"
 
 
 def get_default_bar_weight(unit: str) -> float:
@@ -54,10 +192,7 @@ def get_default_bar_weight(unit: str) -> float:
 def get_default_plates(unit: str) -> dict:
     """Get default plate set for unit."""
     if unit == "lb":
-        return {
-            45: 2, 35: 2, 25: 2, 15: 2, 10: 2, 5: 2, 2.5: 2
-        }
+        weights = [45, 35, 25, 15, 10, 5, 2.5]
     else:  # kg
-        return {
-            25: 2, 20: 2, 15: 2, 10: 2, 5: 2, 2.5: 2, 1.25: 2
-        }
+        weights = [25, 20, 15, 10, 5, 2.5, 1.25]
+    return {Weight.of(weight): 2 for weight in weights}